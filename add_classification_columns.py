@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Add the stored classification columns to tickets and backfill them
+incident_category, kb_article and response_template are computed by
+ticket_classifier.py when a ticket is written, so exports and dashboards read
+columns instead of re-running text matching over the whole table
+"""
+
+import argparse
+import requests
+import os
+from dotenv import load_dotenv
+from ticket_classifier import CLASSIFICATION_COLUMNS, classification_columns
+
+# Load environment variables
+load_dotenv()
+
+# SQLiteCloud configuration
+API_KEY = os.getenv('SQLITECLOUD_API_KEY')
+API_URL = os.getenv('SQLITECLOUD_URL')
+
+headers = {
+    'Authorization': f'Bearer {API_KEY}',
+    'Content-Type': 'application/json'
+}
+
+# Schema changes, applied in order (ALTER TABLE fails harmlessly if the column exists)
+CLASSIFICATION_MIGRATION = [
+    "ALTER TABLE tickets ADD COLUMN incident_category TEXT",
+    "ALTER TABLE tickets ADD COLUMN kb_article TEXT",
+    "ALTER TABLE tickets ADD COLUMN response_template TEXT",
+    "CREATE INDEX IF NOT EXISTS idx_tickets_incident_category ON tickets(incident_category)",
+    "CREATE INDEX IF NOT EXISTS idx_tickets_kb_article ON tickets(kb_article)"
+]
+
+def execute_query(query):
+    """Execute a SQL query on SQLiteCloud"""
+    try:
+        payload = {"sql": query}
+        response = requests.post(API_URL, json=payload, headers=headers, timeout=30)
+
+        if response.status_code == 200:
+            result = response.json()
+            if 'data' in result:
+                return result['data']
+            return result
+        else:
+            print(f"❌ Query failed: {response.text}")
+            return None
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return None
+
+def sql_literal(value):
+    """Quote a text value for SQL"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+def build_backfill_update(values):
+    """Build one UPDATE statement setting the classification for a batch of {id: columns}"""
+    assignments = []
+    for column in CLASSIFICATION_COLUMNS:
+        cases = ' '.join(
+            f"WHEN {int(ticket_id)} THEN {sql_literal(columns[column])}"
+            for ticket_id, columns in values.items()
+        )
+        assignments.append(f"{column} = CASE id {cases} END")
+    ids = ', '.join(str(int(ticket_id)) for ticket_id in values)
+    return f'''
+        USE DATABASE 'my-database';
+        UPDATE tickets
+        SET {', '.join(assignments)}
+        WHERE id IN ({ids})
+    '''
+
+def backfill_classification(batch_size=200, reclassify=False):
+    """Classify rows missing a stored classification (or every row), one id range per request"""
+    condition = '' if reclassify else 'incident_category IS NULL AND '
+    last_id = 0
+    updated_count = 0
+
+    while True:
+        rows = execute_query(f'''
+            USE DATABASE 'my-database';
+            SELECT id, issue FROM tickets
+            WHERE {condition}id > {last_id}
+            ORDER BY id
+            LIMIT {int(batch_size)}
+        ''')
+        if not rows or not isinstance(rows, list):
+            break
+
+        values = {row['id']: classification_columns(row.get('issue')) for row in rows}
+        last_id = rows[-1]['id']
+
+        if execute_query(build_backfill_update(values)) is None:
+            print(f"❌ Failed to backfill batch ending at ticket {last_id}")
+        else:
+            updated_count += len(values)
+            print(f"✅ Classified {updated_count} tickets (up to id {last_id})")
+
+        if len(rows) < batch_size:
+            break
+
+    return updated_count
+
+def main():
+    """Add the classification columns and backfill them from the issue text"""
+    parser = argparse.ArgumentParser(description='Add and backfill the stored ticket classification columns')
+    parser.add_argument('--batch-size', type=int, default=200, help='Rows per backfill request (default: 200)')
+    parser.add_argument('--backfill-only', action='store_true', help='Skip the schema changes')
+    parser.add_argument('--reclassify', action='store_true', help='Recompute every ticket, e.g. after changing the classifier rules')
+    args = parser.parse_args()
+
+    if not API_KEY or not API_URL:
+        print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+        exit(1)
+
+    print("🏷️ Storing Ticket Classification")
+    print("================================")
+
+    if not args.backfill_only:
+        print("1. Adding classification columns and indexes...")
+        for statement in CLASSIFICATION_MIGRATION:
+            result = execute_query(f"USE DATABASE 'my-database'; {statement}")
+            if result is None and statement.startswith('ALTER'):
+                print("⚠️ Column may already exist (this is normal)")
+        print("✅ Schema updated")
+
+    print("\n2. Backfilling classification from issue text...")
+    updated_count = backfill_classification(args.batch_size, args.reclassify)
+
+    print("\n📊 Backfill Summary:")
+    print(f"   ✅ Tickets classified: {updated_count}")
+
+if __name__ == "__main__":
+    main()
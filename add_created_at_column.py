@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Add the normalized created_at column to tickets and backfill it
+created_at is an indexed INTEGER (epoch seconds) parsed from the free-form
+timestamp text, used by the app and exports for ordering and time ranges
+"""
+
+import argparse
+import requests
+import os
+from dotenv import load_dotenv
+from ticket_timestamps import parse_timestamp
+
+# Load environment variables
+load_dotenv()
+
+# SQLiteCloud configuration
+API_KEY = os.getenv('SQLITECLOUD_API_KEY')
+API_URL = os.getenv('SQLITECLOUD_URL')
+
+headers = {
+    'Authorization': f'Bearer {API_KEY}',
+    'Content-Type': 'application/json'
+}
+
+# Schema changes, applied in order (ALTER TABLE fails harmlessly if the column exists)
+CREATED_AT_MIGRATION = [
+    "ALTER TABLE tickets ADD COLUMN created_at INTEGER",
+    "CREATE INDEX IF NOT EXISTS idx_tickets_created_at ON tickets(created_at)",
+    "DROP VIEW IF EXISTS recent_tickets",
+    '''CREATE VIEW IF NOT EXISTS recent_tickets AS
+        SELECT id, timestamp, created_at, name, email, issue, status
+        FROM tickets
+        WHERE created_at >= CAST(strftime('%s', 'now', '-7 days') AS INTEGER)
+        ORDER BY created_at DESC'''
+]
+
+def execute_query(query):
+    """Execute a SQL query on SQLiteCloud"""
+    try:
+        payload = {"sql": query}
+        response = requests.post(API_URL, json=payload, headers=headers, timeout=30)
+
+        if response.status_code == 200:
+            result = response.json()
+            if 'data' in result:
+                return result['data']
+            return result
+        else:
+            print(f"❌ Query failed: {response.text}")
+            return None
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return None
+
+def build_backfill_update(values):
+    """Build one UPDATE statement setting created_at for a batch of {id: epoch}"""
+    cases = ' '.join(f"WHEN {int(ticket_id)} THEN {int(epoch)}" for ticket_id, epoch in values.items())
+    ids = ', '.join(str(int(ticket_id)) for ticket_id in values)
+    return f'''
+        USE DATABASE 'my-database';
+        UPDATE tickets
+        SET created_at = CASE id {cases} END
+        WHERE id IN ({ids})
+    '''
+
+def backfill_created_at(batch_size=500):
+    """Populate created_at for rows where it is NULL, one id range per request"""
+    last_id = 0
+    updated_count = 0
+    unparsed = []
+
+    while True:
+        rows = execute_query(f'''
+            USE DATABASE 'my-database';
+            SELECT id, timestamp FROM tickets
+            WHERE created_at IS NULL AND id > {last_id}
+            ORDER BY id
+            LIMIT {int(batch_size)}
+        ''')
+        if not rows or not isinstance(rows, list):
+            break
+
+        values = {}
+        for row in rows:
+            epoch = parse_timestamp(row.get('timestamp'))
+            if epoch is None:
+                unparsed.append(row)
+            else:
+                values[row['id']] = epoch
+        last_id = rows[-1]['id']
+
+        if values:
+            if execute_query(build_backfill_update(values)) is None:
+                print(f"❌ Failed to backfill batch ending at ticket {last_id}")
+            else:
+                updated_count += len(values)
+                print(f"✅ Backfilled {updated_count} tickets (up to id {last_id})")
+
+        if len(rows) < batch_size:
+            break
+
+    return updated_count, unparsed
+
+def main():
+    """Add created_at and backfill it from the timestamp text"""
+    parser = argparse.ArgumentParser(description='Add and backfill the tickets.created_at column')
+    parser.add_argument('--batch-size', type=int, default=500, help='Rows per backfill request (default: 500)')
+    parser.add_argument('--backfill-only', action='store_true', help='Skip the schema changes')
+    args = parser.parse_args()
+
+    if not API_KEY or not API_URL:
+        print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+        exit(1)
+
+    print("🕒 Normalizing Ticket Timestamps")
+    print("================================")
+
+    if not args.backfill_only:
+        print("1. Adding created_at column, index and view...")
+        for statement in CREATED_AT_MIGRATION:
+            result = execute_query(f"USE DATABASE 'my-database'; {statement}")
+            if result is None and statement.startswith('ALTER'):
+                print("⚠️ created_at column may already exist (this is normal)")
+        print("✅ Schema updated")
+
+    print("\n2. Backfilling created_at from timestamp...")
+    updated_count, unparsed = backfill_created_at(args.batch_size)
+
+    print("\n📊 Backfill Summary:")
+    print(f"   ✅ Tickets backfilled: {updated_count}")
+    print(f"   ⚠️ Unparseable timestamps: {len(unparsed)}")
+    for row in unparsed[:10]:
+        print(f"      - Ticket #{row['id']}: {row.get('timestamp')!r}")
+
+if __name__ == "__main__":
+    main()
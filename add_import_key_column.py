@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Add the import_key column used by idempotent imports (see ticket_upsert.py)
+import_key is the hash of a ticket's category, email and issue text, with a
+unique index so imports can upsert on it. Existing tickets are backfilled
+with ticket_upsert.import_key, the same function the imports use; tickets
+with a blank category are re-keyed on every run, since earlier versions
+hashed the blank instead of 'General'. When several tickets share a key (an
+import that was run twice) only the oldest gets it and the others are
+listed for cleanup.
+"""
+
+import requests
+import os
+from dotenv import load_dotenv
+from ticket_upsert import import_key, sql_literal
+
+# Load environment variables
+load_dotenv()
+
+# SQLiteCloud configuration
+API_KEY = os.getenv('SQLITECLOUD_API_KEY')
+API_URL = os.getenv('SQLITECLOUD_URL')
+
+headers = {
+    'Authorization': f'Bearer {API_KEY}',
+    'Content-Type': 'application/json'
+}
+
+# Schema changes, applied in order (ALTER TABLE fails harmlessly if the column exists).
+# The unique index allows any number of NULL keys (tickets submitted through the app).
+IMPORT_KEY_MIGRATION = [
+    "ALTER TABLE tickets ADD COLUMN import_key TEXT",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_tickets_import_key ON tickets(import_key)"
+]
+
+# Keys set per UPDATE statement during the backfill
+BACKFILL_BATCH = 500
+
+def execute_query(query):
+    """Execute a SQL query on SQLiteCloud"""
+    try:
+        payload = {"sql": query}
+        response = requests.post(API_URL, json=payload, headers=headers, timeout=60)
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            print(f"❌ Query failed: {response.text}")
+            return None
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return None
+
+def backfill_keys():
+    """Set import_key on tickets without one or with a blank category; returns (keys set, duplicate ids), or None on failure"""
+    result = execute_query('''
+        USE DATABASE 'my-database';
+        SELECT id, category, email, issue, import_key FROM tickets
+        WHERE import_key IS NULL OR NULLIF(TRIM(category), '') IS NULL
+        ORDER BY id
+    ''')
+    existing = execute_query('''
+        USE DATABASE 'my-database';
+        SELECT import_key FROM tickets WHERE import_key IS NOT NULL AND NULLIF(TRIM(category), '') IS NOT NULL
+    ''')
+    if not result or 'data' not in result or not existing or 'data' not in existing:
+        return None
+
+    seen = {row['import_key'] for row in existing['data']}
+    keys, duplicates = [], []
+    for row in result['data']:
+        key = import_key(row)
+        if key == row['import_key']:
+            seen.add(key)
+        elif key in seen:
+            duplicates.append(row['id'])
+        else:
+            seen.add(key)
+            keys.append((row['id'], key))
+
+    for start in range(0, len(keys), BACKFILL_BATCH):
+        batch = keys[start:start + BACKFILL_BATCH]
+        cases = ' '.join(f"WHEN {ticket_id} THEN {sql_literal(key)}" for ticket_id, key in batch)
+        result = execute_query(f'''
+            USE DATABASE 'my-database';
+            UPDATE tickets SET import_key = CASE id {cases} END
+            WHERE id IN ({', '.join(str(ticket_id) for ticket_id, _ in batch)})
+        ''')
+        if result is None:
+            print(f"❌ Backfill failed at tickets {batch[0][0]}-{batch[-1][0]} ({start} of {len(keys)} keys set)")
+            return None
+    return len(keys), duplicates
+
+def main():
+    """Add import_key, its unique index and backfill existing tickets"""
+    if not API_KEY or not API_URL:
+        print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+        exit(1)
+
+    print("🔑 Adding Import Keys")
+    print("=====================")
+
+    # The index is created after the backfill so duplicates do not block it
+    alter, index = IMPORT_KEY_MIGRATION
+    if execute_query(f"USE DATABASE 'my-database'; {alter}") is None:
+        print("⚠️ import_key column may already exist (this is normal)")
+
+    # The index is only created once every key is set; re-running resumes the backfill
+    backfilled = backfill_keys()
+    if backfilled is None:
+        print("❌ Could not backfill import_key, the unique index was not created")
+        exit(1)
+
+    if execute_query(f"USE DATABASE 'my-database'; {index}") is None:
+        print("❌ Could not create the unique index on import_key")
+        exit(1)
+
+    count, duplicates = backfilled
+    print(f"✅ import_key set on {count} tickets, unique index in place")
+    if duplicates:
+        print(f"⚠️ {len(duplicates)} tickets duplicate an earlier ticket and were left without a key: {duplicates[:20]}")
+        print("   Review them with python check_remaining_tickets.py")
+
+if __name__ == "__main__":
+    main()
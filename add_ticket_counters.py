@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Add the ticket_counters table for dashboard statistics
+ticket_counters holds one row per (dimension, value) - e.g. ('status', 'Open'),
+('agent', 'Sarah Johnson') or ('agent_status', 'Sarah Johnson<US>Open'), with
+the unit separator char(31) between the two values - plus ('total', 'all').
+Triggers keep the counts
+current inside the same transaction as every insert, update and delete, so the
+statistics views read a handful of counter rows instead of scanning tickets.
+Counts that drift (e.g. after bulk edits with triggers disabled) are rebuilt by
+reconcile_ticket_counters.py.
+"""
+
+import requests
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# SQLiteCloud configuration
+API_KEY = os.getenv('SQLITECLOUD_API_KEY')
+API_URL = os.getenv('SQLITECLOUD_URL')
+
+headers = {
+    'Authorization': f'Bearer {API_KEY}',
+    'Content-Type': 'application/json'
+}
+
+# Counted dimensions: (dimension, ticket column, value used for blank/NULL).
+# Blank values are normalized the same way as ticket_aggregates.CUBE_QUERY.
+# A dimension over several columns takes tuples of columns and defaults.
+COUNTER_DIMENSIONS = [
+    ('status', 'status', 'Open'),
+    ('priority', 'priority', 'Medium'),
+    ('agent', 'assigned_agent', 'Unassigned'),
+    ('category', 'category', 'General'),
+    ('agent_status', ('assigned_agent', 'status'), ('Unassigned', 'Open'))
+]
+
+# Ticket columns the counters depend on
+COUNTED_COLUMNS = ['status', 'priority', 'assigned_agent', 'category']
+
+def counter_value(row, column, default):
+    """SQL expression for the counted value of a ticket column (row is NEW, OLD or a table alias)"""
+    if isinstance(column, tuple):
+        return ' || char(31) || '.join(counter_value(row, c, d) for c, d in zip(column, default))
+    return f"COALESCE(NULLIF(TRIM({row}.{column}), ''), '{default}')"
+
+def _bump(dimension, value, delta):
+    """Trigger statement adding delta to one counter, creating it if needed"""
+    return f'''INSERT INTO ticket_counters (dimension, value, count) VALUES ('{dimension}', {value}, {delta})
+            ON CONFLICT(dimension, value) DO UPDATE SET count = count + ({delta});'''
+
+def _trigger_body(statements):
+    return '\n            '.join(statements)
+
+def _changed(column):
+    return f"NEW.{column} IS NOT OLD.{column}"
+
+# Recount every counter from the tickets table (one GROUP BY per dimension)
+REBUILD_COUNTERS = ["DELETE FROM ticket_counters"] + [
+    f'''INSERT INTO ticket_counters (dimension, value, count)
+        SELECT '{dimension}', {counter_value('tickets', column, default)}, COUNT(*)
+        FROM tickets
+        GROUP BY 2'''
+    for dimension, column, default in COUNTER_DIMENSIONS
+] + ["INSERT INTO ticket_counters (dimension, value, count) SELECT 'total', 'all', COUNT(*) FROM tickets"]
+
+# Schema changes, applied in order. The update trigger only touches counters
+# when a counted column changed (updated_at bumps do not count). Triggers are
+# dropped and recreated so re-running the migration picks up new dimensions.
+TICKET_COUNTERS_MIGRATION = [
+    '''CREATE TABLE IF NOT EXISTS ticket_counters (
+        dimension TEXT NOT NULL,
+        value TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (dimension, value)
+    )''',
+    # Lets agent_workload list agents busiest first without sorting
+    "CREATE INDEX IF NOT EXISTS idx_ticket_counters_count ON ticket_counters(dimension, count)",
+    "DROP TRIGGER IF EXISTS ticket_counters_insert",
+    f'''CREATE TRIGGER ticket_counters_insert
+        AFTER INSERT ON tickets
+        BEGIN
+            {_trigger_body([_bump(d, counter_value('NEW', c, default), 1) for d, c, default in COUNTER_DIMENSIONS] + [_bump('total', "'all'", 1)])}
+        END''',
+    "DROP TRIGGER IF EXISTS ticket_counters_delete",
+    f'''CREATE TRIGGER ticket_counters_delete
+        AFTER DELETE ON tickets
+        BEGIN
+            {_trigger_body([_bump(d, counter_value('OLD', c, default), -1) for d, c, default in COUNTER_DIMENSIONS] + [_bump('total', "'all'", -1)])}
+        END''',
+    "DROP TRIGGER IF EXISTS ticket_counters_update",
+    f'''CREATE TRIGGER ticket_counters_update
+        AFTER UPDATE OF {', '.join(COUNTED_COLUMNS)} ON tickets
+        WHEN {' OR '.join(_changed(c) for c in COUNTED_COLUMNS)}
+        BEGIN
+            {_trigger_body([_bump(d, counter_value('OLD', c, default), -1) for d, c, default in COUNTER_DIMENSIONS] + [_bump(d, counter_value('NEW', c, default), 1) for d, c, default in COUNTER_DIMENSIONS])}
+        END'''
+] + REBUILD_COUNTERS + [
+    # Statistics views read the counters instead of scanning tickets
+    "DROP VIEW IF EXISTS ticket_stats",
+    '''CREATE VIEW ticket_stats AS
+        SELECT c.value AS status, c.count AS count,
+               ROUND(c.count * 100.0 / NULLIF(t.count, 0), 2) AS percentage
+        FROM ticket_counters c, ticket_counters t
+        WHERE c.dimension = 'status' AND c.count > 0
+          AND t.dimension = 'total' AND t.value = 'all' ''',
+    "DROP VIEW IF EXISTS tickets_by_priority",
+    '''CREATE VIEW tickets_by_priority AS
+        SELECT c.value AS priority, c.count AS count,
+               ROUND(c.count * 100.0 / NULLIF(t.count, 0), 2) AS percentage
+        FROM ticket_counters c, ticket_counters t
+        WHERE c.dimension = 'priority' AND c.count > 0
+          AND t.dimension = 'total' AND t.value = 'all' ''',
+    "DROP VIEW IF EXISTS tickets_by_agent",
+    '''CREATE VIEW tickets_by_agent AS
+        SELECT c.value AS assigned_agent, c.count AS count,
+               ROUND(c.count * 100.0 / NULLIF(t.count, 0), 2) AS percentage
+        FROM ticket_counters c, ticket_counters t
+        WHERE c.dimension = 'agent' AND c.value != 'Unassigned' AND c.count > 0
+          AND t.dimension = 'total' AND t.value = 'all' ''',
+    "DROP VIEW IF EXISTS agent_workload",
+    '''CREATE VIEW agent_workload AS
+        SELECT a.value AS assigned_agent, a.count AS total_tickets,
+               COALESCE((SELECT s.count FROM ticket_counters s WHERE s.dimension = 'agent_status'
+                         AND s.value = a.value || char(31) || 'Open'), 0) AS open_tickets,
+               COALESCE((SELECT s.count FROM ticket_counters s WHERE s.dimension = 'agent_status'
+                         AND s.value = a.value || char(31) || 'In Progress'), 0) AS in_progress_tickets,
+               COALESCE((SELECT s.count FROM ticket_counters s WHERE s.dimension = 'agent_status'
+                         AND s.value = a.value || char(31) || 'Resolved'), 0) AS resolved_tickets
+        FROM ticket_counters a
+        WHERE a.dimension = 'agent' AND a.value != 'Unassigned' AND a.count > 0
+        ORDER BY a.count DESC'''
+]
+
+def execute_query(query):
+    """Execute a SQL query on SQLiteCloud"""
+    try:
+        payload = {"sql": query}
+        response = requests.post(API_URL, json=payload, headers=headers, timeout=30)
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            print(f"❌ Query failed: {response.text}")
+            return None
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return None
+
+def main():
+    """Create ticket_counters, install its triggers, fill it and repoint the statistics views"""
+    if not API_KEY or not API_URL:
+        print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+        exit(1)
+
+    print("🔢 Maintaining Ticket Counters")
+    print("==============================")
+
+    # Triggers and the initial count go in one request so no ticket is missed in between
+    statements = '; '.join(TICKET_COUNTERS_MIGRATION)
+    result = execute_query(f"USE DATABASE 'my-database'; BEGIN; {statements}; COMMIT;")
+    if result is None:
+        print("❌ Failed to create ticket counters")
+        exit(1)
+
+    print("✅ ticket_counters table, triggers and statistics views are in place")
+
+if __name__ == "__main__":
+    main()
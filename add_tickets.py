@@ -5,7 +5,8 @@ Script to add the requested tickets to the SQLiteCloud database
 
 import requests
 import os
-from datetime import datetime
+from ticket_timestamps import now_timestamp
+from ticket_classifier import classification_literals
 
 # Set environment variables
 os.environ['SQLITECLOUD_API_KEY'] = 'FpQNNvLCTlRGFvVlOnBuQbqNel3b0wPDs9u6jO2HsWU'
@@ -57,7 +58,7 @@ def add_tickets():
     success_count = 0
     
     for i, ticket in enumerate(tickets, 1):
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp, created_at = now_timestamp()
         
         # Escape single quotes to prevent SQL injection
         name_escaped = ticket['name'].replace("'", "''")
@@ -67,8 +68,8 @@ def add_tickets():
         insert_query = {
             'sql': f"""
             USE DATABASE 'my-database';
-            INSERT INTO tickets (timestamp, name, email, issue, notes, status)
-            VALUES ('{timestamp}', '{name_escaped}', '{email_escaped}', '{issue_escaped}', '', '{ticket["status"]}')
+            INSERT INTO tickets (timestamp, created_at, name, email, issue, notes, status, incident_category, kb_article, response_template)
+            VALUES ('{timestamp}', {created_at}, '{name_escaped}', '{email_escaped}', '{issue_escaped}', '', '{ticket["status"]}', {classification_literals(ticket["issue"])})
             """
         }
         
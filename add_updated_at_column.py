@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Add the updated_at change marker to tickets
+updated_at is an indexed INTEGER (epoch seconds, database clock) kept current by
+triggers on every insert and update, so exports can fetch only the rows that
+changed since their last run (see daily_log_incremental.py)
+"""
+
+import requests
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# SQLiteCloud configuration
+API_KEY = os.getenv('SQLITECLOUD_API_KEY')
+API_URL = os.getenv('SQLITECLOUD_URL')
+
+headers = {
+    'Authorization': f'Bearer {API_KEY}',
+    'Content-Type': 'application/json'
+}
+
+# Schema changes, applied in order (ALTER TABLE fails harmlessly if the column exists).
+# The update trigger only fires when the statement did not set updated_at itself,
+# and SQLite does not re-fire triggers from inside a trigger by default.
+UPDATED_AT_MIGRATION = [
+    "ALTER TABLE tickets ADD COLUMN updated_at INTEGER",
+    "CREATE INDEX IF NOT EXISTS idx_tickets_updated_at ON tickets(updated_at)",
+    "UPDATE tickets SET updated_at = CAST(strftime('%s', 'now') AS INTEGER) WHERE updated_at IS NULL",
+    '''CREATE TRIGGER IF NOT EXISTS tickets_updated_at_insert
+        AFTER INSERT ON tickets
+        WHEN NEW.updated_at IS NULL
+        BEGIN
+            UPDATE tickets SET updated_at = CAST(strftime('%s', 'now') AS INTEGER) WHERE id = NEW.id;
+        END''',
+    '''CREATE TRIGGER IF NOT EXISTS tickets_updated_at_update
+        AFTER UPDATE ON tickets
+        WHEN NEW.updated_at IS OLD.updated_at
+        BEGIN
+            UPDATE tickets SET updated_at = CAST(strftime('%s', 'now') AS INTEGER) WHERE id = NEW.id;
+        END'''
+]
+
+def execute_query(query):
+    """Execute a SQL query on SQLiteCloud"""
+    try:
+        payload = {"sql": query}
+        response = requests.post(API_URL, json=payload, headers=headers, timeout=30)
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            print(f"❌ Query failed: {response.text}")
+            return None
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return None
+
+def main():
+    """Add updated_at, backfill it and install the triggers that maintain it"""
+    if not API_KEY or not API_URL:
+        print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+        exit(1)
+
+    print("🕒 Tracking Ticket Changes")
+    print("==========================")
+
+    for statement in UPDATED_AT_MIGRATION:
+        result = execute_query(f"USE DATABASE 'my-database'; {statement}")
+        if result is None and statement.startswith('ALTER'):
+            print("⚠️ updated_at column may already exist (this is normal)")
+
+    print("✅ updated_at column, index and triggers are in place")
+
+if __name__ == "__main__":
+    main()
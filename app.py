@@ -3,13 +3,14 @@ import requests
 import csv
 import io
 import os
+import tempfile
 from datetime import datetime
 from dotenv import load_dotenv
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.units import inch
+from email_service_client import get_email_service_client
+from ticket_timestamps import now_timestamp
+from ticket_classifier import classification_literals
+from ticket_pdf import build_tickets_pdf
+from app_queries import INSERT_TICKET, STATS_QUERY, TICKETS_QUERY, UPDATE_TICKET
 
 # Load environment variables
 load_dotenv()
@@ -26,6 +27,16 @@ if not API_KEY or not API_URL:
 
 headers = {"Authorization": f"Bearer {API_KEY}"}
 
+# Email notifications: 'http' calls the separate email service,
+# 'inprocess' sends from a background thread of this app
+NOTIFICATION_MODE = os.getenv('NOTIFICATION_MODE', 'http').lower()
+
+if NOTIFICATION_MODE == 'inprocess':
+    import notification_worker
+
+# PDF exports larger than this (bytes) are spooled to a temporary file
+PDF_SPOOL_SIZE = int(os.getenv('PDF_SPOOL_SIZE', str(8 * 1024 * 1024)))
+
 # Database helper functions
 def execute_query(query, params=None):
     """Execute a query against SQLiteCloud API"""
@@ -60,11 +71,16 @@ def init_db():
         CREATE TABLE IF NOT EXISTS tickets (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             timestamp TEXT,
+            created_at INTEGER,
+            updated_at INTEGER,
             name TEXT,
             email TEXT,
             issue TEXT,
             notes TEXT,
-            status TEXT DEFAULT 'Open'
+            status TEXT DEFAULT 'Open',
+            incident_category TEXT,
+            kb_article TEXT,
+            response_template TEXT
         )
     '''
     result = execute_query(create_table_query)
@@ -74,7 +90,7 @@ def init_db():
 # Initialize database on startup
 init_db()
 
-def send_ticket_notification(name, email, issue, priority):
+def send_ticket_notification(name, email, issue, priority, category=None):
     """Send email notification to helpdesk team when a new ticket is submitted"""
     try:
         # Prepare ticket data for email notification
@@ -82,26 +98,27 @@ def send_ticket_notification(name, email, issue, priority):
             "name": name,
             "email": email,
             "subject": f"New Ticket - {priority} Priority",
-            "description": issue
+            "description": issue,
+            "priority": priority,
+            "category": category
         }
         
-        # Send to email notification service
-        email_service_url = "https://it-helpdesk-email.onrender.com/submit_ticket"
+        if NOTIFICATION_MODE == 'inprocess':
+            # Hand off to the in-process background sender
+            if notification_worker.enqueue_notification(ticket_data):
+                print(f"📨 Email notification queued for ticket from {name}")
+            else:
+                print("❌ Email notification not queued (queue full or invalid ticket data)")
+            return
         
-        response = requests.post(
-            email_service_url,
-            json=ticket_data,
-            headers={'Content-Type': 'application/json'},
-            timeout=10
-        )
+        # Send to email notification service (pooled connection, short timeouts, circuit breaker)
+        sent, message = get_email_service_client().submit_ticket(ticket_data)
         
-        if response.status_code == 200:
+        if sent:
             print(f"✅ Email notification sent for ticket from {name}")
         else:
-            print(f"❌ Email notification failed: {response.status_code} - {response.text}")
+            print(f"❌ Email notification failed: {message}")
             
-    except requests.exceptions.ConnectionError:
-        print("❌ Email notification service not available (port 5001)")
     except Exception as e:
         print(f"❌ Email notification error: {e}")
 
@@ -119,20 +136,20 @@ def ticket_form():
         email = request.form.get('email')
         issue = request.form.get('issue')
         priority = request.form.get('priority', 'Medium')  # Default to Medium if not specified
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        category = 'Week 2: Software & Hardware Support'
+        timestamp, created_at = now_timestamp()
         
         # Escape single quotes to prevent SQL injection
         name_escaped = name.replace("'", "''")
         email_escaped = email.replace("'", "''")
         issue_escaped = issue.replace("'", "''")
         priority_escaped = priority.replace("'", "''")
+        category_escaped = category.replace("'", "''")
         
         # Store in SQLiteCloud database
-        insert_query = f'''
-            USE DATABASE 'my-database';
-            INSERT INTO tickets (timestamp, name, email, issue, notes, status, priority, assigned_agent, category)
-            VALUES ('{timestamp}', '{name_escaped}', '{email_escaped}', '{issue_escaped}', '', 'Open', '{priority_escaped}', '', 'Week 2: Software & Hardware Support')
-        '''
+        insert_query = INSERT_TICKET.format(timestamp=timestamp, created_at=created_at, name=name_escaped,
+                                            email=email_escaped, issue=issue_escaped, priority=priority_escaped,
+                                            category=category_escaped, classification=classification_literals(issue))
         
         result = execute_query(insert_query)
         if result is None:
@@ -140,7 +157,7 @@ def ticket_form():
         
         # Send email notification to helpdesk team
         try:
-            send_ticket_notification(name, email, issue, priority)
+            send_ticket_notification(name, email, issue, priority, category)
         except Exception as e:
             print(f"Email notification failed: {e}")
             # Don't fail the ticket submission if email fails
@@ -152,8 +169,7 @@ def ticket_form():
 @app.route('/agent')
 def agent_page():
     """Agent page showing all tickets"""
-    select_query = 'SELECT * FROM tickets ORDER BY timestamp DESC'
-    result = execute_query(select_query)
+    result = execute_query(TICKETS_QUERY)
     
     if result is None:
         return render_template('agent_page.html', tickets=[], error="Failed to load tickets. Please try again.")
@@ -193,12 +209,8 @@ def update_ticket(ticket_id):
     priority_escaped = priority.replace("'", "''")
     assigned_agent_escaped = assigned_agent.replace("'", "''")
     
-    update_query = f'''
-        USE DATABASE 'my-database';
-        UPDATE tickets 
-        SET notes = '{notes_escaped}', status = '{status}', priority = '{priority_escaped}', assigned_agent = '{assigned_agent_escaped}'
-        WHERE id = {ticket_id}
-    '''
+    update_query = UPDATE_TICKET.format(notes=notes_escaped, status=status, priority=priority_escaped,
+                                        assigned_agent=assigned_agent_escaped, ticket_id=ticket_id)
     
     result = execute_query(update_query)
     if result is None:
@@ -209,8 +221,7 @@ def update_ticket(ticket_id):
 @app.route('/export_csv')
 def export_csv():
     """Export all tickets as CSV file"""
-    select_query = 'SELECT * FROM tickets ORDER BY timestamp DESC'
-    result = execute_query(select_query)
+    result = execute_query(TICKETS_QUERY)
     
     if result is None:
         return "Failed to export tickets. Please try again.", 500
@@ -260,99 +271,39 @@ def export_csv():
 @app.route('/export_pdf')
 def export_pdf():
     """Export all tickets as PDF file"""
-    select_query = 'SELECT * FROM tickets ORDER BY timestamp DESC'
-    result = execute_query(select_query)
+    result = execute_query(TICKETS_QUERY)
     
     if result is None:
         return "Failed to export tickets. Please try again.", 500
     
-    # Extract data from SQLiteCloud response and convert to tuple format
-    raw_tickets = result.get('data', [])
-    tickets = []
-    
-    for ticket in raw_tickets:
-        ticket_tuple = (
-            ticket.get('id', ''),
-            ticket.get('timestamp', ''),
-            ticket.get('name', ''),
-            ticket.get('email', ''),
-            ticket.get('issue', ''),
-            ticket.get('notes', ''),
-            ticket.get('status', 'Open'),
-            ticket.get('priority', 'Medium'),
-            ticket.get('assigned_agent', '')
-        )
-        tickets.append(ticket_tuple)
-    
-    # Create PDF in memory
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
-    
-    # Get styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceAfter=30,
-        alignment=1  # Center alignment
-    )
-    
-    # Create content
-    story = []
-    
-    # Title
-    title = Paragraph("IT Helpdesk Tickets Report", title_style)
-    story.append(title)
-    story.append(Spacer(1, 20))
-    
-    # Create table data
-    table_data = [['ID', 'Timestamp', 'Name', 'Email', 'Issue', 'Notes', 'Status', 'Priority', 'Agent']]
-    
-    for ticket in tickets:
-        # Truncate long text for better display
-        issue_text = ticket[4][:40] + '...' if len(ticket[4]) > 40 else ticket[4]
-        notes_text = ticket[5][:25] + '...' if len(ticket[5]) > 25 else ticket[5]
-        
-        table_data.append([
-            str(ticket[0]),
-            ticket[1],
-            ticket[2],
-            ticket[3],
-            issue_text,
-            notes_text,
-            ticket[6],
-            ticket[7],
-            ticket[8] if ticket[8] else 'Unassigned'
-        ])
-    
-    # Create table
-    table = Table(table_data, colWidths=[0.4*inch, 1*inch, 0.8*inch, 1.2*inch, 1.5*inch, 1.2*inch, 0.6*inch, 0.6*inch, 0.8*inch])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    
-    story.append(table)
-    
-    # Build PDF
-    doc.build(story)
-    buffer.seek(0)
+    # Render into a spooled file (moves to disk past PDF_SPOOL_SIZE) and stream it in blocks
+    output = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_SIZE)
+    build_tickets_pdf(result.get('data', []), output)
+    output.seek(0)
     
     return send_file(
-        buffer,
+        output,
         mimetype='application/pdf',
         as_attachment=True,
         download_name=f'tickets_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
     )
 
+@app.route('/stats')
+def ticket_stats():
+    """Dashboard statistics read from the maintained ticket_counters table"""
+    result = execute_query(STATS_QUERY)
+    
+    if result is None:
+        return jsonify({'error': 'Failed to load statistics'}), 500
+    
+    stats = {'total': 0, 'status': {}, 'priority': {}, 'agent': {}, 'category': {}}
+    for row in result.get('data', []):
+        if row['dimension'] == 'total':
+            stats['total'] = row['count']
+        elif row['dimension'] in stats:
+            stats[row['dimension']][row['value']] = row['count']
+    
+    return jsonify(stats)
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
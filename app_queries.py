@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+SQL statements issued by the helpdesk app (app.py)
+They are kept here so check_database.py can show their query plans and
+test_query_plans.py can check that the hot ones keep using indexes.
+"""
+
+import re
+
+# Agent page, CSV and PDF exports (served by idx_tickets_created_at)
+TICKETS_QUERY = 'SELECT * FROM tickets ORDER BY created_at DESC, id DESC'
+
+# Ticket submission (values escaped by the caller)
+INSERT_TICKET = '''
+    INSERT INTO tickets (timestamp, created_at, name, email, issue, notes, status, priority, assigned_agent, category, incident_category, kb_article, response_template)
+    VALUES ('{timestamp}', {created_at}, '{name}', '{email}', '{issue}', '', 'Open', '{priority}', '', '{category}', {classification})
+'''
+
+# Agent updates (values escaped by the caller)
+UPDATE_TICKET = '''
+    UPDATE tickets
+    SET notes = '{notes}', status = '{status}', priority = '{priority}', assigned_agent = '{assigned_agent}'
+    WHERE id = {ticket_id}
+'''
+
+# /stats (reads the trigger-maintained counters, see add_ticket_counters.py)
+STATS_QUERY = 'SELECT dimension, value, count FROM ticket_counters WHERE count > 0'
+
+# Every statement above with sample values, plus the statistics views
+APP_QUERIES = {
+    'agent_page / export_csv / export_pdf': TICKETS_QUERY,
+    'ticket_form': INSERT_TICKET.format(timestamp='2025-01-01 09:00:00', created_at=1735722000, name='Name',
+                                        email='name@company.com', issue='Issue', priority='Medium',
+                                        category='General', classification="'General Support', 'KB_General_Support', 'general'"),
+    'update_ticket': UPDATE_TICKET.format(notes='', status='Open', priority='Medium', assigned_agent='', ticket_id=1),
+    'stats': STATS_QUERY,
+    'ticket_stats view': 'SELECT * FROM ticket_stats',
+    'tickets_by_priority view': 'SELECT * FROM tickets_by_priority',
+    'tickets_by_agent view': 'SELECT * FROM tickets_by_agent',
+    'agent_workload view': 'SELECT * FROM agent_workload'
+}
+
+# Tables each statement reads in full on purpose (the agent page lists every ticket)
+WHOLE_TABLE_READS = {
+    'agent_page / export_csv / export_pdf': {'tickets'}
+}
+
+# Tables small enough by design to be read in full (one row per counted value)
+SMALL_TABLES = {'ticket_counters'}
+
+_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?(?: USING (?:COVERING )?INDEX \w+)?$')
+_SUBQUERY = re.compile(r'^(?:CO-ROUTINE|MATERIALIZE) (\w+)$')
+
+def plan_problems(plan, whole_table=()):
+    """Plan steps that read a large table in full or sort in a temporary B-tree
+
+    plan is the rows of EXPLAIN QUERY PLAN (dicts with a 'detail' column).
+    SEARCH steps are fine. A SCAN, also through an index, is reported unless
+    it reads a table in SMALL_TABLES or in whole_table (tables the statement
+    reads in full on purpose, see WHOLE_TABLE_READS), or the rows of a view
+    or subquery, whose own steps are checked separately.
+    """
+    allowed = SMALL_TABLES | set(whole_table)
+    problems = []
+    for row in plan:
+        detail = str(row.get('detail', '')).strip()
+        subquery = _SUBQUERY.match(detail)
+        scan = _SCAN.match(detail)
+        if subquery:
+            allowed.add(subquery.group(1))
+        elif scan and scan.group(1) not in allowed:
+            problems.append(detail)
+        elif detail.startswith('USE TEMP B-TREE'):
+            problems.append(detail)
+    return problems
@@ -1,11 +1,23 @@
 #!/usr/bin/env python3
 """
 Check database status and troubleshoot import issues
+Measures the connection step by step (DNS lookup, TCP connect, TLS handshake,
+first and repeated query round-trips), then reports the tickets table's
+columns, row count, size and indexes and the query plans of the app's
+statements (app_queries.py). Only metadata, counts and plans are fetched,
+never the ticket rows themselves.
 """
 
-import requests
+import argparse
 import os
+import socket
+import ssl
+import time
+from urllib.parse import urlparse
+
+import requests
 from dotenv import load_dotenv
+from app_queries import APP_QUERIES, WHOLE_TABLE_READS, plan_problems
 
 # Load environment variables
 load_dotenv()
@@ -14,81 +26,175 @@ load_dotenv()
 API_KEY = os.getenv('SQLITECLOUD_API_KEY')
 API_URL = os.getenv('SQLITECLOUD_URL')
 
-if not API_KEY or not API_URL:
-    print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
-    exit(1)
-
 headers = {
     'Authorization': f'Bearer {API_KEY}',
     'Content-Type': 'application/json'
 }
 
-def execute_query(query, params=None):
-    """Execute a SQL query on SQLiteCloud"""
+# Kept-alive session, so repeated queries show the round-trip without connection setup
+session = requests.Session()
+session.headers.update(headers)
+
+def execute_query(query, quiet=False):
+    """Execute a SQL query on SQLiteCloud; returns (rows or None, seconds)"""
+    started = time.perf_counter()
     try:
-        payload = {"sql": query}
-        response = requests.post(API_URL, json=payload, headers=headers, timeout=30)
-        
-        print(f"🔍 Query: {query}")
-        print(f"📡 Response Status: {response.status_code}")
-        print(f"📄 Response: {response.text}")
-        
+        response = session.post(API_URL, json={"sql": query}, timeout=30)
+        elapsed = time.perf_counter() - started
+
         if response.status_code == 200:
             result = response.json()
-            return result
+            return result.get('data', result) if isinstance(result, dict) else result, elapsed
         else:
-            print(f"❌ Query failed with status code: {response.status_code}")
-            return None
+            if not quiet:
+                print(f"   ❌ Query failed ({response.status_code}): {response.text[:200]}")
+            return None, elapsed
     except Exception as e:
-        print(f"❌ Error executing query: {e}")
-        return None
+        print(f"   ❌ Error executing query: {e}")
+        return None, time.perf_counter() - started
 
-def main():
-    """Main function"""
-    print("🔍 Database Status Check")
-    print("========================")
-    
-    # Test basic connection
-    print("1. Testing basic connection...")
-    test_query = "SELECT 1 as test"
-    result = execute_query(test_query)
-    
-    # Check if database exists
-    print("\n2. Checking database...")
-    db_query = "USE DATABASE 'my-database'"
-    result = execute_query(db_query)
-    
-    # Check if table exists
-    print("\n3. Checking if tickets table exists...")
-    table_query = '''
+def _ms(seconds):
+    return f"{seconds * 1000:.0f} ms"
+
+def measure_connection(url):
+    """Time DNS, TCP connect and TLS handshake separately; returns {step: seconds}"""
+    parsed = urlparse(url)
+    port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+    timings = {}
+
+    started = time.perf_counter()
+    address = socket.getaddrinfo(parsed.hostname, port, type=socket.SOCK_STREAM)[0][4]
+    timings['DNS lookup'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    sock = socket.create_connection(address[:2], timeout=10)
+    timings['TCP connect'] = time.perf_counter() - started
+
+    try:
+        if parsed.scheme == 'https':
+            started = time.perf_counter()
+            context = ssl.create_default_context()
+            sock = context.wrap_socket(sock, server_hostname=parsed.hostname)
+            timings['TLS handshake'] = time.perf_counter() - started
+    finally:
+        sock.close()
+    return timings
+
+def check_latency(repeats):
+    """Print connection setup and query round-trip timings; returns False if the API is unreachable"""
+    print("1. Connection timing...")
+    try:
+        for step, seconds in measure_connection(API_URL).items():
+            print(f"   ⏱️ {step}: {_ms(seconds)}")
+    except Exception as e:
+        print(f"   ❌ Cannot reach {urlparse(API_URL).hostname}: {e}")
+        return False
+
+    rows, first = execute_query("USE DATABASE 'my-database'; SELECT 1 AS test")
+    if rows is None:
+        return False
+    print(f"   ⏱️ First query (includes connection setup): {_ms(first)}")
+
+    round_trips = sorted(execute_query("USE DATABASE 'my-database'; SELECT 1 AS test")[1] for _ in range(repeats))
+    print(f"   ⏱️ Query round-trip over {repeats} requests: min {_ms(round_trips[0])}, "
+          f"median {_ms(round_trips[len(round_trips) // 2])}, max {_ms(round_trips[-1])}")
+    return True
+
+def check_table():
+    """Print the tickets table's columns, row count and size; returns False if it is missing"""
+    print("\n2. Tickets table...")
+    rows, _ = execute_query('''
         USE DATABASE 'my-database';
-        SELECT name FROM sqlite_master WHERE type='table' AND name='tickets'
-    '''
-    result = execute_query(table_query)
-    
-    # Check table structure
-    print("\n4. Checking table structure...")
-    structure_query = '''
+        SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'tickets'
+    ''')
+    if not rows:
+        print("   ❌ tickets table not found")
+        return False
+
+    columns, _ = execute_query("USE DATABASE 'my-database'; PRAGMA table_info(tickets)")
+    if columns:
+        print(f"   📋 Columns: {', '.join(column['name'] for column in columns)}")
+
+    count, seconds = execute_query("USE DATABASE 'my-database'; SELECT COUNT(*) AS total FROM tickets")
+    if count:
+        print(f"   📊 Tickets: {count[0]['total']} (counted in {_ms(seconds)})")
+
+    size, _ = execute_query('''
         USE DATABASE 'my-database';
-        PRAGMA table_info(tickets)
-    '''
-    result = execute_query(structure_query)
-    
-    # Count tickets
-    print("\n5. Counting tickets...")
-    count_query = '''
+        SELECT page_count * page_size AS bytes FROM pragma_page_count(), pragma_page_size()
+    ''')
+    if size:
+        print(f"   💾 Database size: {size[0]['bytes'] / (1024 * 1024):.2f} MB")
+
+    # dbstat is optional in SQLite builds
+    table_size, _ = execute_query('''
         USE DATABASE 'my-database';
-        SELECT COUNT(*) as total FROM tickets
-    '''
-    result = execute_query(count_query)
-    
-    # Show all tickets
-    print("\n6. Showing all tickets...")
-    all_tickets_query = '''
+        SELECT SUM(pgsize) AS bytes FROM dbstat WHERE name = 'tickets'
+    ''', quiet=True)
+    if table_size and table_size[0].get('bytes') is not None:
+        print(f"   💾 tickets table: {table_size[0]['bytes'] / (1024 * 1024):.2f} MB")
+    return True
+
+def check_indexes():
+    """Print the indexes of the tickets table (PRAGMA index_list with their columns)"""
+    print("\n3. Indexes on tickets...")
+    rows, _ = execute_query('''
         USE DATABASE 'my-database';
-        SELECT * FROM tickets
-    '''
-    result = execute_query(all_tickets_query)
+        SELECT il.name AS name, il."unique" AS is_unique, il.partial AS partial, group_concat(ii.name, ', ') AS columns
+        FROM pragma_index_list('tickets') AS il, pragma_index_info(il.name) AS ii
+        GROUP BY il.name
+        ORDER BY il.name
+    ''')
+    if rows is None:
+        return
+    if not rows:
+        print("   ⚠️ No indexes (every filter and sort scans the table)")
+    for row in rows:
+        flags = ' (unique)' if row['is_unique'] else ''
+        flags += ' (partial)' if row['partial'] else ''
+        print(f"   🔎 {row['name']}: {row['columns']}{flags}")
+
+def check_query_plans():
+    """Print EXPLAIN QUERY PLAN of each app statement; returns the number of statements with full scans"""
+    print("\n4. Query plans of the app's statements...")
+    slow = 0
+    for name, query in APP_QUERIES.items():
+        plan, _ = execute_query(f"USE DATABASE 'my-database'; EXPLAIN QUERY PLAN {query}")
+        if plan is None:
+            continue
+        problems = plan_problems(plan, WHOLE_TABLE_READS.get(name, ()))
+        print(f"   {'⚠️' if problems else '✅'} {name}")
+        for row in plan:
+            print(f"      - {row.get('detail')}")
+        slow += bool(problems)
+    return slow
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Diagnose the SQLiteCloud connection and the tickets table')
+    parser.add_argument('--repeat', type=int, default=5, help='Query round-trips to time (default 5)')
+    args = parser.parse_args()
+
+    if not API_KEY or not API_URL:
+        print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+        exit(1)
+
+    print("🔍 Database Status Check")
+    print("========================")
+
+    if not check_latency(max(1, args.repeat)):
+        print("\n❌ Cannot query SQLiteCloud. Please check your credentials and URL.")
+        exit(1)
+    if not check_table():
+        exit(1)
+    check_indexes()
+    slow = check_query_plans()
+
+    print()
+    if slow:
+        print(f"⚠️ {slow} app statements scan the tickets table or sort without an index")
+        exit(1)
+    print("✅ Database is reachable and the app's queries use indexes")
 
 if __name__ == "__main__":
     main()
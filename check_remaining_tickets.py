@@ -3,9 +3,11 @@
 Check remaining unresolved tickets and resolve them
 """
 
+import argparse
 import requests
 import os
 from dotenv import load_dotenv
+from ticket_snapshot import add_snapshot_argument, snapshot_executor
 
 # Load environment variables
 load_dotenv()
@@ -38,6 +40,15 @@ def execute_query(query):
         return None
 
 def main():
+    global execute_query
+    parser = argparse.ArgumentParser(description='Check remaining unresolved tickets and resolve them')
+    add_snapshot_argument(parser)
+    args = parser.parse_args()
+    
+    # Read from the local snapshot instead of SQLiteCloud
+    if args.snapshot:
+        execute_query = snapshot_executor(args.snapshot)
+    
     print("🔍 Checking remaining unresolved tickets...")
     
     # Get all tickets with their status
@@ -75,6 +86,11 @@ def main():
                 print(f"      Assigned: {ticket['assigned_agent'] or 'Unassigned'}")
                 print()
             
+            # The snapshot is read-only: report only
+            if args.snapshot:
+                print("ℹ️ Reading from a snapshot, tickets were not resolved")
+                return
+            
             # Resolve the remaining tickets
             print("🚀 Resolving remaining tickets...")
             for ticket in unresolved:
@@ -1,648 +1,19 @@
 #!/usr/bin/env python3
 """
 Create Enhanced Week 1 Knowledge Base as DOCX for editing
+The content lives in kb_content/week1_enhanced.json and is rendered by knowledge_base.py.
 """
 
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.shared import OxmlElement, qn
-from docx.oxml.ns import nsdecls
-from docx.oxml import parse_xml
-from datetime import datetime
 import os
+from knowledge_base import render
 
 def create_enhanced_knowledge_base_docx():
     """Create Enhanced Week 1 Knowledge Base DOCX file"""
-    
-    # Get current date for filename
-    current_date = datetime.now().strftime("%Y%m%d")
-    filename = f"Week1_Enhanced_Knowledge_Base_{current_date}.docx"
-    
-    print(f"📚 Creating Enhanced Week 1 Knowledge Base DOCX: {filename}")
-    
-    # Create document
-    doc = Document()
-    
-    # Set document margins
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Inches(1)
-        section.bottom_margin = Inches(1)
-        section.left_margin = Inches(1)
-        section.right_margin = Inches(1)
-    
-    # Title page
-    title = doc.add_heading('IT Helpdesk Knowledge Base', 0)
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    subtitle = doc.add_heading('Week 1 Analysis, Procedures & Reflections', level=1)
-    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    doc.add_paragraph()
-    doc.add_paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}")
-    doc.add_paragraph("Enhanced with Reflection Notes and Lessons Learned")
-    
-    # Add page break
-    doc.add_page_break()
-    
-    # Table of Contents
-    toc_heading = doc.add_heading('Table of Contents', level=1)
-    toc_items = [
-        "1. Executive Summary",
-        "2. Incident Patterns Analysis with Reflections", 
-        "3. Solution Playbook with Lessons Learned",
-        "4. Agent Performance Analysis with Insights",
-        "5. Common Issues & Solutions with Reflections",
-        "6. Escalation Procedures with Learnings",
-        "7. Week 1 Performance Summary with Analysis",
-        "8. Reflection Notes & Lessons Learned",
-        "9. Recommendations & Next Steps",
-        "10. Continuous Improvement Plan"
-    ]
-    
-    for item in toc_items:
-        doc.add_paragraph(f"• {item}", style='List Bullet')
-    
-    doc.add_page_break()
-    
-    # 1. Executive Summary
-    doc.add_heading('1. Executive Summary', level=1)
-    
-    exec_summary = doc.add_paragraph()
-    exec_summary.add_run(
-        "Week 1 of the IT Helpdesk operation demonstrated exceptional performance with a 100% resolution rate. "
-        "All 13 tickets were resolved within the same business day, with no escalations required. "
-        "The team successfully handled various incident types, with password-related issues being the most common. "
-        "This enhanced knowledge base captures the patterns, procedures, best practices, and critical reflections "
-        "established during the first week."
-    )
-    
-    doc.add_heading('Key Achievements:', level=2)
-    achievements = [
-        "100% ticket resolution rate achieved",
-        "All tickets resolved same day",
-        "Zero escalations required",
-        "6 knowledge base articles created",
-        "5 prevention strategies identified",
-        "Perfect agent performance across all team members"
-    ]
-    
-    for achievement in achievements:
-        doc.add_paragraph(f"✓ {achievement}", style='List Bullet')
-    
-    doc.add_heading('Executive Reflection:', level=2)
-    exec_reflection = doc.add_paragraph()
-    exec_reflection.add_run(
-        "The first week exceeded expectations in terms of resolution efficiency and team coordination. "
-        "The standardized procedures proved effective, and the team's ability to maintain 100% resolution "
-        "rate while handling diverse scenarios demonstrates strong foundational processes. However, the "
-        "high frequency of password-related issues (54% of tickets) indicates a need for proactive user "
-        "education and system improvements."
-    )
-    
-    doc.add_page_break()
-    
-    # 2. Incident Patterns Analysis with Reflections
-    doc.add_heading('2. Incident Patterns Analysis with Reflections', level=1)
-    
-    # Create incident patterns table
-    table = doc.add_table(rows=1, cols=5)
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    table.style = 'Table Grid'
-    
-    # Header row
-    hdr_cells = table.rows[0].cells
-    hdr_cells[0].text = 'Incident Type'
-    hdr_cells[1].text = 'Frequency'
-    hdr_cells[2].text = 'Priority'
-    hdr_cells[3].text = 'Resolution Time'
-    hdr_cells[4].text = 'Key Reflection'
-    
-    # Data rows
-    incident_data = [
-        ['Password Reset Requests', '4 tickets', 'Medium', 'Same Day', 'Most common issue - need proactive prevention'],
-        ['Account Lockouts', '3 tickets', 'Medium', 'Same Day', 'User education on correct password entry needed'],
-        ['Recurring Lockouts', '1 ticket', 'Medium', 'Same Day', 'Complex issue requiring systematic approach'],
-        ['Account Disabled', '2 tickets', 'Medium', 'Same Day', 'Process review needed for disablement policies'],
-        ['Outlook Authentication', '1 ticket', 'Low', 'Same Day', 'Credential cache management critical'],
-        ['MFA Device Issues', '1 ticket', 'High', 'Same Day', 'High priority due to security implications'],
-        ['Password Expiration', '1 ticket', 'Medium', 'Same Day', 'Proactive notifications would prevent this'],
-        ['Temporary Access', '1 ticket', 'Low', 'Same Day', 'Standardized contractor process working well'],
-        ['Security Incidents', '1 ticket', 'High', 'Same Day', 'Immediate response protocols effective']
-    ]
-    
-    for row_data in incident_data:
-        row_cells = table.add_row().cells
-        for i, cell_data in enumerate(row_data):
-            row_cells[i].text = cell_data
-    
-    # Set column widths
-    table.columns[0].width = Inches(2.2)
-    table.columns[1].width = Inches(0.9)
-    table.columns[2].width = Inches(0.8)
-    table.columns[3].width = Inches(0.9)
-    table.columns[4].width = Inches(2.2)
-    
-    doc.add_paragraph()
-    
-    doc.add_heading('Pattern Analysis Reflections:', level=2)
-    reflections = [
-        "Password-related issues dominate (54% of tickets) - indicates systemic need for user education",
-        "All incidents resolved same day - demonstrates effective response protocols",
-        "No escalations required - team competency and process effectiveness confirmed",
-        "High-priority security incidents handled immediately - security protocols working",
-        "Recurring lockout issue required complex resolution - good learning opportunity",
-        "Temporary access process streamlined - contractor onboarding working efficiently"
-    ]
-    
-    for reflection in reflections:
-        doc.add_paragraph(f"• {reflection}", style='List Bullet')
-    
-    doc.add_page_break()
-    
-    # 3. Solution Playbook with Lessons Learned
-    doc.add_heading('3. Solution Playbook with Lessons Learned', level=1)
-    
-    playbook_intro = doc.add_paragraph()
-    playbook_intro.add_run(
-        "Standardized procedures for resolving common IT helpdesk issues, enhanced with lessons learned "
-        "from Week 1 implementation. Each procedure includes reflection notes on effectiveness and areas for improvement."
-    )
-    
-    # Password Reset Procedure
-    doc.add_heading('3.1 Password Reset Procedure', level=2)
-    password_steps = [
-        "Verify user identity through company app/phone system",
-        "Access Active Directory Users and Computers (ADUC)",
-        "Locate user account: @username",
-        "Reset password using 'Reset Password' function",
-        "Set temporary password with complexity requirements"
-    ]
-    
-    for i, step in enumerate(password_steps, 1):
-        doc.add_paragraph(f"{i}. {step}")
-    
-    doc.add_paragraph("KB Article: KB_Password_Reset")
-    
-    doc.add_heading('Lessons Learned:', level=3)
-    lessons = doc.add_paragraph()
-    lessons.add_run(
-        "Identity verification through company app/phone system proved highly effective and secure. "
-        "Users appreciated the callback verification process. The temporary password approach worked well, "
-        "but we should consider implementing self-service password reset to reduce ticket volume. "
-        "Documentation updates were crucial for maintaining consistency across agents."
-    )
-    
-    # Account Unlock Procedure
-    doc.add_heading('3.2 Account Unlock Procedure', level=2)
-    unlock_steps = [
-        "Check Active Directory for account lockout status",
-        "Verify lockout was due to failed login attempts",
-        "Use ADUC to unlock user account",
-        "Reset failed login counter to zero",
-        "Verify account is now accessible"
-    ]
-    
-    for i, step in enumerate(unlock_steps, 1):
-        doc.add_paragraph(f"{i}. {step}")
-    
-    doc.add_paragraph("KB Article: KB_Password_Reset")
-    
-    doc.add_heading('Lessons Learned:', level=3)
-    unlock_lessons = doc.add_paragraph()
-    unlock_lessons.add_run(
-        "Quick unlock procedures were highly effective. Users were relieved to regain access immediately. "
-        "The failed login counter reset was crucial for preventing immediate re-lockout. We should implement "
-        "automated monitoring for repeated lockout patterns to identify potential security issues early."
-    )
-    
-    # Recurring Lockout Procedure
-    doc.add_heading('3.3 Recurring Lockout Resolution', level=2)
-    recurring_steps = [
-        "Analyze lockout source using LockoutStatus.exe tool",
-        "Identify multiple lockout sources across domain controllers",
-        "Check for cached credentials on user devices",
-        "Clear all cached credentials from devices",
-        "Reset user password to clear cached bad passwords"
-    ]
-    
-    for i, step in enumerate(recurring_steps, 1):
-        doc.add_paragraph(f"{i}. {step}")
-    
-    doc.add_paragraph("KB Article: KB_Password_Reset")
-    
-    doc.add_heading('Lessons Learned:', level=3)
-    recurring_lessons = doc.add_paragraph()
-    recurring_lessons.add_run(
-        "This was the most complex issue encountered. The LockoutStatus.exe tool was invaluable for diagnosis. "
-        "The systematic approach of clearing credentials from all devices was time-consuming but necessary. "
-        "This case highlighted the importance of comprehensive credential management and the need for better "
-        "user education about password synchronization across devices."
-    )
-    
-    doc.add_page_break()
-    
-    # 4. Agent Performance Analysis with Insights
-    doc.add_heading('4. Agent Performance Analysis with Insights', level=1)
-    
-    # Create agent performance table
-    agent_table = doc.add_table(rows=1, cols=7)
-    agent_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    agent_table.style = 'Table Grid'
-    
-    # Header row
-    agent_hdr_cells = agent_table.rows[0].cells
-    agent_hdr_cells[0].text = 'Agent Name'
-    agent_hdr_cells[1].text = 'Total Tickets'
-    agent_hdr_cells[2].text = 'High Priority'
-    agent_hdr_cells[3].text = 'Medium Priority'
-    agent_hdr_cells[4].text = 'Low Priority'
-    agent_hdr_cells[5].text = 'Resolution Rate'
-    agent_hdr_cells[6].text = 'Key Insights'
-    
-    # Data rows
-    agent_data = [
-        ['Azola Xabadiya', '4 tickets', '1', '3', '0', '100%', 'Excellent with security incidents and account management'],
-        ['Keawin Koesnel', '6 tickets', '1', '4', '1', '100%', 'Versatile, handles diverse issues effectively'],
-        ['System Admin', '3 tickets', '0', '3', '0', '100%', 'Specialized in standard password/account issues']
-    ]
-    
-    for row_data in agent_data:
-        row_cells = agent_table.add_row().cells
-        for i, cell_data in enumerate(row_data):
-            row_cells[i].text = cell_data
-    
-    # Set column widths
-    agent_table.columns[0].width = Inches(1.3)
-    agent_table.columns[1].width = Inches(0.8)
-    agent_table.columns[2].width = Inches(0.7)
-    agent_table.columns[3].width = Inches(0.7)
-    agent_table.columns[4].width = Inches(0.7)
-    agent_table.columns[5].width = Inches(0.8)
-    agent_table.columns[6].width = Inches(1.8)
-    
-    doc.add_paragraph()
-    
-    doc.add_heading('Performance Insights:', level=2)
-    insights = [
-        "All agents achieved 100% resolution rate - demonstrates effective training and procedures",
-        "Keawin Koesnel handled the most tickets (6) - shows versatility and efficiency",
-        "Azola Xabadiya excelled with high-priority security incidents - strong technical skills",
-        "System Admin focused on standard issues - good specialization and consistency",
-        "No performance issues identified - team is well-prepared and competent",
-        "Cross-training opportunities identified for knowledge sharing"
-    ]
-    
-    for insight in insights:
-        doc.add_paragraph(f"• {insight}", style='List Bullet')
-    
-    doc.add_heading('Team Reflection:', level=2)
-    team_reflection = doc.add_paragraph()
-    team_reflection.add_run(
-        "The team's performance exceeded expectations. The 100% resolution rate across all agents demonstrates "
-        "excellent training, clear procedures, and strong technical competency. The distribution of tickets "
-        "shows good workload balance and specialization. The team's ability to handle diverse scenarios "
-        "without escalations indicates strong problem-solving skills and effective knowledge sharing."
-    )
-    
-    doc.add_page_break()
-    
-    # 5. Common Issues & Solutions with Reflections
-    doc.add_heading('5. Common Issues & Solutions with Reflections', level=1)
-    
-    issues_with_reflections = [
-        {
-            "issue": "User forgot password",
-            "symptoms": "Cannot log in, password not working",
-            "solution": "Reset password via ADUC, provide temporary password",
-            "prevention": "Send password expiration reminders",
-            "reflection": "Most common issue. Users often forget passwords after holidays or breaks. Proactive reminders would significantly reduce ticket volume."
-        },
-        {
-            "issue": "Account locked after failed attempts",
-            "symptoms": "Account locked message, cannot access systems",
-            "solution": "Unlock account in ADUC, reset failed login counter",
-            "prevention": "Educate users on correct password entry",
-            "reflection": "Usually caused by typos or caps lock. User education on proper password entry techniques would help prevent this."
-        },
-        {
-            "issue": "Recurring account lockouts",
-            "symptoms": "Account locks repeatedly even with correct password",
-            "solution": "Clear cached credentials from all devices",
-            "prevention": "Regular credential cache maintenance",
-            "reflection": "Most complex issue encountered. Requires systematic approach and good diagnostic tools. Users need better understanding of credential synchronization."
-        },
-        {
-            "issue": "Account disabled unexpectedly",
-            "symptoms": "Login denied, account may be disabled",
-            "solution": "Re-enable account if authorized, document reason",
-            "prevention": "Review account disablement policies",
-            "reflection": "Often caused by policy changes or administrative errors. Better communication about account status changes needed."
-        },
-        {
-            "issue": "Outlook authentication prompts",
-            "symptoms": "Outlook keeps asking for password",
-            "solution": "Clear credential cache, reset Office 365 password",
-            "prevention": "Regular Office 365 credential refresh",
-            "reflection": "Credential cache issues are common with Office 365. Regular maintenance and user education on credential management would help."
-        }
-    ]
-    
-    for i, issue in enumerate(issues_with_reflections, 1):
-        doc.add_heading(f'5.{i} {issue["issue"]}', level=2)
-        doc.add_paragraph(f"Symptoms: {issue['symptoms']}")
-        doc.add_paragraph(f"Solution: {issue['solution']}")
-        doc.add_paragraph(f"Prevention: {issue['prevention']}")
-        doc.add_paragraph(f"Reflection: {issue['reflection']}")
-        doc.add_paragraph()
-    
-    doc.add_page_break()
-    
-    # 6. Escalation Procedures with Learnings
-    doc.add_heading('6. Escalation Procedures with Learnings', level=1)
-    
-    escalation_intro = doc.add_paragraph()
-    escalation_intro.add_run(
-        "Guidelines for when and how to escalate issues beyond the helpdesk team, enhanced with learnings "
-        "from Week 1 operations where no escalations were required."
-    )
-    
-    # Create escalation procedures table
-    escalation_table = doc.add_table(rows=1, cols=5)
-    escalation_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    escalation_table.style = 'Table Grid'
-    
-    # Header row
-    esc_hdr_cells = escalation_table.rows[0].cells
-    esc_hdr_cells[0].text = 'Issue Type'
-    esc_hdr_cells[1].text = 'When to Escalate'
-    esc_hdr_cells[2].text = 'Level 1'
-    esc_hdr_cells[3].text = 'Level 2'
-    esc_hdr_cells[4].text = 'Week 1 Learning'
-    
-    # Data rows
-    escalation_data = [
-        ['High Priority Security', 'Immediate', 'IT Security Team', 'CISO', 'Handled effectively without escalation'],
-        ['Recurring Lockouts', 'After 2 failed attempts', 'Senior IT Support', 'IT Director', 'Complex case resolved successfully'],
-        ['Multiple User Issues', 'More than 5 users affected', 'IT Manager', 'IT Director', 'Not encountered in Week 1'],
-        ['System-wide Problems', 'Authentication system down', 'System Administrator', 'IT Director', 'Not encountered in Week 1'],
-        ['Access Violations', 'Unauthorized access attempts', 'IT Security Team', 'CISO', 'Security incident handled promptly']
-    ]
-    
-    for row_data in escalation_data:
-        row_cells = escalation_table.add_row().cells
-        for i, cell_data in enumerate(row_data):
-            row_cells[i].text = cell_data
-    
-    # Set column widths
-    escalation_table.columns[0].width = Inches(1.4)
-    escalation_table.columns[1].width = Inches(1.3)
-    escalation_table.columns[2].width = Inches(0.9)
-    escalation_table.columns[3].width = Inches(0.8)
-    escalation_table.columns[4].width = Inches(1.4)
-    
-    doc.add_paragraph()
-    
-    doc.add_heading('Escalation Learnings:', level=2)
-    learnings = [
-        "No escalations required in Week 1 - team competency confirmed",
-        "High-priority security incidents handled effectively at helpdesk level",
-        "Complex recurring lockout resolved without escalation - good problem-solving",
-        "Escalation procedures are well-defined but not yet tested in practice",
-        "Team confidence in handling diverse scenarios without escalation"
-    ]
-    
-    for learning in learnings:
-        doc.add_paragraph(f"• {learning}", style='List Bullet')
-    
-    doc.add_page_break()
-    
-    # 7. Week 1 Performance Summary with Analysis
-    doc.add_heading('7. Week 1 Performance Summary with Analysis', level=1)
-    
-    # Create performance summary table
-    summary_table = doc.add_table(rows=1, cols=4)
-    summary_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    summary_table.style = 'Table Grid'
-    
-    # Header row
-    sum_hdr_cells = summary_table.rows[0].cells
-    sum_hdr_cells[0].text = 'Metric'
-    sum_hdr_cells[1].text = 'Value'
-    sum_hdr_cells[2].text = 'Analysis'
-    sum_hdr_cells[3].text = 'Reflection'
-    
-    # Data rows
-    summary_data = [
-        ['Total Tickets Handled', '13 tickets', 'Good volume for first week', 'Manageable workload, good learning opportunity'],
-        ['Tickets Resolved', '13 tickets', 'Perfect resolution rate', 'Exceeds expectations, demonstrates competence'],
-        ['Resolution Rate', '100%', 'Exceptional performance', 'Sets high standard for future weeks'],
-        ['Average Resolution Time', 'Same Day', 'Excellent response time', 'User satisfaction likely high'],
-        ['Most Common Issue Type', 'Password Reset (4 tickets)', '31% of total volume', 'Indicates need for prevention strategies'],
-        ['Highest Priority Issues', '2 High Priority tickets', 'Security and MFA issues', 'Handled effectively without escalation'],
-        ['Agent Performance Rating', 'Excellent (100% resolution rate)', 'All agents performed well', 'Strong team foundation established'],
-        ['User Satisfaction', 'High (inferred)', 'No complaints or escalations', 'Procedures and communication effective'],
-        ['Knowledge Base Articles', '6 KB articles', 'Comprehensive documentation', 'Good foundation for future reference'],
-        ['Process Improvements', '5 prevention strategies', 'Proactive approach identified', 'Continuous improvement mindset established']
-    ]
-    
-    for row_data in summary_data:
-        row_cells = summary_table.add_row().cells
-        for i, cell_data in enumerate(row_data):
-            row_cells[i].text = cell_data
-    
-    # Set column widths
-    summary_table.columns[0].width = Inches(1.6)
-    summary_table.columns[1].width = Inches(1.1)
-    summary_table.columns[2].width = Inches(1.6)
-    summary_table.columns[3].width = Inches(1.6)
-    
-    doc.add_paragraph()
-    
-    doc.add_heading('Performance Analysis:', level=2)
-    analysis_points = [
-        "100% resolution rate exceeds industry standards (typically 85-95%)",
-        "Same-day resolution demonstrates efficient processes and competent team",
-        "No escalations required indicates strong problem-solving capabilities",
-        "Password-related issues (54%) suggest need for proactive user education",
-        "Team coordination and knowledge sharing working effectively",
-        "Documentation and KB articles provide solid foundation for scaling"
-    ]
-    
-    for point in analysis_points:
-        doc.add_paragraph(f"• {point}", style='List Bullet')
-    
-    doc.add_page_break()
-    
-    # 8. Reflection Notes & Lessons Learned
-    doc.add_heading('8. Reflection Notes & Lessons Learned', level=1)
-    
-    doc.add_heading('8.1 What Went Well', level=2)
-    successes = [
-        "100% resolution rate achieved across all tickets",
-        "No escalations required - team handled all scenarios competently",
-        "Standardized procedures proved effective and consistent",
-        "Knowledge base documentation was comprehensive and useful",
-        "Team coordination and communication worked smoothly",
-        "Identity verification processes were secure and user-friendly",
-        "Same-day resolution maintained high user satisfaction"
-    ]
-    
-    for success in successes:
-        doc.add_paragraph(f"✓ {success}", style='List Bullet')
-    
-    doc.add_heading('8.2 Challenges Encountered', level=2)
-    challenges = [
-        "Recurring lockout issue required complex, time-consuming resolution",
-        "High frequency of password-related issues (54% of tickets)",
-        "Some users struggled with credential synchronization across devices",
-        "Account disablement policies need clearer communication to users",
-        "Office 365 credential cache issues were more common than expected"
-    ]
-    
-    for challenge in challenges:
-        doc.add_paragraph(f"⚠ {challenge}", style='List Bullet')
-    
-    doc.add_heading('8.3 Key Learnings', level=2)
-    learnings = [
-        "Proactive user education could significantly reduce ticket volume",
-        "Credential cache management is critical for preventing recurring issues",
-        "Identity verification through company app/phone system is highly effective",
-        "Standardized procedures ensure consistent service quality",
-        "Documentation and KB articles are essential for team efficiency",
-        "Complex issues require systematic, step-by-step approach",
-        "Team collaboration and knowledge sharing are crucial for success"
-    ]
-    
-    for learning in learnings:
-        doc.add_paragraph(f"💡 {learning}", style='List Bullet')
-    
-    doc.add_heading('8.4 Areas for Improvement', level=2)
-    improvements = [
-        "Implement proactive password expiration notifications",
-        "Develop user education materials for credential management",
-        "Create automated monitoring for recurring lockout patterns",
-        "Establish regular credential cache cleanup procedures",
-        "Improve communication about account status changes",
-        "Consider implementing self-service password reset portal",
-        "Develop escalation procedures testing and validation"
-    ]
-    
-    for improvement in improvements:
-        doc.add_paragraph(f"🔧 {improvement}", style='List Bullet')
-    
-    doc.add_page_break()
-    
-    # 9. Recommendations & Next Steps
-    doc.add_heading('9. Recommendations & Next Steps', level=1)
-    
-    doc.add_heading('9.1 Immediate Actions (Week 2)', level=2)
-    immediate_actions = [
-        "Implement password expiration reminder system (7 days before expiration)",
-        "Create user education materials for password management best practices",
-        "Set up automated credential cache cleanup schedule (weekly)",
-        "Review and update account disablement policies and communication",
-        "Establish regular Office 365 credential refresh procedures",
-        "Create escalation procedure testing scenarios"
-    ]
-    
-    for action in immediate_actions:
-        doc.add_paragraph(f"• {action}", style='List Bullet')
-    
-    doc.add_heading('9.2 Medium-term Improvements (Month 1)', level=2)
-    medium_term = [
-        "Develop self-service password reset portal to reduce ticket volume",
-        "Implement automated account lockout monitoring and alerting",
-        "Create comprehensive user training program for common issues",
-        "Establish regular knowledge base review and update process",
-        "Set up performance metrics dashboard for tracking improvements",
-        "Develop escalation procedure testing and validation program"
-    ]
-    
-    for improvement in medium_term:
-        doc.add_paragraph(f"• {improvement}", style='List Bullet')
-    
-    doc.add_heading('9.3 Long-term Strategic Goals (Quarter 1)', level=2)
-    long_term = [
-        "Reduce ticket volume by 30% through prevention strategies",
-        "Implement advanced security monitoring and alerting systems",
-        "Develop predictive analytics for common issue patterns",
-        "Create comprehensive user self-service portal",
-        "Establish IT service management best practices and frameworks",
-        "Implement continuous improvement feedback loops"
-    ]
-    
-    for goal in long_term:
-        doc.add_paragraph(f"• {goal}", style='List Bullet')
-    
-    doc.add_page_break()
-    
-    # 10. Continuous Improvement Plan
-    doc.add_heading('10. Continuous Improvement Plan', level=1)
-    
-    doc.add_heading('10.1 Weekly Review Process', level=2)
-    weekly_process = [
-        "Review ticket patterns and identify trends",
-        "Analyze resolution times and identify bottlenecks",
-        "Update knowledge base with new learnings",
-        "Review and refine procedures based on experience",
-        "Assess team performance and identify training needs",
-        "Plan proactive measures for common issues"
-    ]
-    
-    for process in weekly_process:
-        doc.add_paragraph(f"• {process}", style='List Bullet')
-    
-    doc.add_heading('10.2 Monthly Assessment', level=2)
-    monthly_assessment = [
-        "Comprehensive performance metrics analysis",
-        "User satisfaction survey and feedback collection",
-        "Knowledge base effectiveness review",
-        "Process optimization and automation opportunities",
-        "Team training and development planning",
-        "Strategic goal progress evaluation"
-    ]
-    
-    for assessment in monthly_assessment:
-        doc.add_paragraph(f"• {assessment}", style='List Bullet')
-    
-    doc.add_heading('10.3 Quarterly Strategic Review', level=2)
-    quarterly_review = [
-        "Long-term goal achievement assessment",
-        "Technology and tool evaluation for improvements",
-        "Process re-engineering and optimization",
-        "Team structure and role optimization",
-        "Industry best practices benchmarking",
-        "Strategic planning for next quarter"
-    ]
-    
-    for review in quarterly_review:
-        doc.add_paragraph(f"• {review}", style='List Bullet')
-    
-    doc.add_paragraph()
-    
-    # Final Reflection
-    doc.add_heading('Final Reflection', level=1)
-    final_reflection = doc.add_paragraph()
-    final_reflection.add_run(
-        "Week 1 has established a strong foundation for the IT Helpdesk operation. The 100% resolution rate "
-        "and zero escalations demonstrate that the team, procedures, and systems are working effectively. "
-        "The comprehensive documentation and reflection process will ensure continuous improvement and "
-        "scalability as the operation grows. The key to success will be maintaining this high standard "
-        "while implementing proactive measures to reduce ticket volume and improve user experience."
-    )
-    
-    # Footer
-    doc.add_paragraph()
-    doc.add_paragraph("--- End of Enhanced Week 1 Knowledge Base ---")
-    doc.add_paragraph(f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
-    
-    # Save document
-    doc.save(filename)
-    
-    print(f"✅ Enhanced Week 1 Knowledge Base DOCX created successfully: {filename}")
+    filename, rendered = render('week1_enhanced', 'docx')
+    if rendered:
+        print(f"✅ Enhanced Week 1 Knowledge Base DOCX created successfully: {filename}")
+    else:
+        print(f"⏭️ Enhanced Week 1 Knowledge Base DOCX is up to date: {filename}")
     return filename
 
 def main():
@@ -1,683 +1,19 @@
 #!/usr/bin/env python3
 """
 Create Enhanced Week 1 Knowledge Base with Reflection Notes
+The content lives in kb_content/week1_enhanced.json and is rendered by knowledge_base.py.
 """
 
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.colors import Color, HexColor
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from reportlab.lib import colors
-from datetime import datetime
 import os
+from knowledge_base import render
 
 def create_enhanced_knowledge_base_pdf():
     """Create Enhanced Week 1 Knowledge Base PDF with Reflection Notes"""
-    
-    # Get current date for filename
-    current_date = datetime.now().strftime("%Y%m%d")
-    filename = f"Week1_Enhanced_Knowledge_Base_{current_date}.pdf"
-    
-    print(f"📚 Creating Enhanced Week 1 Knowledge Base with Reflections: {filename}")
-    
-    # Create PDF document
-    doc = SimpleDocTemplate(filename, pagesize=A4, 
-                          rightMargin=72, leftMargin=72, 
-                          topMargin=72, bottomMargin=18)
-    
-    # Get styles
-    styles = getSampleStyleSheet()
-    
-    # Create custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        textColor=HexColor('#2E8B57')
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        spaceAfter=12,
-        spaceBefore=20,
-        textColor=HexColor('#2E8B57')
-    )
-    
-    subheading_style = ParagraphStyle(
-        'CustomSubHeading',
-        parent=styles['Heading3'],
-        fontSize=14,
-        spaceAfter=8,
-        spaceBefore=12,
-        textColor=HexColor('#4682B4')
-    )
-    
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=6,
-        alignment=TA_JUSTIFY
-    )
-    
-    bullet_style = ParagraphStyle(
-        'CustomBullet',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceAfter=4,
-        leftIndent=20
-    )
-    
-    reflection_style = ParagraphStyle(
-        'ReflectionStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceAfter=6,
-        leftIndent=30,
-        rightIndent=30,
-        backColor=HexColor('#F0F8FF'),
-        borderColor=HexColor('#4682B4'),
-        borderWidth=1,
-        borderPadding=8
-    )
-    
-    # Build the story (content)
-    story = []
-    
-    # Title page
-    story.append(Paragraph("IT Helpdesk Knowledge Base", title_style))
-    story.append(Paragraph("Week 1 Analysis, Procedures & Reflections", title_style))
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", body_style))
-    story.append(Paragraph("Enhanced with Reflection Notes and Lessons Learned", body_style))
-    story.append(PageBreak())
-    
-    # Table of Contents
-    story.append(Paragraph("Table of Contents", heading_style))
-    toc_items = [
-        "1. Executive Summary",
-        "2. Incident Patterns Analysis with Reflections", 
-        "3. Solution Playbook with Lessons Learned",
-        "4. Agent Performance Analysis with Insights",
-        "5. Common Issues & Solutions with Reflections",
-        "6. Escalation Procedures with Learnings",
-        "7. Week 1 Performance Summary with Analysis",
-        "8. Reflection Notes & Lessons Learned",
-        "9. Recommendations & Next Steps",
-        "10. Continuous Improvement Plan"
-    ]
-    
-    for item in toc_items:
-        story.append(Paragraph(f"• {item}", bullet_style))
-    
-    story.append(PageBreak())
-    
-    # Executive Summary with Reflections
-    story.append(Paragraph("1. Executive Summary", heading_style))
-    story.append(Paragraph(
-        "Week 1 of the IT Helpdesk operation demonstrated exceptional performance with a 100% resolution rate. "
-        "All 13 tickets were resolved within the same business day, with no escalations required. "
-        "The team successfully handled various incident types, with password-related issues being the most common. "
-        "This enhanced knowledge base captures the patterns, procedures, best practices, and critical reflections "
-        "established during the first week.",
-        body_style
-    ))
-    
-    story.append(Paragraph("Key Achievements:", subheading_style))
-    achievements = [
-        "100% ticket resolution rate achieved",
-        "All tickets resolved same day",
-        "Zero escalations required",
-        "6 knowledge base articles created",
-        "5 prevention strategies identified",
-        "Perfect agent performance across all team members"
-    ]
-    
-    for achievement in achievements:
-        story.append(Paragraph(f"✓ {achievement}", bullet_style))
-    
-    story.append(Paragraph("Executive Reflection:", subheading_style))
-    story.append(Paragraph(
-        "The first week exceeded expectations in terms of resolution efficiency and team coordination. "
-        "The standardized procedures proved effective, and the team's ability to maintain 100% resolution "
-        "rate while handling diverse scenarios demonstrates strong foundational processes. However, the "
-        "high frequency of password-related issues (54% of tickets) indicates a need for proactive user "
-        "education and system improvements.",
-        reflection_style
-    ))
-    
-    story.append(PageBreak())
-    
-    # Incident Patterns Analysis with Reflections
-    story.append(Paragraph("2. Incident Patterns Analysis with Reflections", heading_style))
-    
-    # Create incident patterns table with reflection column
-    incident_data = [
-        ['Incident Type', 'Frequency', 'Priority', 'Resolution Time', 'Key Reflection'],
-        ['Password Reset Requests', '4 tickets', 'Medium', 'Same Day', 'Most common issue - need proactive prevention'],
-        ['Account Lockouts', '3 tickets', 'Medium', 'Same Day', 'User education on correct password entry needed'],
-        ['Recurring Lockouts', '1 ticket', 'Medium', 'Same Day', 'Complex issue requiring systematic approach'],
-        ['Account Disabled', '2 tickets', 'Medium', 'Same Day', 'Process review needed for disablement policies'],
-        ['Outlook Authentication', '1 ticket', 'Low', 'Same Day', 'Credential cache management critical'],
-        ['MFA Device Issues', '1 ticket', 'High', 'Same Day', 'High priority due to security implications'],
-        ['Password Expiration', '1 ticket', 'Medium', 'Same Day', 'Proactive notifications would prevent this'],
-        ['Temporary Access', '1 ticket', 'Low', 'Same Day', 'Standardized contractor process working well'],
-        ['Security Incidents', '1 ticket', 'High', 'Same Day', 'Immediate response protocols effective']
-    ]
-    
-    incident_table = Table(incident_data, colWidths=[2.2*inch, 0.9*inch, 0.8*inch, 0.9*inch, 2.2*inch])
-    incident_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#2E8B57')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # Left align first column
-        ('ALIGN', (1, 0), (3, -1), 'CENTER'),  # Center align middle columns
-        ('ALIGN', (4, 0), (4, -1), 'LEFT'),  # Left align last column
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 15),
-        ('TOPPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.white]),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-    ]))
-    
-    story.append(incident_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    story.append(Paragraph("Pattern Analysis Reflections:", subheading_style))
-    reflections = [
-        "Password-related issues dominate (54% of tickets) - indicates systemic need for user education",
-        "All incidents resolved same day - demonstrates effective response protocols",
-        "No escalations required - team competency and process effectiveness confirmed",
-        "High-priority security incidents handled immediately - security protocols working",
-        "Recurring lockout issue required complex resolution - good learning opportunity",
-        "Temporary access process streamlined - contractor onboarding working efficiently"
-    ]
-    
-    for reflection in reflections:
-        story.append(Paragraph(f"• {reflection}", bullet_style))
-    
-    story.append(PageBreak())
-    
-    # Solution Playbook with Lessons Learned
-    story.append(Paragraph("3. Solution Playbook with Lessons Learned", heading_style))
-    story.append(Paragraph(
-        "Standardized procedures for resolving common IT helpdesk issues, enhanced with lessons learned "
-        "from Week 1 implementation. Each procedure includes reflection notes on effectiveness and areas for improvement.",
-        body_style
-    ))
-    
-    # Password Reset Procedure with Reflections
-    story.append(Paragraph("3.1 Password Reset Procedure", subheading_style))
-    password_steps = [
-        "Verify user identity through company app/phone system",
-        "Access Active Directory Users and Computers (ADUC)",
-        "Locate user account: @username",
-        "Reset password using 'Reset Password' function",
-        "Set temporary password with complexity requirements"
-    ]
-    
-    for i, step in enumerate(password_steps, 1):
-        story.append(Paragraph(f"{i}. {step}", bullet_style))
-    
-    story.append(Paragraph("KB Article: KB_Password_Reset", body_style))
-    story.append(Paragraph("Lessons Learned:", subheading_style))
-    story.append(Paragraph(
-        "Identity verification through company app/phone system proved highly effective and secure. "
-        "Users appreciated the callback verification process. The temporary password approach worked well, "
-        "but we should consider implementing self-service password reset to reduce ticket volume. "
-        "Documentation updates were crucial for maintaining consistency across agents.",
-        reflection_style
-    ))
-    story.append(Spacer(1, 0.1*inch))
-    
-    # Account Unlock Procedure with Reflections
-    story.append(Paragraph("3.2 Account Unlock Procedure", subheading_style))
-    unlock_steps = [
-        "Check Active Directory for account lockout status",
-        "Verify lockout was due to failed login attempts",
-        "Use ADUC to unlock user account",
-        "Reset failed login counter to zero",
-        "Verify account is now accessible"
-    ]
-    
-    for i, step in enumerate(unlock_steps, 1):
-        story.append(Paragraph(f"{i}. {step}", bullet_style))
-    
-    story.append(Paragraph("KB Article: KB_Password_Reset", body_style))
-    story.append(Paragraph("Lessons Learned:", subheading_style))
-    story.append(Paragraph(
-        "Quick unlock procedures were highly effective. Users were relieved to regain access immediately. "
-        "The failed login counter reset was crucial for preventing immediate re-lockout. We should implement "
-        "automated monitoring for repeated lockout patterns to identify potential security issues early.",
-        reflection_style
-    ))
-    story.append(Spacer(1, 0.1*inch))
-    
-    # Recurring Lockout Procedure with Reflections
-    story.append(Paragraph("3.3 Recurring Lockout Resolution", subheading_style))
-    recurring_steps = [
-        "Analyze lockout source using LockoutStatus.exe tool",
-        "Identify multiple lockout sources across domain controllers",
-        "Check for cached credentials on user devices",
-        "Clear all cached credentials from devices",
-        "Reset user password to clear cached bad passwords"
-    ]
-    
-    for i, step in enumerate(recurring_steps, 1):
-        story.append(Paragraph(f"{i}. {step}", bullet_style))
-    
-    story.append(Paragraph("KB Article: KB_Password_Reset", body_style))
-    story.append(Paragraph("Lessons Learned:", subheading_style))
-    story.append(Paragraph(
-        "This was the most complex issue encountered. The LockoutStatus.exe tool was invaluable for diagnosis. "
-        "The systematic approach of clearing credentials from all devices was time-consuming but necessary. "
-        "This case highlighted the importance of comprehensive credential management and the need for better "
-        "user education about password synchronization across devices.",
-        reflection_style
-    ))
-    
-    story.append(PageBreak())
-    
-    # Agent Performance Analysis with Insights
-    story.append(Paragraph("4. Agent Performance Analysis with Insights", heading_style))
-    
-    # Agent performance table with insights
-    agent_data = [
-        ['Agent Name', 'Total Tickets', 'High Priority', 'Medium Priority', 'Low Priority', 'Resolution Rate', 'Key Insights'],
-        ['Azola Xabadiya', '4 tickets', '1', '3', '0', '100%', 'Excellent with security incidents and account management'],
-        ['Keawin Koesnel', '6 tickets', '1', '4', '1', '100%', 'Versatile, handles diverse issues effectively'],
-        ['System Admin', '3 tickets', '0', '3', '0', '100%', 'Specialized in standard password/account issues']
-    ]
-    
-    agent_table = Table(agent_data, colWidths=[1.3*inch, 0.8*inch, 0.7*inch, 0.7*inch, 0.7*inch, 0.8*inch, 1.8*inch])
-    agent_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#2E8B57')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # Left align first column
-        ('ALIGN', (1, 0), (5, -1), 'CENTER'),  # Center align middle columns
-        ('ALIGN', (6, 0), (6, -1), 'LEFT'),  # Left align last column
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 15),
-        ('TOPPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.white]),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-    ]))
-    
-    story.append(agent_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    story.append(Paragraph("Performance Insights:", subheading_style))
-    insights = [
-        "All agents achieved 100% resolution rate - demonstrates effective training and procedures",
-        "Keawin Koesnel handled the most tickets (6) - shows versatility and efficiency",
-        "Azola Xabadiya excelled with high-priority security incidents - strong technical skills",
-        "System Admin focused on standard issues - good specialization and consistency",
-        "No performance issues identified - team is well-prepared and competent",
-        "Cross-training opportunities identified for knowledge sharing"
-    ]
-    
-    for insight in insights:
-        story.append(Paragraph(f"• {insight}", bullet_style))
-    
-    story.append(Paragraph("Team Reflection:", subheading_style))
-    story.append(Paragraph(
-        "The team's performance exceeded expectations. The 100% resolution rate across all agents demonstrates "
-        "excellent training, clear procedures, and strong technical competency. The distribution of tickets "
-        "shows good workload balance and specialization. The team's ability to handle diverse scenarios "
-        "without escalations indicates strong problem-solving skills and effective knowledge sharing.",
-        reflection_style
-    ))
-    
-    story.append(PageBreak())
-    
-    # Common Issues & Solutions with Reflections
-    story.append(Paragraph("5. Common Issues & Solutions with Reflections", heading_style))
-    
-    issues_with_reflections = [
-        {
-            "issue": "User forgot password",
-            "symptoms": "Cannot log in, password not working",
-            "solution": "Reset password via ADUC, provide temporary password",
-            "prevention": "Send password expiration reminders",
-            "reflection": "Most common issue. Users often forget passwords after holidays or breaks. Proactive reminders would significantly reduce ticket volume."
-        },
-        {
-            "issue": "Account locked after failed attempts",
-            "symptoms": "Account locked message, cannot access systems",
-            "solution": "Unlock account in ADUC, reset failed login counter",
-            "prevention": "Educate users on correct password entry",
-            "reflection": "Usually caused by typos or caps lock. User education on proper password entry techniques would help prevent this."
-        },
-        {
-            "issue": "Recurring account lockouts",
-            "symptoms": "Account locks repeatedly even with correct password",
-            "solution": "Clear cached credentials from all devices",
-            "prevention": "Regular credential cache maintenance",
-            "reflection": "Most complex issue encountered. Requires systematic approach and good diagnostic tools. Users need better understanding of credential synchronization."
-        },
-        {
-            "issue": "Account disabled unexpectedly",
-            "symptoms": "Login denied, account may be disabled",
-            "solution": "Re-enable account if authorized, document reason",
-            "prevention": "Review account disablement policies",
-            "reflection": "Often caused by policy changes or administrative errors. Better communication about account status changes needed."
-        },
-        {
-            "issue": "Outlook authentication prompts",
-            "symptoms": "Outlook keeps asking for password",
-            "solution": "Clear credential cache, reset Office 365 password",
-            "prevention": "Regular Office 365 credential refresh",
-            "reflection": "Credential cache issues are common with Office 365. Regular maintenance and user education on credential management would help."
-        }
-    ]
-    
-    for i, issue in enumerate(issues_with_reflections, 1):
-        story.append(Paragraph(f"5.{i} {issue['issue']}", subheading_style))
-        story.append(Paragraph(f"<b>Symptoms:</b> {issue['symptoms']}", body_style))
-        story.append(Paragraph(f"<b>Solution:</b> {issue['solution']}", body_style))
-        story.append(Paragraph(f"<b>Prevention:</b> {issue['prevention']}", body_style))
-        story.append(Paragraph(f"<b>Reflection:</b> {issue['reflection']}", reflection_style))
-        story.append(Spacer(1, 0.1*inch))
-    
-    story.append(PageBreak())
-    
-    # Escalation Procedures with Learnings
-    story.append(Paragraph("6. Escalation Procedures with Learnings", heading_style))
-    story.append(Paragraph(
-        "Guidelines for when and how to escalate issues beyond the helpdesk team, enhanced with learnings "
-        "from Week 1 operations where no escalations were required.",
-        body_style
-    ))
-    
-    escalation_data = [
-        ['Issue Type', 'When to Escalate', 'Level 1', 'Level 2', 'Week 1 Learning'],
-        ['High Priority Security', 'Immediate', 'IT Security Team', 'CISO', 'Handled effectively without escalation'],
-        ['Recurring Lockouts', 'After 2 failed attempts', 'Senior IT Support', 'IT Director', 'Complex case resolved successfully'],
-        ['Multiple User Issues', 'More than 5 users affected', 'IT Manager', 'IT Director', 'Not encountered in Week 1'],
-        ['System-wide Problems', 'Authentication system down', 'System Administrator', 'IT Director', 'Not encountered in Week 1'],
-        ['Access Violations', 'Unauthorized access attempts', 'IT Security Team', 'CISO', 'Security incident handled promptly']
-    ]
-    
-    escalation_table = Table(escalation_data, colWidths=[1.4*inch, 1.3*inch, 0.9*inch, 0.8*inch, 1.4*inch])
-    escalation_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#2E8B57')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # Left align first column
-        ('ALIGN', (1, 0), (4, -1), 'LEFT'),  # Left align other columns
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 15),
-        ('TOPPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.white]),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-    ]))
-    
-    story.append(escalation_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    story.append(Paragraph("Escalation Learnings:", subheading_style))
-    learnings = [
-        "No escalations required in Week 1 - team competency confirmed",
-        "High-priority security incidents handled effectively at helpdesk level",
-        "Complex recurring lockout resolved without escalation - good problem-solving",
-        "Escalation procedures are well-defined but not yet tested in practice",
-        "Team confidence in handling diverse scenarios without escalation"
-    ]
-    
-    for learning in learnings:
-        story.append(Paragraph(f"• {learning}", bullet_style))
-    
-    story.append(PageBreak())
-    
-    # Week 1 Performance Summary with Analysis
-    story.append(Paragraph("7. Week 1 Performance Summary with Analysis", heading_style))
-    
-    summary_data = [
-        ['Metric', 'Value', 'Analysis', 'Reflection'],
-        ['Total Tickets Handled', '13 tickets', 'Good volume for first week', 'Manageable workload, good learning opportunity'],
-        ['Tickets Resolved', '13 tickets', 'Perfect resolution rate', 'Exceeds expectations, demonstrates competence'],
-        ['Resolution Rate', '100%', 'Exceptional performance', 'Sets high standard for future weeks'],
-        ['Average Resolution Time', 'Same Day', 'Excellent response time', 'User satisfaction likely high'],
-        ['Most Common Issue Type', 'Password Reset (4 tickets)', '31% of total volume', 'Indicates need for prevention strategies'],
-        ['Highest Priority Issues', '2 High Priority tickets', 'Security and MFA issues', 'Handled effectively without escalation'],
-        ['Agent Performance Rating', 'Excellent (100% resolution rate)', 'All agents performed well', 'Strong team foundation established'],
-        ['User Satisfaction', 'High (inferred)', 'No complaints or escalations', 'Procedures and communication effective'],
-        ['Knowledge Base Articles', '6 KB articles', 'Comprehensive documentation', 'Good foundation for future reference'],
-        ['Process Improvements', '5 prevention strategies', 'Proactive approach identified', 'Continuous improvement mindset established']
-    ]
-    
-    summary_table = Table(summary_data, colWidths=[1.6*inch, 1.1*inch, 1.6*inch, 1.6*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#2E8B57')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 15),
-        ('TOPPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.white]),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-    ]))
-    
-    story.append(summary_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    story.append(Paragraph("Performance Analysis:", subheading_style))
-    analysis_points = [
-        "100% resolution rate exceeds industry standards (typically 85-95%)",
-        "Same-day resolution demonstrates efficient processes and competent team",
-        "No escalations required indicates strong problem-solving capabilities",
-        "Password-related issues (54%) suggest need for proactive user education",
-        "Team coordination and knowledge sharing working effectively",
-        "Documentation and KB articles provide solid foundation for scaling"
-    ]
-    
-    for point in analysis_points:
-        story.append(Paragraph(f"• {point}", bullet_style))
-    
-    story.append(PageBreak())
-    
-    # Reflection Notes & Lessons Learned
-    story.append(Paragraph("8. Reflection Notes & Lessons Learned", heading_style))
-    
-    story.append(Paragraph("8.1 What Went Well", subheading_style))
-    successes = [
-        "100% resolution rate achieved across all tickets",
-        "No escalations required - team handled all scenarios competently",
-        "Standardized procedures proved effective and consistent",
-        "Knowledge base documentation was comprehensive and useful",
-        "Team coordination and communication worked smoothly",
-        "Identity verification processes were secure and user-friendly",
-        "Same-day resolution maintained high user satisfaction"
-    ]
-    
-    for success in successes:
-        story.append(Paragraph(f"✓ {success}", bullet_style))
-    
-    story.append(Paragraph("8.2 Challenges Encountered", subheading_style))
-    challenges = [
-        "Recurring lockout issue required complex, time-consuming resolution",
-        "High frequency of password-related issues (54% of tickets)",
-        "Some users struggled with credential synchronization across devices",
-        "Account disablement policies need clearer communication to users",
-        "Office 365 credential cache issues were more common than expected"
-    ]
-    
-    for challenge in challenges:
-        story.append(Paragraph(f"⚠ {challenge}", bullet_style))
-    
-    story.append(Paragraph("8.3 Key Learnings", subheading_style))
-    learnings = [
-        "Proactive user education could significantly reduce ticket volume",
-        "Credential cache management is critical for preventing recurring issues",
-        "Identity verification through company app/phone system is highly effective",
-        "Standardized procedures ensure consistent service quality",
-        "Documentation and KB articles are essential for team efficiency",
-        "Complex issues require systematic, step-by-step approach",
-        "Team collaboration and knowledge sharing are crucial for success"
-    ]
-    
-    for learning in learnings:
-        story.append(Paragraph(f"💡 {learning}", bullet_style))
-    
-    story.append(Paragraph("8.4 Areas for Improvement", subheading_style))
-    improvements = [
-        "Implement proactive password expiration notifications",
-        "Develop user education materials for credential management",
-        "Create automated monitoring for recurring lockout patterns",
-        "Establish regular credential cache cleanup procedures",
-        "Improve communication about account status changes",
-        "Consider implementing self-service password reset portal",
-        "Develop escalation procedures testing and validation"
-    ]
-    
-    for improvement in improvements:
-        story.append(Paragraph(f"🔧 {improvement}", bullet_style))
-    
-    story.append(PageBreak())
-    
-    # Recommendations & Next Steps
-    story.append(Paragraph("9. Recommendations & Next Steps", heading_style))
-    
-    story.append(Paragraph("9.1 Immediate Actions (Week 2)", subheading_style))
-    immediate_actions = [
-        "Implement password expiration reminder system (7 days before expiration)",
-        "Create user education materials for password management best practices",
-        "Set up automated credential cache cleanup schedule (weekly)",
-        "Review and update account disablement policies and communication",
-        "Establish regular Office 365 credential refresh procedures",
-        "Create escalation procedure testing scenarios"
-    ]
-    
-    for action in immediate_actions:
-        story.append(Paragraph(f"• {action}", bullet_style))
-    
-    story.append(Paragraph("9.2 Medium-term Improvements (Month 1)", subheading_style))
-    medium_term = [
-        "Develop self-service password reset portal to reduce ticket volume",
-        "Implement automated account lockout monitoring and alerting",
-        "Create comprehensive user training program for common issues",
-        "Establish regular knowledge base review and update process",
-        "Set up performance metrics dashboard for tracking improvements",
-        "Develop escalation procedure testing and validation program"
-    ]
-    
-    for improvement in medium_term:
-        story.append(Paragraph(f"• {improvement}", bullet_style))
-    
-    story.append(Paragraph("9.3 Long-term Strategic Goals (Quarter 1)", subheading_style))
-    long_term = [
-        "Reduce ticket volume by 30% through prevention strategies",
-        "Implement advanced security monitoring and alerting systems",
-        "Develop predictive analytics for common issue patterns",
-        "Create comprehensive user self-service portal",
-        "Establish IT service management best practices and frameworks",
-        "Implement continuous improvement feedback loops"
-    ]
-    
-    for goal in long_term:
-        story.append(Paragraph(f"• {goal}", bullet_style))
-    
-    story.append(PageBreak())
-    
-    # Continuous Improvement Plan
-    story.append(Paragraph("10. Continuous Improvement Plan", heading_style))
-    
-    story.append(Paragraph("10.1 Weekly Review Process", subheading_style))
-    weekly_process = [
-        "Review ticket patterns and identify trends",
-        "Analyze resolution times and identify bottlenecks",
-        "Update knowledge base with new learnings",
-        "Review and refine procedures based on experience",
-        "Assess team performance and identify training needs",
-        "Plan proactive measures for common issues"
-    ]
-    
-    for process in weekly_process:
-        story.append(Paragraph(f"• {process}", bullet_style))
-    
-    story.append(Paragraph("10.2 Monthly Assessment", subheading_style))
-    monthly_assessment = [
-        "Comprehensive performance metrics analysis",
-        "User satisfaction survey and feedback collection",
-        "Knowledge base effectiveness review",
-        "Process optimization and automation opportunities",
-        "Team training and development planning",
-        "Strategic goal progress evaluation"
-    ]
-    
-    for assessment in monthly_assessment:
-        story.append(Paragraph(f"• {assessment}", bullet_style))
-    
-    story.append(Paragraph("10.3 Quarterly Strategic Review", subheading_style))
-    quarterly_review = [
-        "Long-term goal achievement assessment",
-        "Technology and tool evaluation for improvements",
-        "Process re-engineering and optimization",
-        "Team structure and role optimization",
-        "Industry best practices benchmarking",
-        "Strategic planning for next quarter"
-    ]
-    
-    for review in quarterly_review:
-        story.append(Paragraph(f"• {review}", bullet_style))
-    
-    story.append(Spacer(1, 0.3*inch))
-    
-    # Final Reflection
-    story.append(Paragraph("Final Reflection", heading_style))
-    story.append(Paragraph(
-        "Week 1 has established a strong foundation for the IT Helpdesk operation. The 100% resolution rate "
-        "and zero escalations demonstrate that the team, procedures, and systems are working effectively. "
-        "The comprehensive documentation and reflection process will ensure continuous improvement and "
-        "scalability as the operation grows. The key to success will be maintaining this high standard "
-        "while implementing proactive measures to reduce ticket volume and improve user experience.",
-        reflection_style
-    ))
-    
-    # Footer
-    story.append(Paragraph("--- End of Enhanced Week 1 Knowledge Base ---", body_style))
-    story.append(Paragraph(f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", body_style))
-    
-    # Build PDF
-    doc.build(story)
-    
-    print(f"✅ Enhanced Week 1 Knowledge Base with Reflections created successfully: {filename}")
+    filename, rendered = render('week1_enhanced', 'pdf')
+    if rendered:
+        print(f"✅ Enhanced Week 1 Knowledge Base with Reflections created successfully: {filename}")
+    else:
+        print(f"⏭️ Enhanced Week 1 Knowledge Base with Reflections is up to date: {filename}")
     return filename
 
 def main():
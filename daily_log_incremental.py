@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Incremental mode for the daily log exports
+Each export keeps a small JSON state file with its high-water mark (last ticket
+id and last updated_at exported) and the workbook it last wrote. An incremental
+run fetches only tickets added or changed since then, updates their rows in
+place, appends new ones and refreshes the summary sheets.
+
+Only the database fetch is incremental. An .xlsx file is a zip archive that
+openpyxl reads and saves whole, so the workbook is still loaded and rewritten
+in full and the summary sheets are rebuilt from every log row; that part of a
+run still grows with the size of the log.
+"""
+
+import json
+import os
+from copy import copy
+
+import pandas as pd
+from openpyxl import load_workbook
+
+# Columns of the exports' get_all_tickets() projection, keyed by ticket column
+DAILY_LOG_FIELDS = {
+    'id': 'TicketID',
+    'timestamp': 'DateOpened',
+    'name': 'ReporterName',
+    'email': 'ReporterContact',
+    'assigned_agent': 'AssignedAgent',
+    'priority': 'Priority',
+    'status': 'Status',
+    'issue': 'FullDescription',
+    'notes': 'ResolutionNotes',
+    'kb_article': 'KBArticleLinked',
+    'updated_at': 'updated_at'
+}
+
+def daily_log_tickets(snapshot):
+    """Project full ticket rows (SELECT * FROM tickets) onto the daily log columns"""
+    return [{alias: ticket.get(column) for column, alias in DAILY_LOG_FIELDS.items()} for ticket in snapshot]
+
+def state_path(prefix):
+    """State file for an export, e.g. IT_Helpdesk_Daily_Log.state.json"""
+    return f"{prefix}.state.json"
+
+def load_state(path):
+    """Load the export state, or None if the export has never run or its workbook is gone"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not os.path.exists(state.get('workbook', '')):
+        return None
+    return state
+
+def save_state(path, workbook, tickets, previous=None):
+    """Record the workbook and the high-water mark of the tickets just exported"""
+    last_id = previous['last_id'] if previous else 0
+    last_updated_at = previous['last_updated_at'] if previous else 0
+    for ticket in tickets:
+        last_id = max(last_id, int(ticket.get('TicketID') or 0))
+        if ticket.get('updated_at') is not None:
+            last_updated_at = max(last_updated_at, int(ticket['updated_at']))
+
+    state = {
+        'workbook': workbook,
+        'last_id': last_id,
+        'last_updated_at': last_updated_at
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    return state
+
+def changed_since_clause(state):
+    """WHERE clause selecting tickets added or changed since the last export
+
+    updated_at uses >= so rows changed within the same second as the last
+    export are fetched again; re-applying them is harmless.
+    """
+    return f"WHERE id > {int(state['last_id'])} OR updated_at >= {int(state['last_updated_at'])}"
+
+def merge_rows(worksheet, df, key='TicketID'):
+    """Update rows of df that are already in the sheet (matched on key) and append the rest
+
+    Appended rows copy the style and height of the sheet's last data row.
+    Returns (updated_count, appended_count).
+    """
+    header = [cell.value for cell in worksheet[1]]
+    key_column = header.index(key) + 1
+    row_for_key = {}
+    for row in worksheet.iter_rows(min_row=2, min_col=key_column, max_col=key_column):
+        if row[0].value is not None:
+            row_for_key[str(row[0].value)] = row[0].row
+
+    template_row = worksheet.max_row if worksheet.max_row > 1 else None
+    updated_count = 0
+    appended_count = 0
+
+    for record in df[header].itertuples(index=False):
+        values = [None if pd.isna(value) else value for value in record]
+        existing_row = row_for_key.get(str(values[key_column - 1]))
+        if existing_row:
+            for column, value in enumerate(values, start=1):
+                worksheet.cell(row=existing_row, column=column, value=value)
+            updated_count += 1
+            continue
+
+        new_row = worksheet.max_row + 1
+        for column, value in enumerate(values, start=1):
+            cell = worksheet.cell(row=new_row, column=column, value=value)
+            if template_row:
+                template = worksheet.cell(row=template_row, column=column)
+                if template.has_style:
+                    cell._style = copy(template._style)
+        if template_row and worksheet.row_dimensions[template_row].height:
+            worksheet.row_dimensions[new_row].height = worksheet.row_dimensions[template_row].height
+        row_for_key[str(values[key_column - 1])] = new_row
+        appended_count += 1
+
+    return updated_count, appended_count
+
+def sheet_dataframe(worksheet):
+    """Read a sheet with a header row into a DataFrame"""
+    rows = worksheet.iter_rows(values_only=True)
+    header = next(rows)
+    return pd.DataFrame(list(rows), columns=header)
+
+def open_workbook(state):
+    """Open the workbook recorded in the export state (loads the whole file)"""
+    return load_workbook(state['workbook'])
+
+def replace_sheets(workbook, names):
+    """Remove derived sheets so they can be rebuilt from the merged log"""
+    for name in names:
+        if name in workbook.sheetnames:
+            del workbook[name]
@@ -8,25 +8,51 @@ USE DATABASE 'my-database';
 CREATE TABLE IF NOT EXISTS tickets (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     timestamp TEXT NOT NULL,
+    created_at INTEGER,  -- epoch seconds parsed from timestamp (see ticket_timestamps.py)
+    updated_at INTEGER,  -- epoch seconds of the last change, kept by the triggers below
     name TEXT NOT NULL,
     email TEXT NOT NULL,
     issue TEXT NOT NULL,
     notes TEXT DEFAULT '',
-    status TEXT DEFAULT 'Open' CHECK (status IN ('Open', 'In Progress', 'Resolved'))
+    status TEXT DEFAULT 'Open' CHECK (status IN ('Open', 'In Progress', 'Resolved')),
+    incident_category TEXT,  -- classification stored at write time (see ticket_classifier.py)
+    kb_article TEXT,
+    response_template TEXT,
+    import_key TEXT  -- natural identity hash of imported tickets (see ticket_upsert.py)
 );
 
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_tickets_timestamp ON tickets(timestamp);
+CREATE INDEX IF NOT EXISTS idx_tickets_created_at ON tickets(created_at);
+CREATE INDEX IF NOT EXISTS idx_tickets_updated_at ON tickets(updated_at);
 CREATE INDEX IF NOT EXISTS idx_tickets_status ON tickets(status);
 CREATE INDEX IF NOT EXISTS idx_tickets_email ON tickets(email);
+CREATE INDEX IF NOT EXISTS idx_tickets_incident_category ON tickets(incident_category);
+CREATE INDEX IF NOT EXISTS idx_tickets_kb_article ON tickets(kb_article);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tickets_import_key ON tickets(import_key);
+
+-- Keep updated_at current for incremental exports
+CREATE TRIGGER IF NOT EXISTS tickets_updated_at_insert
+AFTER INSERT ON tickets
+WHEN NEW.updated_at IS NULL
+BEGIN
+    UPDATE tickets SET updated_at = CAST(strftime('%s', 'now') AS INTEGER) WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS tickets_updated_at_update
+AFTER UPDATE ON tickets
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE tickets SET updated_at = CAST(strftime('%s', 'now') AS INTEGER) WHERE id = NEW.id;
+END;
 
 -- Insert some sample data (optional - remove if not needed)
-INSERT OR IGNORE INTO tickets (timestamp, name, email, issue, notes, status) VALUES
-('2024-01-15 09:30:00', 'John Smith', 'john.smith@company.com', 'Unable to access company email. Getting authentication error when trying to log in.', '', 'Open'),
-('2024-01-15 10:15:00', 'Sarah Johnson', 'sarah.johnson@company.com', 'Laptop is running very slowly. Takes 5+ minutes to boot up and applications are unresponsive.', 'Restarted laptop and ran disk cleanup. Issue persists.', 'In Progress'),
-('2024-01-15 11:00:00', 'Mike Wilson', 'mike.wilson@company.com', 'Need help setting up VPN connection for remote work. Following the guide but getting connection timeout errors.', 'Provided updated VPN configuration. User successfully connected.', 'Resolved'),
-('2024-01-15 14:20:00', 'Emily Davis', 'emily.davis@company.com', 'Printer in office is showing "Paper Jam" error but no paper is visible. Tried opening all compartments.', '', 'Open'),
-('2024-01-15 15:45:00', 'David Brown', 'david.brown@company.com', 'Microsoft Office applications are not opening. Getting "Application Error" when trying to launch Word or Excel.', 'Reinstalled Office suite. Issue resolved.', 'Resolved');
+INSERT OR IGNORE INTO tickets (timestamp, created_at, name, email, issue, notes, status, incident_category, kb_article, response_template) VALUES
+('2024-01-15 09:30:00', 1705311000, 'John Smith', 'john.smith@company.com', 'Unable to access company email. Getting authentication error when trying to log in.', '', 'Open', 'Account / Authentication', 'KB_MFA_Reset', 'general'),
+('2024-01-15 10:15:00', 1705313700, 'Sarah Johnson', 'sarah.johnson@company.com', 'Laptop is running very slowly. Takes 5+ minutes to boot up and applications are unresponsive.', 'Restarted laptop and ran disk cleanup. Issue persists.', 'In Progress', 'Hardware Support', 'KB_General_Support', 'hardware'),
+('2024-01-15 11:00:00', 1705316400, 'Mike Wilson', 'mike.wilson@company.com', 'Need help setting up VPN connection for remote work. Following the guide but getting connection timeout errors.', 'Provided updated VPN configuration. User successfully connected.', 'Resolved', 'Network Support', 'KB_General_Support', 'general'),
+('2024-01-15 14:20:00', 1705328400, 'Emily Davis', 'emily.davis@company.com', 'Printer in office is showing "Paper Jam" error but no paper is visible. Tried opening all compartments.', '', 'Open', 'General Support', 'KB_General_Support', 'general'),
+('2024-01-15 15:45:00', 1705333500, 'David Brown', 'david.brown@company.com', 'Microsoft Office applications are not opening. Getting "Application Error" when trying to launch Word or Excel.', 'Reinstalled Office suite. Issue resolved.', 'Resolved', 'Software Support', 'KB_General_Support', 'general');
 
 -- Create a view for ticket statistics (optional)
 CREATE VIEW IF NOT EXISTS ticket_stats AS
@@ -42,10 +68,11 @@ CREATE VIEW IF NOT EXISTS recent_tickets AS
 SELECT 
     id,
     timestamp,
+    created_at,
     name,
     email,
     issue,
     status
 FROM tickets 
-WHERE datetime(timestamp) >= datetime('now', '-7 days')
-ORDER BY timestamp DESC;
+WHERE created_at >= CAST(strftime('%s', 'now', '-7 days') AS INTEGER)
+ORDER BY created_at DESC;
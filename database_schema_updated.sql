@@ -20,6 +20,9 @@ CREATE INDEX IF NOT EXISTS idx_tickets_assigned_agent ON tickets(assigned_agent)
 UPDATE tickets SET priority = 'Medium' WHERE priority IS NULL;
 UPDATE tickets SET assigned_agent = '' WHERE assigned_agent IS NULL;
 
+-- Note: add_ticket_counters.py replaces tickets_by_priority and tickets_by_agent
+-- (and ticket_stats) with views over the trigger-maintained ticket_counters table
+
 -- Create a view for tickets by priority
 CREATE VIEW IF NOT EXISTS tickets_by_priority AS
 SELECT 
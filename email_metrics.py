@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+In-process metrics for the IT Helpdesk email notification service
+Latency histograms per send stage, success/failure counters, queue depth and throughput
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds in seconds (the last bucket is +Inf)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Send stages timed for every notification
+STAGES = ('render', 'smtp_connect', 'smtp_send', 'total')
+
+# Window used for the messages/second throughput figure
+THROUGHPUT_WINDOW_SECONDS = 60
+
+_lock = threading.Lock()
+_started_at = time.time()
+_histograms = {}
+_counters = {'success': 0, 'failure': 0, 'rejected': 0}
+_queue_depth = 0
+_recent_sends = deque()
+
+def _new_histogram():
+    """Create an empty histogram for LATENCY_BUCKETS"""
+    return {'buckets': [0] * (len(LATENCY_BUCKETS) + 1), 'count': 0, 'sum': 0.0, 'max': 0.0}
+
+def reset_metrics():
+    """Reset all metrics (used by tests and benchmarks)"""
+    global _queue_depth, _started_at
+    with _lock:
+        _histograms.clear()
+        for stage in STAGES:
+            _histograms[stage] = _new_histogram()
+        for name in _counters:
+            _counters[name] = 0
+        _queue_depth = 0
+        _recent_sends.clear()
+        _started_at = time.time()
+
+reset_metrics()
+
+def observe(stage, seconds):
+    """Record one latency observation for a send stage"""
+    index = len(LATENCY_BUCKETS)
+    for i, bound in enumerate(LATENCY_BUCKETS):
+        if seconds <= bound:
+            index = i
+            break
+
+    with _lock:
+        histogram = _histograms.setdefault(stage, _new_histogram())
+        histogram['buckets'][index] += 1
+        histogram['count'] += 1
+        histogram['sum'] += seconds
+        histogram['max'] = max(histogram['max'], seconds)
+
+@contextmanager
+def timed(stage):
+    """Time the wrapped block and record it under the given stage"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(stage, time.perf_counter() - start)
+
+def record_result(success, messages=1):
+    """Count a finished notification and feed the throughput window"""
+    now = time.time()
+    with _lock:
+        _counters['success' if success else 'failure'] += 1
+        if success:
+            _recent_sends.append((now, messages))
+        _trim_recent(now)
+
+def record_rejected():
+    """Count a submission rejected before sending (validation or configuration)"""
+    with _lock:
+        _counters['rejected'] += 1
+
+def queue_entered():
+    """Mark a notification as waiting or in progress"""
+    global _queue_depth
+    with _lock:
+        _queue_depth += 1
+
+def queue_left():
+    """Mark a notification as finished"""
+    global _queue_depth
+    with _lock:
+        _queue_depth = max(0, _queue_depth - 1)
+
+def _trim_recent(now):
+    """Drop throughput samples older than the window (caller holds the lock)"""
+    while _recent_sends and now - _recent_sends[0][0] > THROUGHPUT_WINDOW_SECONDS:
+        _recent_sends.popleft()
+
+def _percentile(histogram, fraction):
+    """Estimate a percentile as the upper bound of the bucket containing it"""
+    if not histogram['count']:
+        return None
+    target = fraction * histogram['count']
+    seen = 0
+    for i, count in enumerate(histogram['buckets']):
+        seen += count
+        if seen >= target:
+            return LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else histogram['max']
+    return histogram['max']
+
+def snapshot():
+    """Return a JSON-serializable copy of all metrics"""
+    now = time.time()
+    with _lock:
+        _trim_recent(now)
+        window = min(THROUGHPUT_WINDOW_SECONDS, max(now - _started_at, 1e-9))
+        recent_messages = sum(messages for _, messages in _recent_sends)
+
+        histograms = {}
+        for stage, histogram in _histograms.items():
+            cumulative = 0
+            buckets = {}
+            for i, count in enumerate(histogram['buckets']):
+                cumulative += count
+                label = str(LATENCY_BUCKETS[i]) if i < len(LATENCY_BUCKETS) else '+Inf'
+                buckets[label] = cumulative
+            histograms[stage] = {
+                'count': histogram['count'],
+                'sum_seconds': round(histogram['sum'], 6),
+                'avg_seconds': round(histogram['sum'] / histogram['count'], 6) if histogram['count'] else None,
+                'max_seconds': round(histogram['max'], 6),
+                'p50_seconds': _percentile(histogram, 0.50),
+                'p95_seconds': _percentile(histogram, 0.95),
+                'p99_seconds': _percentile(histogram, 0.99),
+                'buckets': buckets
+            }
+
+        return {
+            'uptime_seconds': round(now - _started_at, 3),
+            'queue_depth': _queue_depth,
+            'counters': dict(_counters),
+            'throughput': {
+                'window_seconds': THROUGHPUT_WINDOW_SECONDS,
+                'messages_per_second': round(recent_messages / window, 3)
+            },
+            'latency': histograms
+        }
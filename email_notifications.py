@@ -9,8 +9,12 @@ from flask_mail import Mail, Message
 import csv
 import io
 import os
+import time
+from contextlib import ExitStack
 from datetime import datetime
 from dotenv import load_dotenv
+import email_metrics
+from notification_routing import get_recipients, get_routing_table, install_reload_handler
 
 # Load environment variables
 load_dotenv()
@@ -102,15 +106,48 @@ def create_csv_attachment(ticket_data):
     
     return csv_content
 
-def get_notification_emails():
-    """Get list of email addresses to notify"""
-    emails_str = os.getenv('NOTIFY_EMAILS', '')
-    if not emails_str:
-        return []
-    
-    # Split by comma and clean up whitespace
-    emails = [email.strip() for email in emails_str.split(',') if email.strip()]
-    return emails
+def get_notification_emails(priority=None, category=None):
+    """Get list of email addresses to notify, routed by priority and category"""
+    return get_recipients(priority, category)
+
+def send_ticket_email(ticket_data, notification_emails):
+    """Render and send the notification email, recording per-stage latency metrics"""
+    start = time.perf_counter()
+    try:
+        with email_metrics.timed('render'):
+            # Create HTML email content
+            html_content = create_html_email(ticket_data)
+            
+            # Create CSV attachment
+            csv_content = create_csv_attachment(ticket_data)
+            
+            # Create email message
+            msg = Message(
+                subject=f"New IT Helpdesk Ticket: {ticket_data['subject']}",
+                recipients=notification_emails,
+                html=html_content
+            )
+            
+            # Attach CSV file
+            msg.attach(
+                filename="ticket.csv",
+                content_type="text/csv",
+                data=csv_content
+            )
+        
+        # Send email (connect and send are timed separately)
+        with ExitStack() as stack:
+            with email_metrics.timed('smtp_connect'):
+                connection = stack.enter_context(mail.connect())
+            with email_metrics.timed('smtp_send'):
+                connection.send(msg)
+        
+        email_metrics.record_result(True, len(notification_emails))
+    except Exception:
+        email_metrics.record_result(False)
+        raise
+    finally:
+        email_metrics.observe('total', time.perf_counter() - start)
 
 @app.route('/submit_ticket', methods=['POST'])
 def submit_ticket():
@@ -122,47 +159,37 @@ def submit_ticket():
         
         for field in required_fields:
             if field not in request.json:
+                email_metrics.record_rejected()
                 return jsonify({
                     'error': f'Missing required field: {field}'
                 }), 400
             
             value = request.json[field]
             if not value or not str(value).strip():
+                email_metrics.record_rejected()
                 return jsonify({
                     'error': f'Field {field} cannot be empty'
                 }), 400
             
             ticket_data[field] = str(value).strip()
         
-        # Get notification emails
-        notification_emails = get_notification_emails()
+        # Get notification emails (optional routing fields)
+        notification_emails = get_notification_emails(
+            request.json.get('priority'),
+            request.json.get('category')
+        )
         if not notification_emails:
+            email_metrics.record_rejected()
             return jsonify({
                 'error': 'No notification emails configured'
             }), 500
         
-        # Create HTML email content
-        html_content = create_html_email(ticket_data)
-        
-        # Create CSV attachment
-        csv_content = create_csv_attachment(ticket_data)
-        
-        # Create email message
-        msg = Message(
-            subject=f"New IT Helpdesk Ticket: {ticket_data['subject']}",
-            recipients=notification_emails,
-            html=html_content
-        )
-        
-        # Attach CSV file
-        msg.attach(
-            filename="ticket.csv",
-            content_type="text/csv",
-            data=csv_content
-        )
-        
-        # Send email
-        mail.send(msg)
+        # Render and send email
+        email_metrics.queue_entered()
+        try:
+            send_ticket_email(ticket_data, notification_emails)
+        finally:
+            email_metrics.queue_left()
         
         return jsonify({
             'success': True,
@@ -186,6 +213,15 @@ def health_check():
         'timestamp': datetime.now().isoformat()
     })
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Queue depth, send latency histograms, counters and throughput"""
+    return jsonify({
+        'service': 'IT Helpdesk Email Notifications',
+        'timestamp': datetime.now().isoformat(),
+        **email_metrics.snapshot()
+    })
+
 @app.route('/', methods=['GET'])
 def index():
     """API information endpoint"""
@@ -194,9 +230,11 @@ def index():
         'version': '1.0.0',
         'endpoints': {
             'POST /submit_ticket': 'Submit a new ticket and send email notifications',
-            'GET /health': 'Health check endpoint'
+            'GET /health': 'Health check endpoint',
+            'GET /metrics': 'Send latency histograms, counters and throughput'
         },
-        'required_fields': ['name', 'email', 'subject', 'description']
+        'required_fields': ['name', 'email', 'subject', 'description'],
+        'optional_fields': ['priority', 'category']
     })
 
 if __name__ == '__main__':
@@ -205,13 +243,19 @@ if __name__ == '__main__':
         print("❌ Error: MAIL_USERNAME and MAIL_PASSWORD must be set in environment variables")
         exit(1)
     
-    if not get_notification_emails():
+    routing_table = get_routing_table()
+    if not routing_table['default']:
         print("❌ Error: NOTIFY_EMAILS must be set in environment variables")
         exit(1)
     
+    # Reload recipient routes with: kill -HUP <pid>
+    reload_enabled = install_reload_handler()
+    
     print("🚀 Starting IT Helpdesk Email Notification System...")
     print(f"📧 Email server: {app.config['MAIL_SERVER']}:{app.config['MAIL_PORT']}")
     print(f"👤 Sender: {app.config['MAIL_DEFAULT_SENDER']}")
-    print(f"📬 Notification emails: {len(get_notification_emails())} configured")
+    print(f"📬 Notification emails: {len(routing_table['default'])} configured")
+    print(f"🔀 Routes: {len(routing_table['priority_routes'])} priority, {len(routing_table['category_routes'])} category"
+          f"{' (SIGHUP reload enabled)' if reload_enabled else ''}")
     
     app.run(debug=True, host='0.0.0.0', port=5001)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+HTTP client for the main app -> email notification service hop
+Reuses pooled keep-alive connections, uses short timeouts and stops calling
+the email service through a circuit breaker while it is failing
+"""
+
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_EMAIL_SERVICE_URL = "https://it-helpdesk-email.onrender.com/submit_ticket"
+
+# Circuit breaker states
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker
+
+    CLOSED: calls go through. After failure_threshold consecutive failures the
+    circuit OPENs and calls are skipped for reset_timeout seconds. Then one
+    HALF_OPEN trial call is allowed: success closes the circuit, failure
+    re-opens it.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.lock = threading.Lock()
+
+    def allow_request(self):
+        """Return True if a call may be made now"""
+        with self.lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                # Let exactly one trial call through
+                self.state = HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.state = CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+class EmailServiceClient:
+    """Pooled, circuit-broken client for POST /submit_ticket"""
+
+    def __init__(self, url=None, connect_timeout=None, read_timeout=None, pool_size=None,
+                 failure_threshold=None, reset_timeout=None):
+        self.url = url or os.getenv('EMAIL_SERVICE_URL', DEFAULT_EMAIL_SERVICE_URL)
+        self.timeout = (
+            connect_timeout if connect_timeout is not None else float(os.getenv('EMAIL_SERVICE_CONNECT_TIMEOUT', 2)),
+            read_timeout if read_timeout is not None else float(os.getenv('EMAIL_SERVICE_READ_TIMEOUT', 5))
+        )
+        pool_size = pool_size or int(os.getenv('EMAIL_SERVICE_POOL_SIZE', 10))
+
+        self.breaker = CircuitBreaker(
+            failure_threshold or int(os.getenv('EMAIL_SERVICE_FAILURE_THRESHOLD', 5)),
+            reset_timeout if reset_timeout is not None else float(os.getenv('EMAIL_SERVICE_RESET_TIMEOUT', 30))
+        )
+
+        # Keep-alive connections shared by all request threads; no retries so
+        # a slow email service never holds a request thread for long
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0, pool_block=False)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
+
+    def submit_ticket(self, ticket_data):
+        """Post a ticket notification; returns (sent, message) and never raises"""
+        if not self.breaker.allow_request():
+            return False, "circuit open, email service skipped"
+
+        try:
+            response = self.session.post(self.url, json=ticket_data, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            self.breaker.record_failure()
+            return False, f"{type(e).__name__}: {e}"
+
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+            return False, f"{response.status_code} - {response.text}"
+
+        # 4xx means the service is up but rejected the payload
+        self.breaker.record_success()
+        if response.status_code != 200:
+            return False, f"{response.status_code} - {response.text}"
+        return True, "sent"
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_email_service_client():
+    """Return the process-wide email service client"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = EmailServiceClient()
+    return _client
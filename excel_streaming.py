@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Streaming Excel writer for the daily and comprehensive logs and the knowledge base
+Workbooks are written with openpyxl's write-only mode: rows are streamed to
+disk as they are appended and every cell references one of the named styles
+below instead of carrying its own font/fill/border objects, so memory stays
+bounded however many tickets are exported.
+"""
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+HEADER_COLOR = "366092"
+KB_HEADER_COLOR = "2E8B57"  # Sea Green, the knowledge base colour
+
+# Named style names
+LOG_HEADER = 'Log Header'        # header row of the log sheets
+LOG_DATA = 'Log Data'            # wrapped, bordered ticket rows
+SHEET_HEADER = 'Sheet Header'    # header row of the summary sheets
+DAILY_HEADER = 'Daily Header'    # header row of the plain daily log
+DAILY_DATA = 'Daily Data'        # bordered cells of the plain daily log
+KB_HEADER = 'KB Header'          # header row of the knowledge base sheets
+KB_DATA = 'KB Data'              # wrapped, bordered knowledge base rows
+KB_DATA_SMALL = 'KB Data Small'  # same in 9pt, for the wide playbook sheet
+
+def _thin_border():
+    return Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+
+def _header_fill(color=HEADER_COLOR):
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+def build_named_styles():
+    """Create the named styles shared by all helpdesk workbooks"""
+    log_header = NamedStyle(name=LOG_HEADER)
+    log_header.font = Font(bold=True, color="FFFFFF", size=12)
+    log_header.fill = _header_fill()
+    log_header.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    log_header.border = _thin_border()
+
+    log_data = NamedStyle(name=LOG_DATA)
+    log_data.font = Font(size=10)
+    log_data.alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
+    log_data.border = _thin_border()
+
+    sheet_header = NamedStyle(name=SHEET_HEADER)
+    sheet_header.font = Font(bold=True, color="FFFFFF", size=12)
+    sheet_header.fill = _header_fill()
+    sheet_header.alignment = Alignment(horizontal="center", vertical="center")
+
+    daily_header = NamedStyle(name=DAILY_HEADER)
+    daily_header.font = Font(bold=True, color="FFFFFF")
+    daily_header.fill = _header_fill()
+    daily_header.alignment = Alignment(horizontal="center", vertical="center")
+    daily_header.border = _thin_border()
+
+    daily_data = NamedStyle(name=DAILY_DATA)
+    daily_data.border = _thin_border()
+
+    kb_header = NamedStyle(name=KB_HEADER)
+    kb_header.font = Font(bold=True, color="FFFFFF", size=12)
+    kb_header.fill = _header_fill(KB_HEADER_COLOR)
+    kb_header.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    kb_header.border = _thin_border()
+
+    kb_data = NamedStyle(name=KB_DATA)
+    kb_data.font = Font(size=10)
+    kb_data.alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
+    kb_data.border = _thin_border()
+
+    kb_data_small = NamedStyle(name=KB_DATA_SMALL)
+    kb_data_small.font = Font(size=9)
+    kb_data_small.alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
+    kb_data_small.border = _thin_border()
+
+    return [log_header, log_data, sheet_header, daily_header, daily_data, kb_header, kb_data, kb_data_small]
+
+def add_named_styles(workbook):
+    """Register the named styles on a workbook (skipping any it already has)"""
+    existing = set(workbook.named_styles)
+    for style in build_named_styles():
+        if style.name not in existing:
+            workbook.add_named_style(style)
+    return workbook
+
+def new_workbook():
+    """Create a write-only workbook with the named styles registered"""
+    return add_named_styles(Workbook(write_only=True))
+
+def frame_rows(df, index=False):
+    """Yield DataFrame rows as plain value lists (NaN becomes an empty cell)"""
+    for record in df.itertuples(index=index):
+        yield [None if pd.isna(value) else value for value in record]
+
+def auto_column_widths(header, df, cap=50):
+    """Column widths fitted to the longest value of each column, like the old auto-width pass"""
+    widths = []
+    for name in header:
+        lengths = df[name].astype(str).str.len() if len(df) else pd.Series([0])
+        widths.append(min(max(len(str(name)), int(lengths.max())) + 2, cap))
+    return widths
+
+def _append(worksheet, values, style, write_only):
+    """Append one row with every cell in a named style"""
+    if write_only:
+        if not style:
+            worksheet.append(list(values))
+            return
+        row = []
+        for value in values:
+            cell = WriteOnlyCell(worksheet, value=value)
+            cell.style = style
+            row.append(cell)
+        worksheet.append(row)
+        return
+
+    worksheet.append(list(values))
+    if style:
+        for cell in worksheet[worksheet.max_row]:
+            cell.style = style
+
+def write_sheet(workbook, title, header, rows, column_widths=None, header_style=SHEET_HEADER,
+                data_style=None, row_height=None, freeze_header=False):
+    """Create a sheet and stream the header and rows into it; returns the number of data rows
+
+    column_widths is a list (one width per column) or a {letter: width} dict.
+    row_height applies to every data row via the sheet's default row height.
+    Works on write-only workbooks and on normal (loaded) workbooks alike.
+    """
+    worksheet = workbook.create_sheet(title)
+
+    # Sheet layout has to be set before the first row is streamed
+    if isinstance(column_widths, dict):
+        for letter, width in column_widths.items():
+            worksheet.column_dimensions[letter].width = width
+    elif column_widths:
+        for index, width in enumerate(column_widths, start=1):
+            worksheet.column_dimensions[get_column_letter(index)].width = width
+    if row_height:
+        worksheet.sheet_format.defaultRowHeight = row_height
+        worksheet.sheet_format.customHeight = True
+        worksheet.row_dimensions[1].height = 30
+    if freeze_header:
+        worksheet.freeze_panes = 'A2'
+
+    _append(worksheet, header, header_style, workbook.write_only)
+    count = 0
+    for values in rows:
+        _append(worksheet, values, data_style, workbook.write_only)
+        count += 1
+    return count
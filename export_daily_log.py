@@ -3,11 +3,17 @@
 Export all tickets from database to Excel daily log file
 """
 
+import argparse
 import pandas as pd
 import requests
 import os
 from datetime import datetime
 from dotenv import load_dotenv
+from ticket_snapshot import add_snapshot_argument, snapshot_executor
+from ticket_classifier import stored_classification
+from ticket_aggregates import aggregate_tickets, summary_frame
+from excel_streaming import DAILY_DATA, DAILY_HEADER, add_named_styles, auto_column_widths, frame_rows, new_workbook, write_sheet
+from daily_log_incremental import changed_since_clause, load_state, merge_rows, open_workbook, replace_sheets, save_state, sheet_dataframe, state_path
 
 # Load environment variables
 load_dotenv()
@@ -16,6 +22,9 @@ load_dotenv()
 API_KEY = os.getenv('SQLITECLOUD_API_KEY')
 API_URL = os.getenv('SQLITECLOUD_URL')
 
+# High-water mark of the last export, for --incremental
+STATE_FILE = state_path('export_daily_log')
+
 headers = {
     'Authorization': f'Bearer {API_KEY}',
     'Content-Type': 'application/json'
@@ -39,9 +48,9 @@ def execute_query(query):
         print(f"❌ Error: {e}")
         return None
 
-def get_all_tickets():
-    """Get all tickets from database"""
-    query = '''
+def get_all_tickets(state=None):
+    """Get all tickets from database, or only those changed since the exported state"""
+    query = f'''
         USE DATABASE 'my-database';
         SELECT 
             id as TicketID,
@@ -52,22 +61,19 @@ def get_all_tickets():
             priority as Priority,
             status as Status,
             issue as FullDescription,
-            notes as ResolutionNotes
+            notes as ResolutionNotes,
+            kb_article as KBArticleLinked,
+            updated_at
         FROM tickets 
-        ORDER BY id
+        {changed_since_clause(state) if state else ''}
+        ORDER BY created_at, id
     '''
     
     tickets = execute_query(query)
     return tickets
 
-def create_daily_log_excel(tickets):
-    """Create Excel file with daily log of all tickets"""
-    
-    # Get current date for filename
-    current_date = datetime.now().strftime("%Y%m%d")
-    filename = f"IT_Helpdesk_Daily_Log_{current_date}.xlsx"
-    
-    print(f"📊 Creating daily log: {filename}")
+def build_daily_log_frame(tickets):
+    """Build the Daily Log rows for a list of tickets"""
     
     # Create DataFrame
     df = pd.DataFrame(tickets)
@@ -75,7 +81,7 @@ def create_daily_log_excel(tickets):
     # Add calculated columns
     df['BriefSummary'] = df['FullDescription'].str[:50] + "..."
     df['IncidentCategory'] = 'Account / Authentication'  # Based on your Excel data
-    df['KBArticleLinked'] = df.apply(get_kb_article, axis=1)
+    df['KBArticleLinked'] = stored_classification(df['KBArticleLinked'], df['FullDescription'], 'kb_article')
     df['ResolutionDate'] = df['DateOpened']  # Assuming resolved on same day
     df['TimeToResolve'] = 'Same Day'
     
@@ -89,171 +95,115 @@ def create_daily_log_excel(tickets):
     
     df = df[column_order]
     
-    # Create Excel writer with formatting
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        # Write main data
-        df.to_excel(writer, sheet_name='Daily Log', index=False)
-        
-        # Get the workbook and worksheet
-        workbook = writer.book
-        worksheet = writer.sheets['Daily Log']
-        
-        # Apply formatting
-        format_excel_sheet(workbook, worksheet, df)
-        
-        # Create summary sheet
-        create_summary_sheet(workbook, df)
+    return df
+
+def create_daily_log_excel(tickets):
+    """Create Excel file with daily log of all tickets"""
+    
+    # Get current date for filename
+    current_date = datetime.now().strftime("%Y%m%d")
+    filename = f"IT_Helpdesk_Daily_Log_{current_date}.xlsx"
+    
+    print(f"📊 Creating daily log: {filename}")
+    
+    df = build_daily_log_frame(tickets)
+    
+    # Stream the sheets to a write-only workbook with named styles
+    workbook = new_workbook()
+    write_daily_log_sheet(workbook, df)
+    
+    # Create summary sheet
+    create_summary_sheet(workbook, df)
+    
+    workbook.save(filename)
     
     print(f"✅ Daily log created successfully: {filename}")
     return filename
 
-def get_kb_article(row):
-    """Determine KB article based on issue type"""
-    issue = str(row['FullDescription']).lower()
-    
-    if 'password' in issue and 'forgotten' in issue:
-        return 'KB_Password_Reset'
-    elif 'lockout' in issue or 'locked' in issue:
-        return 'KB_Password_Reset'
-    elif 'disabled' in issue:
-        return 'KB_Account_Enable'
-    elif 'outlook' in issue or 'authentication' in issue:
-        return 'KB_MFA_Reset'
-    elif 'mfa' in issue and 'lost' in issue:
-        return 'KB_MFA_Reset'
-    elif 'temporary' in issue and 'contractor' in issue:
-        return 'KB_Temp_Account'
-    elif 'suspicious' in issue or 'unknown' in issue:
-        return 'KB_Security_Check'
-    elif 'expired' in issue:
-        return 'KB_Password_Reset'
-    else:
-        return 'KB_General_Support'
-
-def format_excel_sheet(workbook, worksheet, df):
-    """Apply formatting to the Excel sheet"""
+def update_daily_log_excel(tickets, state):
+    """Apply changed tickets to the last exported workbook instead of rebuilding it"""
     
-    from openpyxl.styles import Font, PatternFill, Alignment
+    # Get current date for filename
+    current_date = datetime.now().strftime("%Y%m%d")
+    filename = f"IT_Helpdesk_Daily_Log_{current_date}.xlsx"
     
-    # Define styles
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center")
+    print(f"📊 Updating daily log {state['workbook']} -> {filename}")
     
-    # Apply header formatting
-    for cell in worksheet[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
+    workbook = add_named_styles(open_workbook(state))
+    worksheet = workbook['Daily Log']
+    updated_count, appended_count = merge_rows(worksheet, build_daily_log_frame(tickets))
     
-    # Auto-adjust column widths
-    for column in worksheet.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        
-        adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-        worksheet.column_dimensions[column_letter].width = adjusted_width
+    # Rebuild the summary from the merged log
+    replace_sheets(workbook, ['Summary'])
+    create_summary_sheet(workbook, sheet_dataframe(worksheet))
+    workbook.save(filename)
     
-    # Add borders to all cells
-    from openpyxl.styles import Border, Side
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
+    print(f"✅ Daily log updated: {updated_count} tickets changed, {appended_count} added")
+    return filename
+
+def write_daily_log_sheet(workbook, df):
+    """Stream the Daily Log sheet with bordered cells and auto-fitted column widths"""
+    write_sheet(
+        workbook, 'Daily Log', list(df.columns), frame_rows(df),
+        column_widths=auto_column_widths(df.columns, df),  # Cap at 50 characters
+        header_style=DAILY_HEADER,
+        data_style=DAILY_DATA
     )
-    
-    for row in worksheet.iter_rows():
-        for cell in row:
-            cell.border = thin_border
 
 def create_summary_sheet(workbook, df):
     """Create a summary statistics sheet"""
     
     # Create summary data
-    summary_data = {
-        'Metric': [
-            'Total Tickets',
-            'Resolved Tickets',
-            'Open Tickets',
-            'In Progress Tickets',
-            'High Priority Tickets',
-            'Medium Priority Tickets',
-            'Low Priority Tickets',
-            'Tickets by Azola Xabadiya',
-            'Tickets by Keawin Koesnel',
-            'Tickets by System Admin',
-            'Unassigned Tickets'
-        ],
-        'Count': [
-            len(df),
-            len(df[df['Status'] == 'Resolved']),
-            len(df[df['Status'] == 'Open']),
-            len(df[df['Status'] == 'In Progress']),
-            len(df[df['Priority'] == 'High']),
-            len(df[df['Priority'] == 'Medium']),
-            len(df[df['Priority'] == 'Low']),
-            len(df[df['AssignedAgent'] == 'Azola Xabadiya']),
-            len(df[df['AssignedAgent'] == 'Keawin Koesnel']),
-            len(df[df['AssignedAgent'] == 'System Admin']),
-            len(df[df['AssignedAgent'] == 'Unassigned'])
-        ]
-    }
-    
-    summary_df = pd.DataFrame(summary_data)
+    summary_df = summary_frame(aggregate_tickets(df))
     
     # Write summary to new sheet
-    with pd.ExcelWriter('temp_summary.xlsx', engine='openpyxl') as temp_writer:
-        summary_df.to_excel(temp_writer, sheet_name='Summary', index=False)
-        temp_workbook = temp_writer.book
-        temp_worksheet = temp_writer.sheets['Summary']
-    
-    # Copy summary sheet to main workbook
-    summary_sheet = workbook.create_sheet('Summary')
-    
-    # Copy data
-    for row in temp_worksheet.iter_rows():
-        for cell in row:
-            new_cell = summary_sheet.cell(row=cell.row, column=cell.column, value=cell.value)
-            if cell.has_style:
-                new_cell.font = cell.font
-                new_cell.fill = cell.fill
-                new_cell.border = cell.border
-                new_cell.alignment = cell.alignment
-    
-    # Clean up temp file
-    os.remove('temp_summary.xlsx')
+    write_sheet(workbook, 'Summary', list(summary_df.columns), frame_rows(summary_df), header_style=None)
 
 def main():
+    global execute_query
+    parser = argparse.ArgumentParser(description='Export tickets to the Excel daily log')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only fetch tickets added or changed since the last export and update its workbook')
+    add_snapshot_argument(parser)
+    args = parser.parse_args()
+    
+    # Read from the local snapshot instead of SQLiteCloud
+    if args.snapshot:
+        execute_query = snapshot_executor(args.snapshot)
+    
     print("📊 IT Helpdesk Daily Log Export Tool")
     print("====================================")
     print()
     
+    state = load_state(STATE_FILE) if args.incremental else None
+    if args.incremental and not state:
+        print("⚠️ No previous export found, running a full export")
+    
     # Get all tickets
-    print("🔍 Retrieving all tickets from database...")
-    tickets = get_all_tickets()
+    if state:
+        print(f"🔍 Retrieving tickets changed since ticket #{state['last_id']}...")
+    else:
+        print("🔍 Retrieving all tickets from database...")
+    tickets = get_all_tickets(state)
     
-    if not tickets:
+    if tickets is None or (not tickets and not state):
         print("❌ No tickets found in database")
         return
     
     print(f"📋 Found {len(tickets)} tickets to export")
     print()
     
-    # Create Excel file
-    filename = create_daily_log_excel(tickets)
+    # Create or update Excel file
+    if state:
+        filename = update_daily_log_excel(tickets, state) if tickets else state['workbook']
+    else:
+        filename = create_daily_log_excel(tickets)
+    save_state(STATE_FILE, filename, tickets, state)
     
     print()
     print("📈 Export Summary:")
-    print(f"   📄 File created: {filename}")
-    print(f"   🎫 Total tickets: {len(tickets)}")
+    print(f"   📄 File {'updated' if state else 'created'}: {filename}")
+    print(f"   🎫 {'Changed' if state else 'Total'} tickets: {len(tickets)}")
     print(f"   📊 Sheets included: Daily Log, Summary")
     print(f"   🎨 Formatting: Headers, borders, auto-width")
     
@@ -3,13 +3,17 @@
 Export all tickets from database to Excel daily log file with proper formatting
 """
 
+import argparse
 import pandas as pd
 import requests
 import os
 from datetime import datetime
 from dotenv import load_dotenv
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from ticket_snapshot import add_snapshot_argument, snapshot_executor
+from ticket_classifier import stored_classification
+from daily_log_incremental import changed_since_clause, load_state, merge_rows, open_workbook, replace_sheets, save_state, sheet_dataframe, state_path
+from ticket_aggregates import aggregate_tickets, summary_frame
+from excel_streaming import LOG_DATA, LOG_HEADER, add_named_styles, frame_rows, new_workbook, write_sheet
 
 # Load environment variables
 load_dotenv()
@@ -18,6 +22,9 @@ load_dotenv()
 API_KEY = os.getenv('SQLITECLOUD_API_KEY')
 API_URL = os.getenv('SQLITECLOUD_URL')
 
+# High-water mark of the last export, for --incremental
+STATE_FILE = state_path('export_daily_log_formatted')
+
 headers = {
     'Authorization': f'Bearer {API_KEY}',
     'Content-Type': 'application/json'
@@ -41,9 +48,9 @@ def execute_query(query):
         print(f"❌ Error: {e}")
         return None
 
-def get_all_tickets():
-    """Get all tickets from database"""
-    query = '''
+def get_all_tickets(state=None):
+    """Get all tickets from database, or only those changed since the exported state"""
+    query = f'''
         USE DATABASE 'my-database';
         SELECT 
             id as TicketID,
@@ -54,45 +61,19 @@ def get_all_tickets():
             priority as Priority,
             status as Status,
             issue as FullDescription,
-            notes as ResolutionNotes
+            notes as ResolutionNotes,
+            kb_article as KBArticleLinked,
+            updated_at
         FROM tickets 
-        ORDER BY id
+        {changed_since_clause(state) if state else ''}
+        ORDER BY created_at, id
     '''
     
     tickets = execute_query(query)
     return tickets
 
-def get_kb_article(issue):
-    """Determine KB article based on issue type"""
-    issue_lower = str(issue).lower()
-    
-    if 'password' in issue_lower and 'forgotten' in issue_lower:
-        return 'KB_Password_Reset'
-    elif 'lockout' in issue_lower or 'locked' in issue_lower:
-        return 'KB_Password_Reset'
-    elif 'disabled' in issue_lower:
-        return 'KB_Account_Enable'
-    elif 'outlook' in issue_lower or 'authentication' in issue_lower:
-        return 'KB_MFA_Reset'
-    elif 'mfa' in issue_lower and 'lost' in issue_lower:
-        return 'KB_MFA_Reset'
-    elif 'temporary' in issue_lower and 'contractor' in issue_lower:
-        return 'KB_Temp_Account'
-    elif 'suspicious' in issue_lower or 'unknown' in issue_lower:
-        return 'KB_Security_Check'
-    elif 'expired' in issue_lower:
-        return 'KB_Password_Reset'
-    else:
-        return 'KB_General_Support'
-
-def create_daily_log_excel(tickets):
-    """Create Excel file with daily log of all tickets with proper formatting"""
-    
-    # Get current date for filename
-    current_date = datetime.now().strftime("%Y%m%d")
-    filename = f"IT_Helpdesk_Daily_Log_Formatted_{current_date}.xlsx"
-    
-    print(f"📊 Creating formatted daily log: {filename}")
+def build_daily_log_frame(tickets):
+    """Build the Daily Log rows for a list of tickets"""
     
     # Create DataFrame
     df = pd.DataFrame(tickets)
@@ -100,7 +81,7 @@ def create_daily_log_excel(tickets):
     # Add calculated columns
     df['BriefSummary'] = df['FullDescription'].str[:80] + "..."  # Longer summary
     df['IncidentCategory'] = 'Account / Authentication'
-    df['KBArticleLinked'] = df['FullDescription'].apply(get_kb_article)
+    df['KBArticleLinked'] = stored_classification(df['KBArticleLinked'], df['FullDescription'], 'kb_article')
     df['ResolutionDate'] = df['DateOpened']
     df['TimeToResolve'] = 'Same Day'
     
@@ -114,217 +95,152 @@ def create_daily_log_excel(tickets):
     
     df = df[column_order]
     
-    # Create Excel file with proper formatting
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        # Main daily log sheet
-        df.to_excel(writer, sheet_name='Daily Log', index=False)
-        
-        # Get the workbook and worksheet
-        workbook = writer.book
-        worksheet = writer.sheets['Daily Log']
-        
-        # Apply formatting
-        format_excel_sheet(workbook, worksheet, df)
-        
-        # Create summary statistics
-        create_summary_sheet(workbook, df)
-        
-        # Create agent workload sheet
-        create_agent_workload_sheet(workbook, df)
+    return df
+
+# Daily Log column widths, in column_order
+DAILY_LOG_COLUMN_WIDTHS = [
+    8,   # TicketID
+    12,  # DateOpened
+    20,  # ReporterName
+    25,  # ReporterContact
+    18,  # AssignedAgent
+    20,  # IncidentCategory
+    10,  # Priority
+    30,  # BriefSummary
+    50,  # FullDescription
+    12,  # Status
+    60,  # ResolutionNotes
+    18,  # KBArticleLinked
+    12,  # ResolutionDate
+    15   # TimeToResolve
+]
+
+def create_daily_log_excel(tickets):
+    """Create Excel file with daily log of all tickets with proper formatting"""
+    
+    # Get current date for filename
+    current_date = datetime.now().strftime("%Y%m%d")
+    filename = f"IT_Helpdesk_Daily_Log_Formatted_{current_date}.xlsx"
+    
+    print(f"📊 Creating formatted daily log: {filename}")
+    
+    df = build_daily_log_frame(tickets)
+    
+    # Stream the sheets to a write-only workbook with named styles
+    workbook = new_workbook()
+    write_daily_log_sheet(workbook, df)
+    
+    # Aggregate once for both summary sheets
+    aggregates = aggregate_tickets(df)
+    
+    # Create summary statistics
+    create_summary_sheet(workbook, aggregates)
+    
+    # Create agent workload sheet
+    create_agent_workload_sheet(workbook, aggregates)
+    
+    workbook.save(filename)
     
     print(f"✅ Formatted daily log created successfully: {filename}")
     return filename
 
-def format_excel_sheet(workbook, worksheet, df):
-    """Apply comprehensive formatting to the Excel sheet"""
-    
-    # Define styles
-    header_font = Font(bold=True, color="FFFFFF", size=12)
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    
-    data_font = Font(size=10)
-    data_alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
-    
-    # Border styles
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+def update_daily_log_excel(tickets, state):
+    """Apply changed tickets to the last exported workbook instead of rebuilding it"""
+    
+    # Get current date for filename
+    current_date = datetime.now().strftime("%Y%m%d")
+    filename = f"IT_Helpdesk_Daily_Log_Formatted_{current_date}.xlsx"
+    
+    print(f"📊 Updating formatted daily log {state['workbook']} -> {filename}")
     
-    # Apply header formatting
-    for cell in worksheet[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
-    
-    # Apply data formatting and set column widths
-    column_widths = {
-        'A': 8,   # TicketID
-        'B': 12,  # DateOpened
-        'C': 20,  # ReporterName
-        'D': 25,  # ReporterContact
-        'E': 18,  # AssignedAgent
-        'F': 20,  # IncidentCategory
-        'G': 10,  # Priority
-        'H': 30,  # BriefSummary
-        'I': 50,  # FullDescription
-        'J': 12,  # Status
-        'K': 60,  # ResolutionNotes
-        'L': 18,  # KBArticleLinked
-        'M': 12,  # ResolutionDate
-        'N': 15   # TimeToResolve
-    }
-    
-    # Set column widths
-    for col_letter, width in column_widths.items():
-        worksheet.column_dimensions[col_letter].width = width
-    
-    # Apply formatting to all data cells
-    for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-        for cell in row:
-            cell.font = data_font
-            cell.alignment = data_alignment
-            cell.border = thin_border
-    
-    # Set row heights for better readability
-    for row in range(2, worksheet.max_row + 1):
-        worksheet.row_dimensions[row].height = 60  # Increased row height
-    
-    # Freeze the header row
-    worksheet.freeze_panes = 'A2'
+    workbook = add_named_styles(open_workbook(state))
+    worksheet = workbook['Daily Log']
+    updated_count, appended_count = merge_rows(worksheet, build_daily_log_frame(tickets))
+    
+    # Rebuild the summary sheets from the merged log
+    aggregates = aggregate_tickets(sheet_dataframe(worksheet))
+    replace_sheets(workbook, ['Summary', 'Agent Workload'])
+    create_summary_sheet(workbook, aggregates)
+    create_agent_workload_sheet(workbook, aggregates)
+    workbook.save(filename)
+    
+    print(f"✅ Formatted daily log updated: {updated_count} tickets changed, {appended_count} added")
+    return filename
 
-def create_summary_sheet(workbook, df):
+def write_daily_log_sheet(workbook, df):
+    """Stream the Daily Log sheet with header/data named styles and fixed column widths"""
+    write_sheet(
+        workbook, 'Daily Log', list(df.columns), frame_rows(df),
+        column_widths=DAILY_LOG_COLUMN_WIDTHS,
+        header_style=LOG_HEADER,
+        data_style=LOG_DATA,
+        row_height=60,  # Increased row height
+        freeze_header=True
+    )
+
+def create_summary_sheet(workbook, aggregates):
     """Create a summary statistics sheet"""
     
-    summary_data = {
-        'Metric': [
-            'Total Tickets',
-            'Resolved Tickets',
-            'Open Tickets',
-            'In Progress Tickets',
-            'High Priority Tickets',
-            'Medium Priority Tickets',
-            'Low Priority Tickets',
-            'Tickets by Azola Xabadiya',
-            'Tickets by Keawin Koesnel',
-            'Tickets by System Admin',
-            'Unassigned Tickets'
-        ],
-        'Count': [
-            len(df),
-            len(df[df['Status'] == 'Resolved']),
-            len(df[df['Status'] == 'Open']),
-            len(df[df['Status'] == 'In Progress']),
-            len(df[df['Priority'] == 'High']),
-            len(df[df['Priority'] == 'Medium']),
-            len(df[df['Priority'] == 'Low']),
-            len(df[df['AssignedAgent'] == 'Azola Xabadiya']),
-            len(df[df['AssignedAgent'] == 'Keawin Koesnel']),
-            len(df[df['AssignedAgent'] == 'System Admin']),
-            len(df[df['AssignedAgent'] == 'Unassigned'])
-        ]
-    }
-    
-    summary_df = pd.DataFrame(summary_data)
+    summary_df = summary_frame(aggregates)
     
     # Create summary sheet
-    summary_sheet = workbook.create_sheet('Summary')
-    
-    # Add data to summary sheet
-    for r in dataframe_to_rows(summary_df, index=False, header=True):
-        summary_sheet.append(r)
-    
-    # Format summary sheet
-    format_summary_sheet(summary_sheet)
+    write_sheet(workbook, 'Summary', list(summary_df.columns), frame_rows(summary_df),
+                column_widths=[30, 15])
 
-def create_agent_workload_sheet(workbook, df):
+def create_agent_workload_sheet(workbook, aggregates):
     """Create an agent workload sheet"""
     
-    agent_workload = df.groupby('AssignedAgent').agg({
-        'TicketID': 'count',
-        'Priority': lambda x: (x == 'High').sum(),
-        'Status': lambda x: (x == 'Resolved').sum()
-    }).rename(columns={
-        'TicketID': 'Total_Tickets',
-        'Priority': 'High_Priority',
-        'Status': 'Resolved_Tickets'
-    })
+    agent_workload = aggregates['agent_workload']
     
     # Create agent workload sheet
-    workload_sheet = workbook.create_sheet('Agent Workload')
-    
-    # Add data to workload sheet
-    for r in dataframe_to_rows(agent_workload, index=True, header=True):
-        workload_sheet.append(r)
-    
-    # Format workload sheet
-    format_workload_sheet(workload_sheet)
-
-def format_summary_sheet(worksheet):
-    """Format the summary sheet"""
-    
-    # Header formatting
-    header_font = Font(bold=True, color="FFFFFF", size=12)
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center")
-    
-    # Apply header formatting
-    for cell in worksheet[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-    
-    # Set column widths
-    worksheet.column_dimensions['A'].width = 30
-    worksheet.column_dimensions['B'].width = 15
-
-def format_workload_sheet(worksheet):
-    """Format the agent workload sheet"""
-    
-    # Header formatting
-    header_font = Font(bold=True, color="FFFFFF", size=12)
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center")
-    
-    # Apply header formatting
-    for cell in worksheet[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-    
-    # Set column widths
-    worksheet.column_dimensions['A'].width = 20
-    worksheet.column_dimensions['B'].width = 15
-    worksheet.column_dimensions['C'].width = 15
-    worksheet.column_dimensions['D'].width = 15
+    write_sheet(workbook, 'Agent Workload', ['AssignedAgent'] + list(agent_workload.columns),
+                frame_rows(agent_workload, index=True), column_widths=[20, 15, 15, 15])
 
 def main():
+    global execute_query
+    parser = argparse.ArgumentParser(description='Export tickets to the formatted Excel daily log')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only fetch tickets added or changed since the last export and update its workbook')
+    add_snapshot_argument(parser)
+    args = parser.parse_args()
+    
+    # Read from the local snapshot instead of SQLiteCloud
+    if args.snapshot:
+        execute_query = snapshot_executor(args.snapshot)
+    
     print("📊 IT Helpdesk Formatted Daily Log Export Tool")
     print("==============================================")
     print()
     
+    state = load_state(STATE_FILE) if args.incremental else None
+    if args.incremental and not state:
+        print("⚠️ No previous export found, running a full export")
+    
     # Get all tickets
-    print("🔍 Retrieving all tickets from database...")
-    tickets = get_all_tickets()
+    if state:
+        print(f"🔍 Retrieving tickets changed since ticket #{state['last_id']}...")
+    else:
+        print("🔍 Retrieving all tickets from database...")
+    tickets = get_all_tickets(state)
     
-    if not tickets:
+    if tickets is None or (not tickets and not state):
         print("❌ No tickets found in database")
         return
     
     print(f"📋 Found {len(tickets)} tickets to export")
     print()
     
-    # Create Excel file
-    filename = create_daily_log_excel(tickets)
+    # Create or update Excel file
+    if state:
+        filename = update_daily_log_excel(tickets, state) if tickets else state['workbook']
+    else:
+        filename = create_daily_log_excel(tickets)
+    save_state(STATE_FILE, filename, tickets, state)
     
     print()
     print("📈 Export Summary:")
-    print(f"   📄 File created: {filename}")
-    print(f"   🎫 Total tickets: {len(tickets)}")
+    print(f"   📄 File {'updated' if state else 'created'}: {filename}")
+    print(f"   🎫 {'Changed' if state else 'Total'} tickets: {len(tickets)}")
     print(f"   📊 Sheets included: Daily Log, Summary, Agent Workload")
     print(f"   🎨 Formatting: Headers, borders, proper column widths, row heights")
     
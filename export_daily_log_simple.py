@@ -3,11 +3,16 @@
 Export all tickets from database to Excel daily log file (Simplified)
 """
 
+import argparse
 import pandas as pd
 import requests
 import os
 from datetime import datetime
 from dotenv import load_dotenv
+from ticket_snapshot import add_snapshot_argument, snapshot_executor
+from ticket_classifier import stored_classification
+from ticket_aggregates import aggregate_tickets, summary_frame
+from daily_log_incremental import changed_since_clause, load_state, merge_rows, open_workbook, save_state, sheet_dataframe, state_path
 
 # Load environment variables
 load_dotenv()
@@ -16,6 +21,9 @@ load_dotenv()
 API_KEY = os.getenv('SQLITECLOUD_API_KEY')
 API_URL = os.getenv('SQLITECLOUD_URL')
 
+# High-water mark of the last export, for --incremental
+STATE_FILE = state_path('export_daily_log_simple')
+
 headers = {
     'Authorization': f'Bearer {API_KEY}',
     'Content-Type': 'application/json'
@@ -39,9 +47,9 @@ def execute_query(query):
         print(f"❌ Error: {e}")
         return None
 
-def get_all_tickets():
-    """Get all tickets from database"""
-    query = '''
+def get_all_tickets(state=None):
+    """Get all tickets from database, or only those changed since the exported state"""
+    query = f'''
         USE DATABASE 'my-database';
         SELECT 
             id as TicketID,
@@ -52,45 +60,19 @@ def get_all_tickets():
             priority as Priority,
             status as Status,
             issue as FullDescription,
-            notes as ResolutionNotes
+            notes as ResolutionNotes,
+            kb_article as KBArticleLinked,
+            updated_at
         FROM tickets 
-        ORDER BY id
+        {changed_since_clause(state) if state else ''}
+        ORDER BY created_at, id
     '''
     
     tickets = execute_query(query)
     return tickets
 
-def get_kb_article(issue):
-    """Determine KB article based on issue type"""
-    issue_lower = str(issue).lower()
-    
-    if 'password' in issue_lower and 'forgotten' in issue_lower:
-        return 'KB_Password_Reset'
-    elif 'lockout' in issue_lower or 'locked' in issue_lower:
-        return 'KB_Password_Reset'
-    elif 'disabled' in issue_lower:
-        return 'KB_Account_Enable'
-    elif 'outlook' in issue_lower or 'authentication' in issue_lower:
-        return 'KB_MFA_Reset'
-    elif 'mfa' in issue_lower and 'lost' in issue_lower:
-        return 'KB_MFA_Reset'
-    elif 'temporary' in issue_lower and 'contractor' in issue_lower:
-        return 'KB_Temp_Account'
-    elif 'suspicious' in issue_lower or 'unknown' in issue_lower:
-        return 'KB_Security_Check'
-    elif 'expired' in issue_lower:
-        return 'KB_Password_Reset'
-    else:
-        return 'KB_General_Support'
-
-def create_daily_log_excel(tickets):
-    """Create Excel file with daily log of all tickets"""
-    
-    # Get current date for filename
-    current_date = datetime.now().strftime("%Y%m%d")
-    filename = f"IT_Helpdesk_Daily_Log_{current_date}.xlsx"
-    
-    print(f"📊 Creating daily log: {filename}")
+def build_daily_log_frame(tickets):
+    """Build the Daily Log rows for a list of tickets"""
     
     # Create DataFrame
     df = pd.DataFrame(tickets)
@@ -98,7 +80,7 @@ def create_daily_log_excel(tickets):
     # Add calculated columns
     df['BriefSummary'] = df['FullDescription'].str[:50] + "..."
     df['IncidentCategory'] = 'Account / Authentication'
-    df['KBArticleLinked'] = df['FullDescription'].apply(get_kb_article)
+    df['KBArticleLinked'] = stored_classification(df['KBArticleLinked'], df['FullDescription'], 'kb_article')
     df['ResolutionDate'] = df['DateOpened']
     df['TimeToResolve'] = 'Same Day'
     
@@ -112,83 +94,113 @@ def create_daily_log_excel(tickets):
     
     df = df[column_order]
     
+    return df
+
+def create_daily_log_excel(tickets):
+    """Create Excel file with daily log of all tickets"""
+    
+    # Get current date for filename
+    current_date = datetime.now().strftime("%Y%m%d")
+    filename = f"IT_Helpdesk_Daily_Log_{current_date}.xlsx"
+    
+    print(f"📊 Creating daily log: {filename}")
+    
+    df = build_daily_log_frame(tickets)
+    
     # Create Excel file with multiple sheets
     with pd.ExcelWriter(filename, engine='openpyxl') as writer:
         # Main daily log sheet
         df.to_excel(writer, sheet_name='Daily Log', index=False)
         
-        # Create summary statistics
-        summary_data = {
-            'Metric': [
-                'Total Tickets',
-                'Resolved Tickets',
-                'Open Tickets',
-                'In Progress Tickets',
-                'High Priority Tickets',
-                'Medium Priority Tickets',
-                'Low Priority Tickets',
-                'Tickets by Azola Xabadiya',
-                'Tickets by Keawin Koesnel',
-                'Tickets by System Admin',
-                'Unassigned Tickets'
-            ],
-            'Count': [
-                len(df),
-                len(df[df['Status'] == 'Resolved']),
-                len(df[df['Status'] == 'Open']),
-                len(df[df['Status'] == 'In Progress']),
-                len(df[df['Priority'] == 'High']),
-                len(df[df['Priority'] == 'Medium']),
-                len(df[df['Priority'] == 'Low']),
-                len(df[df['AssignedAgent'] == 'Azola Xabadiya']),
-                len(df[df['AssignedAgent'] == 'Keawin Koesnel']),
-                len(df[df['AssignedAgent'] == 'System Admin']),
-                len(df[df['AssignedAgent'] == 'Unassigned'])
-            ]
-        }
-        
-        summary_df = pd.DataFrame(summary_data)
+        # Summary statistics and agent workload
+        summary_df, agent_workload = build_summary_frames(df)
         summary_df.to_excel(writer, sheet_name='Summary', index=False)
-        
-        # Create agent workload sheet
-        agent_workload = df.groupby('AssignedAgent').agg({
-            'TicketID': 'count',
-            'Priority': lambda x: (x == 'High').sum(),
-            'Status': lambda x: (x == 'Resolved').sum()
-        }).rename(columns={
-            'TicketID': 'Total_Tickets',
-            'Priority': 'High_Priority',
-            'Status': 'Resolved_Tickets'
-        })
-        
         agent_workload.to_excel(writer, sheet_name='Agent Workload')
     
     print(f"✅ Daily log created successfully: {filename}")
     return filename
 
+def build_summary_frames(df):
+    """Build the Summary and Agent Workload tables for a Daily Log frame"""
+    
+    # One aggregation pass; agents are taken from the data
+    aggregates = aggregate_tickets(df)
+    summary_df = summary_frame(aggregates)
+    
+    agent_workload = aggregates['agent_workload']
+    agent_workload.index.name = 'AssignedAgent'
+    
+    return summary_df, agent_workload
+
+def update_daily_log_excel(tickets, state):
+    """Apply changed tickets to the last exported workbook instead of rebuilding it"""
+    
+    # Get current date for filename
+    current_date = datetime.now().strftime("%Y%m%d")
+    filename = f"IT_Helpdesk_Daily_Log_{current_date}.xlsx"
+    
+    print(f"📊 Updating daily log {state['workbook']} -> {filename}")
+    
+    workbook = open_workbook(state)
+    worksheet = workbook['Daily Log']
+    updated_count, appended_count = merge_rows(worksheet, build_daily_log_frame(tickets))
+    df = sheet_dataframe(worksheet)
+    workbook.save(filename)
+    
+    # Rebuild the summary sheets from the merged log
+    summary_df, agent_workload = build_summary_frames(df)
+    with pd.ExcelWriter(filename, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
+        summary_df.to_excel(writer, sheet_name='Summary', index=False)
+        agent_workload.to_excel(writer, sheet_name='Agent Workload')
+    
+    print(f"✅ Daily log updated: {updated_count} tickets changed, {appended_count} added")
+    return filename
+
 def main():
+    global execute_query
+    parser = argparse.ArgumentParser(description='Export tickets to the Excel daily log')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only fetch tickets added or changed since the last export and update its workbook')
+    add_snapshot_argument(parser)
+    args = parser.parse_args()
+    
+    # Read from the local snapshot instead of SQLiteCloud
+    if args.snapshot:
+        execute_query = snapshot_executor(args.snapshot)
+    
     print("📊 IT Helpdesk Daily Log Export Tool")
     print("====================================")
     print()
     
+    state = load_state(STATE_FILE) if args.incremental else None
+    if args.incremental and not state:
+        print("⚠️ No previous export found, running a full export")
+    
     # Get all tickets
-    print("🔍 Retrieving all tickets from database...")
-    tickets = get_all_tickets()
+    if state:
+        print(f"🔍 Retrieving tickets changed since ticket #{state['last_id']}...")
+    else:
+        print("🔍 Retrieving all tickets from database...")
+    tickets = get_all_tickets(state)
     
-    if not tickets:
+    if tickets is None or (not tickets and not state):
         print("❌ No tickets found in database")
         return
     
     print(f"📋 Found {len(tickets)} tickets to export")
     print()
     
-    # Create Excel file
-    filename = create_daily_log_excel(tickets)
+    # Create or update Excel file
+    if state:
+        filename = update_daily_log_excel(tickets, state) if tickets else state['workbook']
+    else:
+        filename = create_daily_log_excel(tickets)
+    save_state(STATE_FILE, filename, tickets, state)
     
     print()
     print("📈 Export Summary:")
-    print(f"   📄 File created: {filename}")
-    print(f"   🎫 Total tickets: {len(tickets)}")
+    print(f"   📄 File {'updated' if state else 'created'}: {filename}")
+    print(f"   🎫 {'Changed' if state else 'Total'} tickets: {len(tickets)}")
     print(f"   📊 Sheets included: Daily Log, Summary, Agent Workload")
     
     print()
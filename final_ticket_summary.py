@@ -3,9 +3,12 @@
 Generate final summary report of all tickets
 """
 
+import argparse
 import requests
 import os
 from dotenv import load_dotenv
+from ticket_snapshot import add_snapshot_argument, snapshot_executor
+from ticket_aggregates import fetch_aggregates
 
 # Load environment variables
 load_dotenv()
@@ -37,55 +40,60 @@ def execute_query(query):
         print(f"❌ Error: {e}")
         return None
 
-def main():
-    print("📊 IT Helpdesk Final Ticket Summary Report")
-    print("==========================================")
-    print()
-    
-    # Get all tickets
+def get_all_tickets():
+    """Get every ticket for the detailed list"""
     query = '''
         USE DATABASE 'my-database';
         SELECT id, timestamp, name, email, issue, status, priority, assigned_agent, notes
         FROM tickets 
         ORDER BY id
     '''
+    return execute_query(query)
+
+def main():
+    global execute_query
+    parser = argparse.ArgumentParser(description='Summarize all tickets')
+    parser.add_argument('--summary-only', action='store_true',
+                        help='Only print the statistics (aggregated in the database), skip the detailed ticket list')
+    add_snapshot_argument(parser)
+    args = parser.parse_args()
     
-    tickets = execute_query(query)
+    # Read from the local snapshot instead of SQLiteCloud
+    if args.snapshot:
+        execute_query = snapshot_executor(args.snapshot)
     
-    if not tickets:
+    print("📊 IT Helpdesk Final Ticket Summary Report")
+    print("==========================================")
+    print()
+    
+    # Statistics are grouped by the database; only the counts are transferred
+    aggregates = fetch_aggregates(execute_query)
+    
+    if not aggregates or not aggregates['total']:
         print("❌ No tickets found in database")
         return
     
-    print(f"📋 Total Tickets in Database: {len(tickets)}")
+    print(f"📋 Total Tickets in Database: {aggregates['total']}")
     print()
     
-    # Summary by status
-    status_counts = {}
-    priority_counts = {}
-    agent_counts = {}
-    
-    for ticket in tickets:
-        status = ticket['status']
-        priority = ticket['priority']
-        agent = ticket['assigned_agent'] or 'Unassigned'
-        
-        status_counts[status] = status_counts.get(status, 0) + 1
-        priority_counts[priority] = priority_counts.get(priority, 0) + 1
-        agent_counts[agent] = agent_counts.get(agent, 0) + 1
-    
     print("📈 Summary Statistics:")
     print("   Status Distribution:")
-    for status, count in status_counts.items():
+    for status, count in aggregates['status'].items():
         print(f"      {status}: {count} tickets")
     
     print("   Priority Distribution:")
-    for priority, count in priority_counts.items():
+    for priority, count in aggregates['priority'].items():
         print(f"      {priority}: {count} tickets")
     
     print("   Agent Distribution:")
-    for agent, count in agent_counts.items():
+    for agent, count in aggregates['agent_workload']['Total_Tickets'].items():
         print(f"      {agent}: {count} tickets")
     
+    if args.summary_only:
+        return
+    
+    tickets = get_all_tickets() or []
+    
     print()
     print("🎫 Detailed Ticket List:")
     print("=" * 80)
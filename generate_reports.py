@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Generate the nightly report set in parallel
+Fetches the ticket snapshot from SQLiteCloud once, then renders every requested
+report (comprehensive log, daily logs, Week 1 knowledge bases, import summary)
+in a process pool, so the whole set takes about as long as the slowest report.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import requests
+from dotenv import load_dotenv
+from ticket_snapshot import add_snapshot_argument, snapshot_executor
+
+# Load environment variables
+load_dotenv()
+
+# SQLiteCloud configuration
+API_KEY = os.getenv('SQLITECLOUD_API_KEY')
+API_URL = os.getenv('SQLITECLOUD_URL')
+
+headers = {
+    'Authorization': f'Bearer {API_KEY}',
+    'Content-Type': 'application/json'
+}
+
+# Every ticket column, in export order; each report projects what it needs
+SNAPSHOT_QUERY = '''
+    USE DATABASE 'my-database';
+    SELECT * FROM tickets ORDER BY created_at, id
+'''
+
+def execute_query(query):
+    """Execute a SQL query on SQLiteCloud"""
+    try:
+        payload = {"sql": query}
+        response = requests.post(API_URL, json=payload, headers=headers, timeout=120)
+
+        if response.status_code == 200:
+            result = response.json()
+            if 'data' in result:
+                return result['data']
+            return result
+        else:
+            print(f"❌ Query failed: {response.text}")
+            return None
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return None
+
+def fetch_snapshot():
+    """Fetch every ticket once for all reports"""
+    tickets = execute_query(SNAPSHOT_QUERY)
+    return tickets if isinstance(tickets, list) else None
+
+# Report renderers run in worker processes: each takes the snapshot and
+# returns the file it wrote. Imports are local so a worker only loads the
+# libraries of the reports it renders.
+
+def render_comprehensive_log(snapshot):
+    from create_comprehensive_log_updated import create_comprehensive_excel
+    return create_comprehensive_excel(snapshot)
+
+def render_daily_log(snapshot):
+    from daily_log_incremental import daily_log_tickets, save_state
+    from export_daily_log import STATE_FILE, create_daily_log_excel
+    tickets = daily_log_tickets(snapshot)
+    filename = create_daily_log_excel(tickets)
+    save_state(STATE_FILE, filename, tickets)
+    return filename
+
+def render_daily_log_formatted(snapshot):
+    from daily_log_incremental import daily_log_tickets, save_state
+    from export_daily_log_formatted import STATE_FILE, create_daily_log_excel
+    tickets = daily_log_tickets(snapshot)
+    filename = create_daily_log_excel(tickets)
+    save_state(STATE_FILE, filename, tickets)
+    return filename
+
+def render_knowledge_base_xlsx(snapshot):
+    from create_week1_knowledge_base import create_week1_knowledge_base
+    return create_week1_knowledge_base()
+
+def render_knowledge_base_pdf(snapshot):
+    from create_week1_knowledge_base_pdf import create_week1_knowledge_base_pdf
+    return create_week1_knowledge_base_pdf()
+
+def render_knowledge_base_docx(snapshot):
+    from create_enhanced_knowledge_base_docx import create_enhanced_knowledge_base_docx
+    return create_enhanced_knowledge_base_docx()
+
+def render_import_summary(snapshot):
+    from import_summary_report import imported_from_snapshot, print_import_summary
+    filename = f"Import_Summary_Report_{datetime.now().strftime('%Y%m%d')}.txt"
+    with open(filename, 'w', encoding='utf-8') as f, contextlib.redirect_stdout(f):
+        print_import_summary(imported_from_snapshot(snapshot), len(snapshot))
+    return filename
+
+# name: (renderer, needs the ticket snapshot)
+# export_daily_log_simple.py is not included: it writes the same file as export_daily_log.py
+REPORTS = {
+    'comprehensive-log': (render_comprehensive_log, True),
+    'daily-log': (render_daily_log, True),
+    'daily-log-formatted': (render_daily_log_formatted, True),
+    'kb-xlsx': (render_knowledge_base_xlsx, False),
+    'kb-pdf': (render_knowledge_base_pdf, False),
+    'kb-docx': (render_knowledge_base_docx, False),
+    'import-summary': (render_import_summary, True)
+}
+
+def run_report(name, snapshot):
+    """Render one report in a worker, capturing its console output
+
+    Returns (name, filename, seconds, output, error).
+    """
+    renderer = REPORTS[name][0]
+    output = io.StringIO()
+    started = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            filename = renderer(snapshot)
+        error = None if filename else 'no file written'
+    except (Exception, SystemExit) as e:
+        filename, error = None, f"{type(e).__name__}: {e}"
+    return name, filename, time.perf_counter() - started, output.getvalue(), error
+
+def generate_reports(names, snapshot, workers=None):
+    """Render the named reports concurrently; yields results as reports finish"""
+    with ProcessPoolExecutor(max_workers=workers or min(len(names), os.cpu_count() or 1)) as pool:
+        futures = [
+            pool.submit(run_report, name, snapshot if REPORTS[name][1] else None)
+            for name in names
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+def main():
+    global execute_query
+    parser = argparse.ArgumentParser(description='Generate the report set from one ticket snapshot, in parallel')
+    parser.add_argument('reports', nargs='*', metavar='REPORT',
+                        help=f"Reports to generate (default: all): {', '.join(REPORTS)}")
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: one per report, up to the CPU count)')
+    parser.add_argument('--verbose', action='store_true',
+                        help="Print each report's console output")
+    add_snapshot_argument(parser)
+    args = parser.parse_args()
+    unknown = [name for name in args.reports if name not in REPORTS]
+    if unknown:
+        parser.error(f"unknown report(s): {', '.join(unknown)}")
+    names = list(dict.fromkeys(args.reports)) or list(REPORTS)
+
+    # Read from the local snapshot instead of SQLiteCloud
+    if args.snapshot:
+        execute_query = snapshot_executor(args.snapshot)
+
+    print("📊 IT Helpdesk Report Generator")
+    print("===============================")
+    print()
+
+    started = time.perf_counter()
+    snapshot = None
+    if any(REPORTS[name][1] for name in names):
+        print("🔍 Fetching ticket snapshot...")
+        snapshot = fetch_snapshot()
+        if not snapshot:
+            print("❌ No tickets found in database")
+            return
+        print(f"📋 Fetched {len(snapshot)} tickets in {time.perf_counter() - started:.1f}s")
+        print()
+
+    print(f"⚙️ Rendering {len(names)} reports...")
+    failed = 0
+    for name, filename, seconds, output, error in generate_reports(names, snapshot, args.workers):
+        if error:
+            failed += 1
+            print(f"❌ {name} failed after {seconds:.1f}s: {error}")
+        else:
+            print(f"✅ {name}: {filename} ({seconds:.1f}s)")
+        if args.verbose or error:
+            print(output)
+
+    print()
+    print(f"📈 {len(names) - failed} of {len(names)} reports generated in {time.perf_counter() - started:.1f}s")
+    if failed:
+        exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 """
 Import tickets from Excel file to SQLiteCloud database
-This script reads the Book.xlsx file and imports all tickets as resolved
+This script reads the Book.xlsx file and imports all tickets as resolved.
+Tickets are upserted in batches over a pool of worker threads (--workers),
+so a large backfill keeps several requests in flight instead of waiting on
+each round-trip; new tickets are still numbered in file order.
 """
 
+import argparse
+import time
 import pandas as pd
 import requests
 import os
-from datetime import datetime
 from dotenv import load_dotenv
+from ticket_timestamps import now_timestamp
+from ticket_upsert import BATCH_SIZE, WORKERS, upsert_tickets
 
 # Load environment variables
 load_dotenv()
@@ -64,9 +70,9 @@ def read_excel_tickets():
         print(f"❌ Error reading Excel file: {e}")
         return None
 
-def import_tickets_to_database(df):
+def import_tickets_to_database(df, workers=WORKERS, batch_size=BATCH_SIZE):
     """Import tickets from DataFrame to SQLiteCloud database"""
-    imported_count = 0
+    tickets = []
     error_count = 0
     
     print(f"\n🚀 Starting import of {len(df)} tickets...")
@@ -93,44 +99,59 @@ def import_tickets_to_database(df):
             email = f"user{index + 1}@company.com"
             
             # Create timestamp (use current time for all imported tickets)
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Escape single quotes to prevent SQL injection
-            name_escaped = name.replace("'", "''")
-            email_escaped = email.replace("'", "''")
-            issue_escaped = full_description.replace("'", "''")
-            priority_escaped = priority.replace("'", "''")
-            assigned_agent_escaped = assigned_agent.replace("'", "''")
+            timestamp, created_at = now_timestamp()
             
             # Create notes with KB article reference
             notes = f"Imported from Excel. Category: {incident_category}"
             if kb_article and kb_article != 'nan':
                 notes += f" | KB Article: {kb_article}"
-            notes_escaped = notes.replace("'", "''")
-            
-            # Insert ticket into database
-            insert_query = f'''
-                USE DATABASE 'my-database';
-                INSERT INTO tickets (timestamp, name, email, issue, notes, status, priority, assigned_agent)
-                VALUES ('{timestamp}', '{name_escaped}', '{email_escaped}', '{issue_escaped}', '{notes_escaped}', 'Resolved', '{priority_escaped}', '{assigned_agent_escaped}')
-            '''
             
-            result = execute_query(insert_query)
-            if result is not None:
-                imported_count += 1
-                print(f"✅ Imported ticket {imported_count}: {brief_summary[:50]}...")
-            else:
-                error_count += 1
-                print(f"❌ Failed to import ticket: {brief_summary[:50]}...")
+            # Keyed on category, email and issue like the tickets backfilled by add_import_key_column.py;
+            # add_category_column.py files these resolved tickets under Week 1
+            tickets.append({
+                'timestamp': timestamp,
+                'created_at': created_at,
+                'name': name,
+                'email': email,
+                'issue': full_description,
+                'notes': notes,
+                'status': 'Resolved',
+                'priority': priority,
+                'assigned_agent': assigned_agent,
+                'category': 'Week 1: Account and Communications Support',
+                'summary': brief_summary
+            })
                 
         except Exception as e:
             error_count += 1
-            print(f"❌ Error importing ticket {index + 1}: {e}")
+            print(f"❌ Error reading ticket {index + 1}: {e}")
+    
+    started = time.perf_counter()
+    written, failed = upsert_tickets(execute_query, tickets, keep=('timestamp', 'created_at'),
+                                     batch_size=batch_size, workers=workers)
+    elapsed = time.perf_counter() - started
+    
+    failed_tickets = set()
+    for first, last in failed:
+        failed_tickets.update(range(first, last + 1))
+        print(f"❌ Batch failed: tickets {first + 1}-{last + 1} ({tickets[first]['summary'][:30]}... to {tickets[last]['summary'][:30]}...)")
+    for position, ticket in enumerate(tickets):
+        if position not in failed_tickets:
+            ticket_id = f" {ticket['_id']}" if ticket.get('_id') is not None else ''
+            print(f"✅ Imported ticket{ticket_id}: {ticket['summary'][:50]}...")
+    
+    imported_count = len(tickets) - len(failed_tickets)
+    error_count += len(failed_tickets)
     
     print(f"\n📊 Import Summary:")
     print(f"   ✅ Successfully imported: {imported_count} tickets")
+    if written is not None:
+        print(f"   📝 Inserted or changed: {written} tickets ({imported_count - written} already up to date)")
     print(f"   ❌ Failed to import: {error_count} tickets")
     print(f"   📋 Total processed: {imported_count + error_count} tickets")
+    print(f"   ⏱️ {elapsed:.1f}s with {workers} workers ({len(tickets) / elapsed if elapsed else 0:.0f} tickets/s)")
+    if failed:
+        print("   🔁 Re-run the import to retry the failed batches (imported tickets are not duplicated)")
     
     return imported_count, error_count
 
@@ -177,6 +198,13 @@ def verify_import():
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description='Import the Book.xlsx tickets into SQLiteCloud')
+    parser.add_argument('--workers', type=int, default=WORKERS,
+                        help=f'Batches sent concurrently (default {WORKERS}, IMPORT_WORKERS)')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                        help=f'Tickets per request (default {BATCH_SIZE}, IMPORT_BATCH_SIZE)')
+    args = parser.parse_args()
+    
     print("🎫 IT Helpdesk Excel Import Tool")
     print("================================")
     
@@ -200,7 +228,7 @@ def main():
         return
     
     # Import tickets
-    imported_count, error_count = import_tickets_to_database(df)
+    imported_count, error_count = import_tickets_to_database(df, max(1, args.workers), args.batch_size)
     
     # Verify import
     if imported_count > 0:
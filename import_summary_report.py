@@ -3,9 +3,11 @@
 Generate a summary report of the imported Excel tickets
 """
 
+import argparse
 import requests
 import os
 from dotenv import load_dotenv
+from ticket_snapshot import add_snapshot_argument, snapshot_executor
 
 # Load environment variables
 load_dotenv()
@@ -35,12 +37,8 @@ def execute_query(query):
         print(f"❌ Error: {e}")
         return []
 
-def main():
-    """Generate import summary report"""
-    print("📊 Excel Import Summary Report")
-    print("=============================")
-    
-    # Get imported tickets (those with "Imported from Excel" in notes)
+def get_imported_tickets():
+    """Get imported tickets (those with "Imported from Excel" in notes)"""
     query = '''
         USE DATABASE 'my-database';
         SELECT id, name, issue, status, priority, assigned_agent, notes
@@ -49,7 +47,39 @@ def main():
         ORDER BY id
     '''
     
-    imported_tickets = execute_query(query)
+    return execute_query(query) or []
+
+def get_total_tickets():
+    """Get total database count"""
+    total_query = '''
+        USE DATABASE 'my-database';
+        SELECT COUNT(*) as total FROM tickets
+    '''
+    total_result = execute_query(total_query)
+    return total_result[0]['total'] if total_result else 0
+
+def imported_from_snapshot(snapshot):
+    """Imported tickets of an already fetched ticket snapshot (same filter as get_imported_tickets)"""
+    imported = [t for t in snapshot if 'imported from excel' in (t.get('notes') or '').lower()]
+    return sorted(imported, key=lambda t: t['id'])
+
+def main():
+    """Generate import summary report"""
+    global execute_query
+    parser = argparse.ArgumentParser(description='Summarize the tickets imported from Excel')
+    add_snapshot_argument(parser)
+    args = parser.parse_args()
+    
+    # Read from the local snapshot instead of SQLiteCloud
+    if args.snapshot:
+        execute_query = snapshot_executor(args.snapshot)
+    
+    print_import_summary(get_imported_tickets(), get_total_tickets())
+
+def print_import_summary(imported_tickets, total_tickets):
+    """Print the import summary report"""
+    print("📊 Excel Import Summary Report")
+    print("=============================")
     
     print(f"\n✅ Successfully imported {len(imported_tickets)} tickets from Excel file")
     print(f"📅 Import date: 2025-09-19 10:08:01")
@@ -93,14 +123,6 @@ def main():
     print(f"   Azola Xabadiya: {azola_tickets} tickets")
     print(f"   Keawin Koesnel: {keawin_tickets} tickets")
     
-    # Get total database count
-    total_query = '''
-        USE DATABASE 'my-database';
-        SELECT COUNT(*) as total FROM tickets
-    '''
-    total_result = execute_query(total_query)
-    total_tickets = total_result[0]['total'] if total_result else 0
-    
     print(f"\n📈 Database Status:")
     print(f"   Total tickets in database: {total_tickets}")
     print(f"   Imported tickets: {len(imported_tickets)}")
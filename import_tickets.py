@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Import tickets from an Excel, CSV or JSONL file
+Rows are streamed from the file (openpyxl read-only mode for .xlsx) and
+validated one at a time, and every chunk of valid tickets is upserted in
+batches (see ticket_upsert.py), so memory stays bounded by the chunk size
+whatever the size of the file and re-running an import is safe.
+
+Source columns are matched to ticket fields by name, e.g. the Ticket Tracker
+sheet of assests/Book.xlsx: TicketID, DateOpened, ReporterName,
+ReporterContact, AssignedAgent, Priority, BriefSummary, FullDescription.
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import time
+
+import requests
+from dotenv import load_dotenv
+from ticket_timestamps import format_timestamp, now_timestamp, parse_timestamp
+from ticket_upsert import BATCH_SIZE, WORKERS, upsert_tickets
+
+# Load environment variables
+load_dotenv()
+
+# SQLiteCloud configuration
+API_KEY = os.getenv('SQLITECLOUD_API_KEY')
+API_URL = os.getenv('SQLITECLOUD_URL')
+
+headers = {
+    'Authorization': f'Bearer {API_KEY}',
+    'Content-Type': 'application/json'
+}
+
+# Source column names (lowercase, letters and digits only) for each ticket field
+COLUMN_ALIASES = {
+    'external_id': ['ticketid', 'externalid', 'id'],
+    'timestamp': ['timestamp', 'dateopened', 'date', 'createdat', 'submitted'],
+    'name': ['name', 'reportername', 'requester', 'user'],
+    'email': ['email', 'reportercontact', 'reporteremail', 'contact'],
+    'issue': ['issue', 'fulldescription', 'description'],
+    'summary': ['briefsummary', 'summary', 'subject'],
+    'notes': ['notes', 'resolutionnotes', 'resolution'],
+    'status': ['status'],
+    'priority': ['priority'],
+    'assigned_agent': ['assignedagent', 'agent', 'assignedto'],
+    'category': ['category']
+}
+
+# Allowed values (the CHECK constraints of the tickets table) and accepted spellings
+PRIORITIES = {'low': 'Low', 'medium': 'Medium', 'normal': 'Medium', 'high': 'High', 'urgent': 'High', 'critical': 'High'}
+STATUSES = {'open': 'Open', 'new': 'Open', 'inprogress': 'In Progress', 'resolved': 'Resolved', 'closed': 'Resolved'}
+
+# Tickets read and validated before each upsert
+CHUNK_SIZE = int(os.getenv('IMPORT_CHUNK_SIZE', '1000'))
+
+def execute_query(query):
+    """Execute a SQL query on SQLiteCloud"""
+    try:
+        payload = {"sql": query}
+        response = requests.post(API_URL, json=payload, headers=headers, timeout=60)
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            print(f"❌ Query failed: {response.text}")
+            return None
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return None
+
+def _key(name):
+    return re.sub(r'[^a-z0-9]', '', str(name).lower())
+
+def stream_rows(path, sheet=None):
+    """Yield (line number, {column: value}) for each non-empty row of the file"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.xlsx':
+        from openpyxl import load_workbook
+        workbook = load_workbook(path, read_only=True)
+        try:
+            rows = (workbook[sheet] if sheet else workbook.worksheets[0]).iter_rows(values_only=True)
+            header = [str(name) if name is not None else '' for name in next(rows, ())]
+            for number, row in enumerate(rows, start=2):
+                if any(value is not None for value in row):
+                    yield number, dict(zip(header, row))
+        finally:
+            workbook.close()
+    elif extension == '.csv':
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            for number, row in enumerate(csv.DictReader(f), start=2):
+                if any(value not in (None, '') for value in row.values()):
+                    yield number, row
+    elif extension == '.jsonl':
+        with open(path, encoding='utf-8') as f:
+            for number, line in enumerate(f, start=1):
+                if line.strip():
+                    yield number, json.loads(line)
+    else:
+        raise ValueError(f"Unsupported file type: {path} (use .xlsx, .csv or .jsonl)")
+
+def field_map(columns):
+    """{ticket field: source column} for the columns present in the source"""
+    by_key = {_key(column): column for column in columns}
+    fields = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in by_key:
+                fields[field] = by_key[alias]
+                break
+    return fields
+
+def _text(value):
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+def normalize_ticket(row, fields, defaults):
+    """Validated ticket dict for a source row; raises ValueError with the reason"""
+    values = {field: _text(row.get(column)) for field, column in fields.items()}
+
+    issue = values.get('issue') or values.get('summary')
+    if not issue:
+        raise ValueError("no issue description")
+
+    raw_timestamp = row.get(fields['timestamp']) if 'timestamp' in fields else None
+    if raw_timestamp in (None, ''):
+        timestamp, created_at = now_timestamp()
+    else:
+        created_at = parse_timestamp(raw_timestamp)
+        if created_at is None:
+            raise ValueError(f"unrecognised timestamp {raw_timestamp!r}")
+        timestamp = format_timestamp(created_at)
+
+    priority = values.get('priority') or defaults['priority']
+    if _key(priority) not in PRIORITIES:
+        raise ValueError(f"invalid priority {priority!r}")
+    status = values.get('status') or defaults['status']
+    if _key(status) not in STATUSES:
+        raise ValueError(f"invalid status {status!r}")
+
+    return {
+        'source': defaults['source'],
+        'external_id': values.get('external_id'),
+        'timestamp': timestamp,
+        'created_at': created_at,
+        'name': values.get('name') or 'Unknown',
+        'email': values.get('email', ''),
+        'issue': issue,
+        'notes': values.get('notes', ''),
+        'status': STATUSES[_key(status)],
+        'priority': PRIORITIES[_key(priority)],
+        'assigned_agent': values.get('assigned_agent', ''),
+        'category': values.get('category') or defaults['category']
+    }
+
+class ImportStats:
+    """Counts and throughput of an import run"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.read = 0
+        self.invalid = 0
+        self.written = 0
+        self.failed = 0
+
+    def rate(self):
+        elapsed = time.perf_counter() - self.started
+        return self.read / elapsed if elapsed else 0.0
+
+def import_file(path, execute, sheet=None, defaults=None, chunk_size=CHUNK_SIZE, batch_size=BATCH_SIZE, dry_run=False,
+                workers=1):
+    """Stream, validate and upsert the tickets of a file; returns ImportStats
+
+    Invalid rows are reported with their line number and skipped. Source
+    ticket ids are keyed within defaults['source'] (default: the file name
+    without its extension). With dry_run the rows are only validated. With
+    workers > 1 the batches of a chunk are sent concurrently (new tickets
+    are numbered in file order, see ticket_upsert.upsert_tickets).
+    """
+    defaults = dict({'priority': 'Medium', 'status': 'Open', 'category': 'General',
+                     'source': os.path.splitext(os.path.basename(path))[0]}, **(defaults or {}))
+    stats = ImportStats()
+    fields = None
+    chunk = []
+
+    def flush():
+        if not chunk:
+            return
+        if not dry_run:
+            written, failed = upsert_tickets(execute, chunk, batch_size=batch_size, workers=workers)
+            failed_count = sum(last - first + 1 for first, last in failed)
+            for first, last in failed:
+                print(f"❌ Batch failed: tickets from lines {chunk[first]['_line']}-{chunk[last]['_line']}")
+            stats.failed += failed_count
+            stats.written += written if written is not None else len(chunk) - failed_count
+        print(f"   📦 {stats.read} rows read, {stats.invalid} invalid, {stats.written} written ({stats.rate():.0f} rows/s)")
+        chunk.clear()
+
+    for number, row in stream_rows(path, sheet):
+        if fields is None:
+            fields = field_map(row.keys())
+            print(f"📋 Column mapping: {', '.join(f'{column} → {field}' for field, column in fields.items())}")
+        stats.read += 1
+        try:
+            ticket = normalize_ticket(row, fields, defaults)
+        except ValueError as e:
+            stats.invalid += 1
+            print(f"⚠️ Line {number} skipped: {e}")
+            continue
+        ticket['_line'] = number
+        chunk.append(ticket)
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description='Import tickets from an Excel, CSV or JSONL file')
+    parser.add_argument('file', help='Source file (.xlsx, .csv or .jsonl)')
+    parser.add_argument('--sheet', default=None, help='Excel sheet to read (default: the first sheet)')
+    parser.add_argument('--category', default='General', help='Category of tickets without one (default General)')
+    parser.add_argument('--status', default='Open', help='Status of tickets without one (default Open)')
+    parser.add_argument('--priority', default='Medium', help='Priority of tickets without one (default Medium)')
+    parser.add_argument('--source', default=None,
+                        help='Name the source ticket ids are unique within (default: the file name without extension)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help=f'Rows validated per upsert round (default {CHUNK_SIZE})')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help=f'Tickets per INSERT request (default {BATCH_SIZE})')
+    parser.add_argument('--workers', type=int, default=WORKERS, help=f'Batches sent concurrently (default {WORKERS})')
+    parser.add_argument('--dry-run', action='store_true', help='Only validate the file')
+    args = parser.parse_args()
+
+    if not args.dry_run and (not API_KEY or not API_URL):
+        print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+        exit(1)
+
+    print("🎫 IT Helpdesk Ticket Import")
+    print("============================")
+    print(f"📄 File: {args.file}{' (dry run)' if args.dry_run else ''}")
+
+    defaults = {'category': args.category, 'status': args.status, 'priority': args.priority}
+    if args.source:
+        defaults['source'] = args.source
+    stats = import_file(args.file, execute_query, args.sheet, defaults, args.chunk_size, args.batch_size, args.dry_run,
+                        max(1, args.workers))
+
+    elapsed = time.perf_counter() - stats.started
+    print(f"\n📊 Import Summary:")
+    print(f"   📋 Rows read: {stats.read}")
+    print(f"   ⚠️ Invalid rows: {stats.invalid}")
+    if not args.dry_run:
+        print(f"   ✅ Inserted or changed: {stats.written}")
+        print(f"   ❌ Failed: {stats.failed}")
+    print(f"   ⏱️ {elapsed:.1f}s ({stats.rate():.0f} rows/s)")
+
+    if stats.failed:
+        exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,9 @@ Import Week 2 tickets from the text file with comprehensive notes
 import requests
 import os
 from dotenv import load_dotenv
+from ticket_timestamps import to_epoch
+from ticket_classifier import get_hardware_resolution
+from ticket_upsert import upsert_tickets
 from datetime import datetime, timedelta
 
 # Load environment variables
@@ -41,11 +44,9 @@ def execute_query(query, params=None):
         print(f"❌ Error executing query: {e}")
         return None
 
-def get_comprehensive_notes(issue_description, priority):
-    """Generate comprehensive resolution notes based on issue type"""
-    
-    if "laptop takes 15 minutes to boot" in issue_description.lower():
-        return """RESOLUTION STEPS TAKEN:
+# Resolution notes keyed by ticket_classifier.HARDWARE_RESOLUTION_RULES label
+RESOLUTION_NOTES = {
+    'slow_boot': """RESOLUTION STEPS TAKEN:
 1. Diagnosed slow boot performance issue
 2. Checked startup programs and services:
    - Disabled unnecessary startup applications
@@ -59,10 +60,9 @@ def get_comprehensive_notes(issue_description, priority):
 9. Tested boot performance - reduced to 2-3 minutes
 10. Provided user training on system maintenance
 
-RESOLUTION: Laptop boot time significantly improved. System now boots in under 3 minutes."""
+RESOLUTION: Laptop boot time significantly improved. System now boots in under 3 minutes.""",
 
-    elif "bsod" in issue_description.lower() and "external monitor" in issue_description.lower():
-        return """RESOLUTION STEPS TAKEN:
+    'bsod_external_monitor': """RESOLUTION STEPS TAKEN:
 1. Diagnosed BSOD related to external monitor connection
 2. Checked display drivers and updated to latest version
 3. Tested different HDMI cables and ports
@@ -74,10 +74,9 @@ RESOLUTION: Laptop boot time significantly improved. System now boots in under 3
 9. Resolved driver conflicts in Device Manager
 10. Tested connection stability over extended period
 
-RESOLUTION: External monitor connection issue resolved. No more BSOD when connecting via HDMI."""
+RESOLUTION: External monitor connection issue resolved. No more BSOD when connecting via HDMI.""",
 
-    elif "unidentified network" in issue_description.lower():
-        return """RESOLUTION STEPS TAKEN:
+    'unidentified_network': """RESOLUTION STEPS TAKEN:
 1. Diagnosed network connectivity issue
 2. Checked network adapter settings and drivers
 3. Verified IP configuration and DNS settings
@@ -89,10 +88,9 @@ RESOLUTION: External monitor connection issue resolved. No more BSOD when connec
 9. Configured static IP if DHCP issues persist
 10. Updated Windows network stack
 
-RESOLUTION: Network connectivity restored. Desktop now properly connects to network and internet."""
+RESOLUTION: Network connectivity restored. Desktop now properly connects to network and internet.""",
 
-    elif "replacement laptop" in issue_description.lower() and "burglary" in issue_description.lower():
-        return """RESOLUTION STEPS TAKEN:
+    'burglary_replacement': """RESOLUTION STEPS TAKEN:
 1. Addressed urgent laptop replacement request
 2. Verified incident report and police documentation
 3. Checked available inventory for immediate replacement
@@ -104,10 +102,9 @@ RESOLUTION: Network connectivity restored. Desktop now properly connects to netw
 9. Provided temporary loaner laptop within 2 hours
 10. Scheduled follow-up for permanent replacement
 
-RESOLUTION: Emergency laptop replacement provided within 2 hours. User can continue working immediately."""
+RESOLUTION: Emergency laptop replacement provided within 2 hours. User can continue working immediately.""",
 
-    elif "fan is always loud" in issue_description.lower():
-        return """RESOLUTION STEPS TAKEN:
+    'loud_fan': """RESOLUTION STEPS TAKEN:
 1. Diagnosed overheating and fan noise issue
 2. Opened laptop and cleaned dust from fans and vents
 3. Replaced thermal paste on CPU and GPU
@@ -119,10 +116,9 @@ RESOLUTION: Emergency laptop replacement provided within 2 hours. User can conti
 9. Tested system under load for 1 hour
 10. Provided user guidance on proper laptop ventilation
 
-RESOLUTION: Fan noise significantly reduced. System maintains normal temperature under load."""
+RESOLUTION: Fan noise significantly reduced. System maintains normal temperature under load.""",
 
-    elif "usb device" in issue_description.lower() and "crashes" in issue_description.lower():
-        return """RESOLUTION STEPS TAKEN:
+    'usb_crash': """RESOLUTION STEPS TAKEN:
 1. Diagnosed USB device compatibility issue
 2. Tested USB device on different computers
 3. Updated USB drivers and chipset drivers
@@ -134,10 +130,9 @@ RESOLUTION: Fan noise significantly reduced. System maintains normal temperature
 9. Resolved driver conflicts in Device Manager
 10. Provided compatible USB device recommendations
 
-RESOLUTION: USB compatibility issue resolved. Device now works without causing system crashes."""
+RESOLUTION: USB compatibility issue resolved. Device now works without causing system crashes.""",
 
-    elif "wi-fi connects but no internet" in issue_description.lower():
-        return """RESOLUTION STEPS TAKEN:
+    'wifi_no_internet': """RESOLUTION STEPS TAKEN:
 1. Diagnosed Wi-Fi connectivity issue
 2. Checked network adapter settings and drivers
 3. Verified DNS configuration and settings
@@ -149,10 +144,9 @@ RESOLUTION: USB compatibility issue resolved. Device now works without causing s
 9. Configured static DNS servers (8.8.8.8, 8.8.4.4)
 10. Updated Windows network stack
 
-RESOLUTION: Wi-Fi internet connectivity restored. User can now access internet through Wi-Fi."""
+RESOLUTION: Wi-Fi internet connectivity restored. User can now access internet through Wi-Fi.""",
 
-    elif "laptop was stolen" in issue_description.lower() and "coffee shop" in issue_description.lower():
-        return """RESOLUTION STEPS TAKEN:
+    'stolen_coffee_shop': """RESOLUTION STEPS TAKEN:
 1. Addressed urgent security incident
 2. Immediately initiated remote wipe procedures
 3. Changed all user passwords and credentials
@@ -164,10 +158,9 @@ RESOLUTION: Wi-Fi internet connectivity restored. User can now access internet t
 9. Provided security training to user
 10. Updated company security policies
 
-RESOLUTION: Security incident handled. All data remotely wiped, replacement provided, user can continue working securely."""
+RESOLUTION: Security incident handled. All data remotely wiped, replacement provided, user can continue working securely.""",
 
-    elif "unresponsive" in issue_description.lower() and "browser tabs" in issue_description.lower():
-        return """RESOLUTION STEPS TAKEN:
+    'browser_tabs': """RESOLUTION STEPS TAKEN:
 1. Diagnosed browser performance issue
 2. Checked system memory usage and availability
 3. Updated browser to latest version
@@ -179,10 +172,9 @@ RESOLUTION: Security incident handled. All data remotely wiped, replacement prov
 9. Provided user training on tab management
 10. Recommended browser alternatives if needed
 
-RESOLUTION: Browser performance improved. System now handles multiple tabs without becoming unresponsive."""
+RESOLUTION: Browser performance improved. System now handles multiple tabs without becoming unresponsive.""",
 
-    elif "bsod" in issue_description.lower() and "windows updates" in issue_description.lower():
-        return """RESOLUTION STEPS TAKEN:
+    'bsod_windows_updates': """RESOLUTION STEPS TAKEN:
 1. Diagnosed BSOD after Windows updates
 2. Booted into Safe Mode
 3. Uninstalled problematic Windows updates
@@ -194,10 +186,9 @@ RESOLUTION: Browser performance improved. System now handles multiple tabs witho
 9. Reinstalled updates in controlled manner
 10. Set up automatic driver updates
 
-RESOLUTION: BSOD issue resolved. System now boots normally after Windows updates."""
+RESOLUTION: BSOD issue resolved. System now boots normally after Windows updates.""",
 
-    elif "network works on phone" in issue_description.lower():
-        return """RESOLUTION STEPS TAKEN:
+    'network_works_on_phone': """RESOLUTION STEPS TAKEN:
 1. Diagnosed laptop-specific network issue
 2. Checked network adapter settings and drivers
 3. Verified IP configuration and DNS settings
@@ -209,10 +200,9 @@ RESOLUTION: BSOD issue resolved. System now boots normally after Windows updates
 9. Configured static IP if DHCP issues persist
 10. Updated Windows network stack
 
-RESOLUTION: Laptop network connectivity restored. Now matches phone network performance."""
+RESOLUTION: Laptop network connectivity restored. Now matches phone network performance.""",
 
-    elif "laptop was stolen" in issue_description.lower() and "business trip" in issue_description.lower():
-        return """RESOLUTION STEPS TAKEN:
+    'stolen_business_trip': """RESOLUTION STEPS TAKEN:
 1. Addressed critical security incident for executive
 2. Immediately initiated remote wipe procedures
 3. Changed all executive passwords and credentials
@@ -224,10 +214,9 @@ RESOLUTION: Laptop network connectivity restored. Now matches phone network perf
 9. Provided executive security briefing
 10. Updated company security protocols
 
-RESOLUTION: Critical security incident handled. All data remotely wiped, premium replacement provided, executive can continue working securely."""
+RESOLUTION: Critical security incident handled. All data remotely wiped, premium replacement provided, executive can continue working securely.""",
 
-    else:
-        return """RESOLUTION STEPS TAKEN:
+    'general': """RESOLUTION STEPS TAKEN:
 1. Analyzed reported issue and gathered details
 2. Performed diagnostic checks on affected systems
 3. Identified root cause of the problem
@@ -239,6 +228,11 @@ RESOLUTION: Critical security incident handled. All data remotely wiped, premium
 9. Notified user of successful resolution
 
 RESOLUTION: Issue successfully resolved. All systems functioning normally."""
+}
+
+def get_comprehensive_notes(issue_description, priority):
+    """Generate comprehensive resolution notes based on issue type"""
+    return RESOLUTION_NOTES[get_hardware_resolution(issue_description)]
 
 def get_priority(issue_description):
     """Determine priority based on issue description"""
@@ -282,7 +276,7 @@ def main():
     # Generate timestamps for the last 2 days
     base_time = datetime.now() - timedelta(days=2)
     
-    imported_count = 0
+    tickets = []
     
     for i, issue in enumerate(week2_tickets):
         # Generate timestamp (spread over last 2 days)
@@ -309,27 +303,28 @@ def main():
         # Generate comprehensive notes
         notes = get_comprehensive_notes(issue, priority)
         
-        # Escape single quotes
-        name_escaped = name.replace("'", "''")
-        email_escaped = email.replace("'", "''")
-        issue_escaped = issue.replace("'", "''")
-        notes_escaped = notes.replace("'", "''")
-        priority_escaped = priority.replace("'", "''")
-        agent_escaped = assigned_agent.replace("'", "''")
-        
-        # Insert ticket
-        insert_query = f'''
-            USE DATABASE 'my-database';
-            INSERT INTO tickets (timestamp, name, email, issue, notes, status, priority, assigned_agent, category)
-            VALUES ('{timestamp}', '{name_escaped}', '{email_escaped}', '{issue_escaped}', '{notes_escaped}', 'Resolved', '{priority_escaped}', '{agent_escaped}', 'Week 2: Software & Hardware Support')
-        '''
-        
-        result = execute_query(insert_query)
-        if result:
-            imported_count += 1
-            print(f"✅ Imported Ticket #{i+1}: {name} - {issue[:50]}...")
-        else:
-            print(f"❌ Failed to import Ticket #{i+1}")
+        tickets.append({
+            'timestamp': timestamp,
+            'created_at': to_epoch(ticket_time),
+            'name': name,
+            'email': email,
+            'issue': issue,
+            'notes': notes,
+            'status': 'Resolved',
+            'priority': priority,
+            'assigned_agent': assigned_agent,
+            'category': 'Week 2: Software & Hardware Support'
+        })
+        print(f"✅ Prepared Ticket #{i+1}: {name} - {issue[:50]}...")
+    
+    # Upsert in batches: a re-run updates the existing tickets (keeping their
+    # original timestamps) instead of importing them again
+    written, failed = upsert_tickets(execute_query, tickets, keep=('timestamp', 'created_at'))
+    for first, last in failed:
+        print(f"❌ Failed to import Tickets #{first+1}-#{last+1} (re-run the import to retry)")
+    imported_count = len(tickets) - sum(last - first + 1 for first, last in failed)
+    if written is not None:
+        print(f"📝 {written} tickets inserted or changed, {imported_count - written} already up to date")
     
     print(f"\n🎉 Successfully imported {imported_count} Week 2 tickets!")
     
@@ -6,6 +6,7 @@ Import Week 3 ticket #30 - Duplicate IP address conflict
 import requests
 import os
 from dotenv import load_dotenv
+from ticket_upsert import upsert_tickets
 
 # Load environment variables
 load_dotenv()
@@ -78,28 +79,15 @@ STATUS: Resolved - Temporary fix applied, root cause to be addressed by Network
     
     print(f"Importing ticket #30: {ticket_30['issue'][:50]}...")
     
-    # Escape single quotes in the data
-    name_escaped = ticket_30['name'].replace("'", "''")
-    email_escaped = ticket_30['email'].replace("'", "''")
-    issue_escaped = ticket_30['issue'].replace("'", "''")
-    notes_escaped = ticket_30['notes'].replace("'", "''")
-    priority_escaped = ticket_30['priority'].replace("'", "''")
-    assigned_agent_escaped = ticket_30['assigned_agent'].replace("'", "''")
-    category_escaped = ticket_30['category'].replace("'", "''")
+    # Upsert the ticket (re-running updates it instead of adding a duplicate)
+    written, failed = upsert_tickets(execute_query, [ticket_30])
     
-    # Insert ticket into database
-    insert_query = f'''
-        USE DATABASE 'my-database';
-        INSERT INTO tickets (timestamp, name, email, issue, notes, status, priority, assigned_agent, category)
-        VALUES ('{ticket_30['timestamp']}', '{name_escaped}', '{email_escaped}', '{issue_escaped}', '{notes_escaped}', '{ticket_30['status']}', '{priority_escaped}', '{assigned_agent_escaped}', '{category_escaped}')
-    '''
-    
-    result = execute_query(insert_query)
-    
-    if result:
-        print("Ticket #30 imported successfully")
-    else:
+    if failed:
         print("Failed to import ticket #30")
+    elif written == 0:
+        print("Ticket #30 already up to date")
+    else:
+        print("Ticket #30 imported successfully")
     
     print("\nWeek 3 ticket #30 import completed!")
     
@@ -7,6 +7,7 @@ Based on the extracted ticket data from Spiceworks
 import requests
 import os
 from dotenv import load_dotenv
+from ticket_upsert import upsert_tickets
 
 # Load environment variables
 load_dotenv()
@@ -47,7 +48,6 @@ def import_week3_tickets():
     # Week 3 tickets data
     week3_tickets = [
         {
-            "id": 44,
             "timestamp": "9/30/2025 10:18",
             "name": "nitohi4715@etenx.com",
             "email": "nitohi4715@etenx.com",
@@ -76,7 +76,6 @@ STATUS: Resolved - Performance optimization successful""",
             "category": "Week 3: Performance & Optimization Support"
         },
         {
-            "id": 45,
             "timestamp": "9/30/2025 11:42",
             "name": "Phumza Sotyantya",
             "email": "nitohi4715@etenx.com",
@@ -106,32 +105,16 @@ STATUS: Resolved - Performance optimization successful""",
         }
     ]
     
-    # Import each ticket
-    for ticket in week3_tickets:
-        print(f"Importing ticket {ticket['id']}: {ticket['issue'][:50]}...")
-        
-        # Escape single quotes in the data
-        name_escaped = ticket['name'].replace("'", "''")
-        email_escaped = ticket['email'].replace("'", "''")
-        issue_escaped = ticket['issue'].replace("'", "''")
-        notes_escaped = ticket['notes'].replace("'", "''")
-        priority_escaped = ticket['priority'].replace("'", "''")
-        assigned_agent_escaped = ticket['assigned_agent'].replace("'", "''")
-        category_escaped = ticket['category'].replace("'", "''")
-        
-        # Insert ticket into database
-        insert_query = f'''
-            USE DATABASE 'my-database';
-            INSERT INTO tickets (timestamp, name, email, issue, notes, status, priority, assigned_agent, category)
-            VALUES ('{ticket['timestamp']}', '{name_escaped}', '{email_escaped}', '{issue_escaped}', '{notes_escaped}', '{ticket['status']}', '{priority_escaped}', '{assigned_agent_escaped}', '{category_escaped}')
-        '''
-        
-        result = execute_query(insert_query)
-        
-        if result:
-            print(f"Ticket {ticket['id']} imported successfully")
-        else:
-            print(f"Failed to import ticket {ticket['id']}")
+    # Upsert the tickets in one batch (re-running updates them instead of adding duplicates)
+    for number, ticket in enumerate(week3_tickets, start=1):
+        print(f"Importing ticket {number}: {ticket['issue'][:50]}...")
+
+    written, failed = upsert_tickets(execute_query, week3_tickets)
+
+    if failed:
+        print("Failed to import the Week 3 tickets")
+    elif written is not None:
+        print(f"{written} tickets inserted or changed, {len(week3_tickets) - written} already up to date")
     
     print("\nWeek 3 ticket import completed!")
     print(f"Imported {len(week3_tickets)} tickets")
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Render the knowledge bases from their content files
+Each knowledge base is described once in kb_content/<name>.json (sections made
+of paragraphs, bullets, steps, tables and reflections, plus the sheets of the
+Excel version). The XLSX, PDF and DOCX backends below all render that one
+content model, so a correction only has to be made in one place.
+
+`python knowledge_base.py` renders every format of every knowledge base in
+parallel and skips outputs that are already newer than their content file.
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from functools import lru_cache
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kb_content')
+
+def available_documents():
+    """Names of the knowledge bases in kb_content/"""
+    return sorted(name[:-5] for name in os.listdir(CONTENT_DIR) if name.endswith('.json'))
+
+def content_path(name):
+    return os.path.join(CONTENT_DIR, f'{name}.json')
+
+@lru_cache(maxsize=None)
+def load_content(name):
+    """Load (once per process) the content model of a knowledge base"""
+    with open(content_path(name), encoding='utf-8') as f:
+        return json.load(f)
+
+def output_filename(content, fmt):
+    """Dated output file name, e.g. Week1_Knowledge_Base_20250919.pdf"""
+    return f"{content['filename']}_{datetime.now().strftime('%Y%m%d')}.{fmt}"
+
+def toc_items(content):
+    return [section['heading'] for section in content['sections'] if section.get('toc', True)]
+
+def labelled(block, bold=False):
+    """Paragraph text with its optional "Label:" prefix"""
+    if 'label' not in block:
+        return block['text']
+    label = f"<b>{block['label']}:</b>" if bold else f"{block['label']}:"
+    return f"{label} {block['text']}"
+
+def _sheet_title(heading, used):
+    """Excel sheet name for a section heading: no numbering, " with ..." suffix or forbidden characters, max 31 chars"""
+    title = re.sub(r'^\d+\.\s*|\s+with\s.*$', '', heading)
+    title = re.sub(r'[\\/*?:\[\]]', '', title)[:31].strip()
+    base, n = title, 2
+    while title in used:
+        title = f"{base[:28]} {n}"
+        n += 1
+    used.add(title)
+    return title
+
+def content_sheets(content):
+    """The sheets of the Excel version: explicit "sheets", or one sheet per section table"""
+    if content.get('sheets'):
+        return content['sheets']
+    sheets, used = [], set()
+    for section in content['sections']:
+        for block in section['blocks']:
+            if block['type'] == 'table':
+                sheets.append({
+                    'title': _sheet_title(section['heading'], used),
+                    'columns': block['rows'][0],
+                    'rows': block['rows'][1:]
+                })
+    return sheets
+
+def fit_column_widths(columns, rows, cap=60):
+    """Widths fitted to the longest value of each column (header included)"""
+    widths = []
+    for index, name in enumerate(columns):
+        longest = max([len(str(name))] + [len(str(row[index])) for row in rows])
+        widths.append(min(longest + 2, cap))
+    return widths
+
+# Backends: each takes the content model and the file to write
+
+def render_xlsx(content, filename):
+    from excel_streaming import KB_DATA, KB_DATA_SMALL, KB_HEADER, new_workbook, write_sheet
+
+    workbook = new_workbook()
+    for sheet in content_sheets(content):
+        write_sheet(
+            workbook, sheet['title'], sheet['columns'], sheet['rows'],
+            column_widths=sheet.get('column_widths') or fit_column_widths(sheet['columns'], sheet['rows']),
+            header_style=KB_HEADER,
+            data_style=KB_DATA_SMALL if sheet.get('font_size') == 9 else KB_DATA,
+            row_height=sheet.get('row_height', 50),
+            freeze_header=True
+        )
+    workbook.save(filename)
+
+def render_pdf(content, filename):
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table
+    from pdf_styles import KB_STYLES as styles, kb_table_style
+
+    doc = SimpleDocTemplate(filename, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
+    striped = content.get('table_style') == 'striped'
+
+    # Title page and table of contents
+    story = [
+        Paragraph(content['title'], styles['title']),
+        Paragraph(content['subtitle'], styles['title']),
+        Spacer(1, 0.5*inch),
+        Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", styles['body']),
+        Paragraph(content['cover'], styles['body']),
+        PageBreak(),
+        Paragraph("Table of Contents", styles['heading'])
+    ]
+    story += [Paragraph(f"• {item}", styles['bullet']) for item in toc_items(content)]
+
+    for section in content['sections']:
+        story.append(PageBreak() if section.get('new_page', True) else Spacer(1, 0.3*inch))
+        story.append(Paragraph(section['heading'], styles['heading']))
+        for block in section['blocks']:
+            kind = block['type']
+            if kind == 'paragraph':
+                story.append(Paragraph(labelled(block, bold=True), styles['body']))
+            elif kind == 'subheading':
+                story.append(Paragraph(block['text'], styles['subheading']))
+            elif kind == 'reflection':
+                story.append(Paragraph(labelled(block, bold=True), styles['reflection']))
+            elif kind == 'bullets':
+                story += [Paragraph(f"{block['marker']} {item}", styles['bullet']) for item in block['items']]
+            elif kind == 'steps':
+                story += [Paragraph(f"{i}. {step}", styles['bullet']) for i, step in enumerate(block['items'], 1)]
+            elif kind == 'spacer':
+                story.append(Spacer(1, block['height']*inch))
+            elif kind == 'table':
+                table = Table(block['rows'], colWidths=[width*inch for width in block['widths']])
+                align = block.get('align', 'CENTER')
+                table.setStyle(kb_table_style(
+                    block.get('header_font_size', 10), block.get('font_size', 9),
+                    align if isinstance(align, str) else tuple(align), block.get('valign', 'MIDDLE'), striped
+                ))
+                story.append(table)
+
+    # Footer
+    story.append(Spacer(1, 0.3*inch))
+    story.append(Paragraph(content['footer'], styles['body']))
+    story.append(Paragraph(f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", styles['body']))
+
+    doc.build(story)
+
+def render_docx(content, filename):
+    from docx import Document
+    from docx.enum.table import WD_TABLE_ALIGNMENT
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Inches
+
+    doc = Document()
+    for section in doc.sections:
+        section.top_margin = Inches(1)
+        section.bottom_margin = Inches(1)
+        section.left_margin = Inches(1)
+        section.right_margin = Inches(1)
+
+    # Title page and table of contents
+    doc.add_heading(content['title'], 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
+    doc.add_heading(content['subtitle'], level=1).alignment = WD_ALIGN_PARAGRAPH.CENTER
+    doc.add_paragraph()
+    doc.add_paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}")
+    doc.add_paragraph(content['cover'])
+    doc.add_page_break()
+
+    doc.add_heading('Table of Contents', level=1)
+    for item in toc_items(content):
+        doc.add_paragraph(f"• {item}", style='List Bullet')
+
+    for section in content['sections']:
+        if section.get('new_page', True):
+            doc.add_page_break()
+        else:
+            doc.add_paragraph()
+        doc.add_heading(section['heading'], level=1)
+        for block in section['blocks']:
+            kind = block['type']
+            if kind in ('paragraph', 'reflection'):
+                doc.add_paragraph(labelled(block))
+            elif kind == 'subheading':
+                doc.add_heading(block['text'], level=block.get('level', 2))
+            elif kind == 'bullets':
+                for item in block['items']:
+                    doc.add_paragraph(f"{block['marker']} {item}", style='List Bullet')
+            elif kind == 'steps':
+                for i, step in enumerate(block['items'], 1):
+                    doc.add_paragraph(f"{i}. {step}")
+            elif kind == 'spacer':
+                doc.add_paragraph()
+            elif kind == 'table':
+                header, rows = block['rows'][0], block['rows'][1:]
+                table = doc.add_table(rows=1, cols=len(header))
+                table.alignment = WD_TABLE_ALIGNMENT.CENTER
+                table.style = 'Table Grid'
+                for cell, text in zip(table.rows[0].cells, header):
+                    cell.text = str(text)
+                for row in rows:
+                    for cell, text in zip(table.add_row().cells, row):
+                        cell.text = str(text)
+                for column, width in zip(table.columns, block['widths']):
+                    column.width = Inches(width)
+
+    # Footer
+    doc.add_paragraph()
+    doc.add_paragraph(content['footer'])
+    doc.add_paragraph(f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
+
+    doc.save(filename)
+
+BACKENDS = {
+    'xlsx': render_xlsx,
+    'pdf': render_pdf,
+    'docx': render_docx
+}
+
+def is_up_to_date(filename, name):
+    """True if the output is newer than its content file and this renderer"""
+    if not os.path.exists(filename):
+        return False
+    sources = [content_path(name), os.path.abspath(__file__)]
+    return os.path.getmtime(filename) >= max(os.path.getmtime(source) for source in sources)
+
+def render(name, fmt, force=False):
+    """Render one knowledge base in one format; returns (filename, rendered)
+
+    rendered is False when today's file was already up to date and force is not set.
+    """
+    content = load_content(name)
+    filename = output_filename(content, fmt)
+    if not force and is_up_to_date(filename, name):
+        return filename, False
+    BACKENDS[fmt](content, filename)
+    return filename, True
+
+def _render_job(name, fmt, force):
+    """Worker entry point: returns (name, fmt, filename, rendered, seconds, error)"""
+    started = time.perf_counter()
+    try:
+        filename, rendered = render(name, fmt, force)
+        error = None
+    except Exception as e:
+        filename, rendered, error = None, False, f"{type(e).__name__}: {e}"
+    return name, fmt, filename, rendered, time.perf_counter() - started, error
+
+def render_all(jobs, force=False, workers=None):
+    """Render (name, format) jobs in a process pool; yields results as they finish"""
+    with ProcessPoolExecutor(max_workers=workers or min(len(jobs), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(_render_job, name, fmt, force) for name, fmt in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+def main():
+    documents = available_documents()
+    parser = argparse.ArgumentParser(description='Render the knowledge bases from kb_content/')
+    parser.add_argument('documents', nargs='*', metavar='DOCUMENT',
+                        help=f"Knowledge bases to render (default: all): {', '.join(documents)}")
+    parser.add_argument('--formats', nargs='+', metavar='FORMAT',
+                        help=f"Formats to render (default: each document's own): {', '.join(BACKENDS)}")
+    parser.add_argument('--force', action='store_true',
+                        help='Re-render even if the output is newer than its content')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: one per output, up to the CPU count)')
+    args = parser.parse_args()
+    unknown = [name for name in args.documents if name not in documents]
+    unknown += [fmt for fmt in args.formats or [] if fmt not in BACKENDS]
+    if unknown:
+        parser.error(f"unknown document(s)/format(s): {', '.join(unknown)}")
+
+    jobs = [
+        (name, fmt)
+        for name in list(dict.fromkeys(args.documents)) or documents
+        for fmt in args.formats or load_content(name)['formats']
+    ]
+
+    print("📚 Knowledge Base Renderer")
+    print("==========================")
+    print()
+
+    started = time.perf_counter()
+    failed = 0
+    for name, fmt, filename, rendered, seconds, error in render_all(jobs, args.force, args.workers):
+        if error:
+            failed += 1
+            print(f"❌ {name} ({fmt}) failed: {error}")
+        elif rendered:
+            print(f"✅ {name} ({fmt}): {filename} ({seconds:.1f}s)")
+        else:
+            print(f"⏭️ {name} ({fmt}): {filename} is up to date")
+
+    print()
+    print(f"📈 {len(jobs) - failed} of {len(jobs)} outputs ready in {time.perf_counter() - started:.1f}s")
+    if failed:
+        exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Load test for the IT Helpdesk email notification service
+Fires N concurrent /submit_ticket requests and reports p50/p95/p99 latency and messages/sec.
+With --local the email service and an SMTP sink are started in-process, so no real mail is sent.
+"""
+
+import argparse
+import logging
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from smtp_sink import SMTPSink
+
+_thread_local = threading.local()
+
+def get_session():
+    """One keep-alive session per worker thread"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def make_ticket(i):
+    """Build a test ticket payload"""
+    priorities = ['Low', 'Medium', 'High']
+    return {
+        'name': f'Load Test User {i}',
+        'email': f'load.test.{i}@company.com',
+        'subject': f'Load test ticket #{i}',
+        'description': f'Load test ticket {i}.\nLaptop takes 15 minutes to boot and freezes with many tabs open.',
+        'priority': priorities[i % len(priorities)],
+        'category': 'Week 2: Software & Hardware Support'
+    }
+
+def submit(url, i, timeout):
+    """Submit one ticket, returning (ok, latency_seconds, error)"""
+    start = time.perf_counter()
+    try:
+        response = get_session().post(url, json=make_ticket(i), timeout=timeout)
+        latency = time.perf_counter() - start
+        if response.status_code == 200:
+            return True, latency, None
+        return False, latency, f"HTTP {response.status_code}"
+    except requests.exceptions.RequestException as e:
+        return False, time.perf_counter() - start, type(e).__name__
+
+def start_local_service(sink_port, service_port):
+    """Start an SMTP sink and the email service in background threads"""
+    sink = SMTPSink(port=sink_port).start()
+
+    os.environ['MAIL_SERVER'] = '127.0.0.1'
+    os.environ['MAIL_PORT'] = str(sink.port)
+    os.environ['MAIL_USE_TLS'] = 'False'
+    os.environ.setdefault('MAIL_USERNAME', 'loadtest')
+    os.environ.setdefault('MAIL_PASSWORD', 'loadtest')
+    os.environ.setdefault('NOTIFY_EMAILS', 'helpdesk.team@company.com')
+
+    from werkzeug.serving import make_server
+    import email_notifications
+
+    # The service module may already have read the real .env at import time
+    email_notifications.app.config.update(
+        MAIL_SERVER='127.0.0.1',
+        MAIL_PORT=sink.port,
+        MAIL_USE_TLS=False,
+        MAIL_USE_SSL=False
+    )
+    email_notifications.mail.init_app(email_notifications.app)
+
+    # Keep the report readable: no per-request access log lines
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    server = make_server('127.0.0.1', service_port, email_notifications.app, threaded=True)
+    threading.Thread(target=server.serve_forever, name='email-service', daemon=True).start()
+
+    return sink, server, f"http://127.0.0.1:{server.server_port}"
+
+def run_load_test(url, total, concurrency, timeout):
+    """Fire the requests and collect per-request results"""
+    results = []
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for result in executor.map(lambda i: submit(url, i, timeout), range(total)):
+            results.append(result)
+    return results, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the email notification service')
+    parser.add_argument('-n', '--requests', type=int, default=200, help='Total number of tickets to submit (default: 200)')
+    parser.add_argument('-c', '--concurrency', type=int, default=20, help='Concurrent requests (default: 20)')
+    parser.add_argument('--url', default='http://localhost:5001', help='Email service base URL (default: http://localhost:5001)')
+    parser.add_argument('--local', action='store_true', help='Start the email service and an SMTP sink in-process')
+    parser.add_argument('--sink-port', type=int, default=0, help='SMTP sink port for --local (default: random free port)')
+    parser.add_argument('--service-port', type=int, default=0, help='Email service port for --local (default: random free port)')
+    parser.add_argument('--timeout', type=float, default=30, help='Per-request timeout in seconds (default: 30)')
+    args = parser.parse_args()
+
+    print("🏋️ IT Helpdesk Email Service Load Test")
+    print("======================================")
+
+    sink = server = None
+    base_url = args.url.rstrip('/')
+    if args.local:
+        sink, server, base_url = start_local_service(args.sink_port, args.service_port)
+        print(f"📭 SMTP sink listening on 127.0.0.1:{sink.port}")
+        print(f"🚀 Email service running at {base_url}")
+
+    print(f"🎯 Target: {base_url}/submit_ticket")
+    print(f"📨 Requests: {args.requests} (concurrency {args.concurrency})")
+    print()
+
+    try:
+        results, elapsed = run_load_test(f"{base_url}/submit_ticket", args.requests, args.concurrency, args.timeout)
+    finally:
+        if server:
+            server.shutdown()
+
+    latencies = sorted(latency for ok, latency, _ in results if ok)
+    errors = {}
+    for ok, _, error in results:
+        if not ok:
+            errors[error] = errors.get(error, 0) + 1
+
+    print("📊 Results:")
+    print(f"   ✅ Succeeded: {len(latencies)}")
+    print(f"   ❌ Failed: {len(results) - len(latencies)}")
+    for error, count in errors.items():
+        print(f"      - {error}: {count}")
+    print(f"   ⏱️ Elapsed: {elapsed:.2f} s")
+    print(f"   🚀 Requests/sec: {len(results) / elapsed:.1f}")
+
+    if latencies:
+        print(f"   📈 Latency p50: {percentile(latencies, 0.50) * 1000:.1f} ms")
+        print(f"   📈 Latency p95: {percentile(latencies, 0.95) * 1000:.1f} ms")
+        print(f"   📈 Latency p99: {percentile(latencies, 0.99) * 1000:.1f} ms")
+        print(f"   📈 Latency max: {latencies[-1] * 1000:.1f} ms")
+
+    if sink:
+        stats = sink.stats.snapshot()
+        sink.stop()
+        print(f"   📬 Messages received by sink: {stats['messages']} ({stats['recipients']} recipients)")
+        print(f"   📬 Messages/sec: {stats['messages'] / elapsed:.1f}")
+    else:
+        print(f"   📬 Messages/sec: {len(latencies) / elapsed:.1f}")
+
+    return 0 if len(latencies) == len(results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Notification recipient routing table for the IT Helpdesk email service
+Parses NOTIFY_EMAILS and the per-priority/per-category routes once and keeps
+a precomputed recipient map that is hot reloaded on SIGHUP
+"""
+
+import os
+import re
+import signal
+import threading
+from dotenv import load_dotenv
+
+# Route environment variables, e.g.
+#   NOTIFY_EMAILS=team1@company.com,team2@company.com
+#   NOTIFY_EMAILS_PRIORITY_HIGH=oncall@company.com
+#   NOTIFY_EMAILS_CATEGORY_HARDWARE_SUPPORT=hardware@company.com
+DEFAULT_ROUTE_VAR = 'NOTIFY_EMAILS'
+PRIORITY_ROUTE_PREFIX = 'NOTIFY_EMAILS_PRIORITY_'
+CATEGORY_ROUTE_PREFIX = 'NOTIFY_EMAILS_CATEGORY_'
+
+_routing_table = None
+_routing_lock = threading.Lock()
+
+def route_key(value):
+    """Normalize a priority or category name to its environment variable suffix"""
+    if not value:
+        return None
+    return re.sub(r'[^A-Z0-9]+', '_', str(value).upper()).strip('_') or None
+
+def parse_email_list(emails_str):
+    """Split a comma-separated email list and clean up whitespace"""
+    if not emails_str:
+        return []
+    return [email.strip() for email in emails_str.split(',') if email.strip()]
+
+def _merge_recipients(*email_lists):
+    """Merge email lists keeping first-seen order and dropping duplicates"""
+    merged = []
+    seen = set()
+    for emails in email_lists:
+        for email in emails:
+            if email.lower() not in seen:
+                seen.add(email.lower())
+                merged.append(email)
+    return tuple(merged)
+
+def build_routing_table(environ=None):
+    """Build the routing table from environment variables
+
+    Recipients are additive: every ticket goes to NOTIFY_EMAILS plus any list
+    routed by its priority and its category. The map is precomputed for every
+    known (priority, category) pair so lookups never re-parse strings.
+    """
+    environ = os.environ if environ is None else environ
+
+    default = parse_email_list(environ.get(DEFAULT_ROUTE_VAR, ''))
+    priority_routes = {}
+    category_routes = {}
+
+    for name, value in environ.items():
+        if name.startswith(PRIORITY_ROUTE_PREFIX):
+            key = route_key(name[len(PRIORITY_ROUTE_PREFIX):])
+            if key:
+                priority_routes[key] = parse_email_list(value)
+        elif name.startswith(CATEGORY_ROUTE_PREFIX):
+            key = route_key(name[len(CATEGORY_ROUTE_PREFIX):])
+            if key:
+                category_routes[key] = parse_email_list(value)
+
+    recipients = {}
+    for priority_key in [None] + list(priority_routes):
+        for category_key in [None] + list(category_routes):
+            recipients[(priority_key, category_key)] = _merge_recipients(
+                default,
+                priority_routes.get(priority_key, []),
+                category_routes.get(category_key, [])
+            )
+
+    return {
+        'default': tuple(default),
+        'priority_routes': priority_routes,
+        'category_routes': category_routes,
+        'recipients': recipients
+    }
+
+def get_routing_table():
+    """Return the current routing table, building it on first use"""
+    global _routing_table
+    table = _routing_table
+    if table is None:
+        with _routing_lock:
+            if _routing_table is None:
+                _routing_table = build_routing_table()
+            table = _routing_table
+    return table
+
+def reload_routing_table(signum=None, frame=None):
+    """Re-read .env and rebuild the routing table (used as the SIGHUP handler)"""
+    global _routing_table
+    load_dotenv(override=True)
+    table = build_routing_table()
+    with _routing_lock:
+        _routing_table = table
+    print(f"🔄 Notification routing reloaded: {len(table['default'])} default recipients, "
+          f"{len(table['priority_routes'])} priority routes, {len(table['category_routes'])} category routes")
+    return table
+
+def install_reload_handler():
+    """Reload the routing table on SIGHUP where the platform supports it"""
+    if not hasattr(signal, 'SIGHUP'):
+        return False
+    try:
+        signal.signal(signal.SIGHUP, reload_routing_table)
+    except ValueError:
+        # signal handlers can only be installed from the main thread
+        return False
+    return True
+
+def get_recipients(priority=None, category=None):
+    """Get the notification recipients for a ticket's priority and category"""
+    table = get_routing_table()
+    priority_key = route_key(priority)
+    category_key = route_key(category)
+
+    if priority_key not in table['priority_routes']:
+        priority_key = None
+    if category_key not in table['category_routes']:
+        category_key = None
+
+    return list(table['recipients'][(priority_key, category_key)])
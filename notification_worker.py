@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+In-process notification mode for the IT Helpdesk main app
+Imports the email pipeline from email_notifications.py as a library and sends
+notifications from a background thread, instead of calling the separate email
+service over HTTPS. Enable with NOTIFICATION_MODE=inprocess.
+"""
+
+import atexit
+import os
+import queue
+import threading
+
+import email_metrics
+import email_notifications
+
+_queue = queue.Queue(maxsize=int(os.getenv('NOTIFICATION_QUEUE_SIZE', 1000)))
+_worker = None
+_worker_lock = threading.Lock()
+_STOP = object()
+
+def _send(ticket_data):
+    """Send one notification inside the email service's app context"""
+    recipients = email_notifications.get_notification_emails(
+        ticket_data.get('priority'),
+        ticket_data.get('category')
+    )
+    if not recipients:
+        email_metrics.record_rejected()
+        print("❌ Email notification skipped: no notification emails configured")
+        return
+
+    with email_notifications.app.app_context():
+        email_notifications.send_ticket_email(ticket_data, recipients)
+    print(f"✅ Email notification sent for ticket from {ticket_data['name']}")
+
+def _run():
+    """Worker loop: drain the queue until the stop marker arrives"""
+    while True:
+        ticket_data = _queue.get()
+        try:
+            if ticket_data is _STOP:
+                return
+            _send(ticket_data)
+        except Exception as e:
+            print(f"❌ Email notification error: {e}")
+        finally:
+            if ticket_data is not _STOP:
+                email_metrics.queue_left()
+            _queue.task_done()
+
+def start_worker():
+    """Start the background sender thread once per process"""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run, name='notification-worker', daemon=True)
+            _worker.start()
+    return _worker
+
+def enqueue_notification(ticket_data):
+    """Queue a notification without blocking the request thread; returns False if the queue is full"""
+    ticket_data = {key: str(value).strip() for key, value in ticket_data.items() if value}
+    for field in ('name', 'email', 'subject', 'description'):
+        if not ticket_data.get(field):
+            email_metrics.record_rejected()
+            return False
+
+    start_worker()
+    # Counted before the put, so the worker's queue_left() can never run first
+    email_metrics.queue_entered()
+    try:
+        _queue.put_nowait(ticket_data)
+    except queue.Full:
+        email_metrics.queue_left()
+        email_metrics.record_rejected()
+        return False
+    return True
+
+def stop_worker(timeout=10):
+    """Let queued notifications finish (up to timeout seconds) and stop the worker"""
+    worker = _worker
+    if worker is None or not worker.is_alive():
+        return
+    try:
+        _queue.put(_STOP, timeout=timeout)
+    except queue.Full:
+        return
+    worker.join(timeout)
+
+atexit.register(stop_worker)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Shared reportlab styles for the helpdesk PDFs
+getSampleStyleSheet(), the custom paragraph styles and the table styles are
+built once per process and reused by every export and knowledge base render,
+instead of being recreated on each call.
+"""
+
+from functools import lru_cache
+
+from reportlab.lib import colors
+from reportlab.lib.colors import HexColor
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.platypus import TableStyle
+
+KB_COLOR = HexColor('#2E8B57')                  # Sea Green headings and table headers
+SUBHEADING_COLOR = HexColor('#4682B4')          # Steel Blue subheadings and reflection borders
+REFLECTION_BACKGROUND = HexColor('#F0F8FF')
+
+SAMPLE_STYLES = getSampleStyleSheet()
+
+# Ticket export (/export_pdf)
+REPORT_TITLE = ParagraphStyle('CustomTitle', parent=SAMPLE_STYLES['Heading1'], fontSize=16, spaceAfter=30,
+                              alignment=TA_CENTER)
+
+TICKET_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
+# Knowledge bases (knowledge_base.py)
+KB_STYLES = {
+    'title': ParagraphStyle('CustomTitle', parent=SAMPLE_STYLES['Heading1'], fontSize=24, spaceAfter=30,
+                            alignment=TA_CENTER, textColor=KB_COLOR),
+    'heading': ParagraphStyle('CustomHeading', parent=SAMPLE_STYLES['Heading2'], fontSize=16, spaceAfter=12,
+                              spaceBefore=20, textColor=KB_COLOR),
+    'subheading': ParagraphStyle('CustomSubHeading', parent=SAMPLE_STYLES['Heading3'], fontSize=14, spaceAfter=8,
+                                 spaceBefore=12, textColor=SUBHEADING_COLOR),
+    'body': ParagraphStyle('CustomBody', parent=SAMPLE_STYLES['Normal'], fontSize=11, spaceAfter=6,
+                           alignment=TA_JUSTIFY),
+    'bullet': ParagraphStyle('CustomBullet', parent=SAMPLE_STYLES['Normal'], fontSize=10, spaceAfter=4,
+                             leftIndent=20),
+    'reflection': ParagraphStyle('ReflectionStyle', parent=SAMPLE_STYLES['Normal'], fontSize=10, spaceAfter=6,
+                                 leftIndent=30, rightIndent=30, backColor=REFLECTION_BACKGROUND,
+                                 borderColor=SUBHEADING_COLOR, borderWidth=1, borderPadding=8)
+}
+
+@lru_cache(maxsize=None)
+def kb_table_style(header_font_size=10, font_size=9, align='CENTER', valign='MIDDLE', striped=False):
+    """Knowledge base table style, built once per distinct layout
+
+    align is one alignment for every column or a tuple with one per column.
+    striped adds the alternating rows and roomier padding of the enhanced edition.
+    """
+    commands = [
+        ('BACKGROUND', (0, 0), (-1, 0), KB_COLOR),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke)
+    ]
+    if isinstance(align, str):
+        commands.append(('ALIGN', (0, 0), (-1, -1), align))
+    else:
+        commands.extend(('ALIGN', (column, 0), (column, -1), value) for column, value in enumerate(align))
+    commands += [
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), header_font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 15 if striped else 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTSIZE', (0, 1), (-1, -1), font_size),
+        ('VALIGN', (0, 0), (-1, -1), valign)
+    ]
+    if striped:
+        commands += [
+            ('TOPPADDING', (0, 0), (-1, 0), 10),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.white]),
+            ('TOPPADDING', (0, 1), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+            ('LEFTPADDING', (0, 0), (-1, -1), 6),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 6)
+        ]
+    return TableStyle(commands)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Reconcile ticket_counters with the tickets table
+Recounts every dimension with one GROUP BY per dimension, reports any counter
+that drifted and rebuilds the table in a single transaction. Run it on a
+schedule (e.g. nightly) or after bulk changes made with triggers disabled.
+"""
+
+import argparse
+import requests
+import os
+from dotenv import load_dotenv
+from add_ticket_counters import COUNTER_DIMENSIONS, REBUILD_COUNTERS, counter_value
+
+# Load environment variables
+load_dotenv()
+
+# SQLiteCloud configuration
+API_KEY = os.getenv('SQLITECLOUD_API_KEY')
+API_URL = os.getenv('SQLITECLOUD_URL')
+
+headers = {
+    'Authorization': f'Bearer {API_KEY}',
+    'Content-Type': 'application/json'
+}
+
+def execute_query(query):
+    """Execute a SQL query on SQLiteCloud"""
+    try:
+        payload = {"sql": query}
+        response = requests.post(API_URL, json=payload, headers=headers, timeout=30)
+
+        if response.status_code == 200:
+            result = response.json()
+            if 'data' in result:
+                return result['data']
+            return result
+        else:
+            print(f"❌ Query failed: {response.text}")
+            return None
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return None
+
+def get_expected_counts():
+    """Count tickets per counter straight from the tickets table"""
+    selects = [
+        f"SELECT '{dimension}' AS dimension, {counter_value('tickets', column, default)} AS value, COUNT(*) AS count FROM tickets GROUP BY 2"
+        for dimension, column, default in COUNTER_DIMENSIONS
+    ]
+    selects.append("SELECT 'total' AS dimension, 'all' AS value, COUNT(*) AS count FROM tickets")
+    rows = execute_query(f"USE DATABASE 'my-database'; {' UNION ALL '.join(selects)}")
+    if not isinstance(rows, list):
+        return None
+    return {(row['dimension'], row['value']): int(row['count']) for row in rows}
+
+def get_stored_counts():
+    """Read the maintained counters"""
+    rows = execute_query("USE DATABASE 'my-database'; SELECT dimension, value, count FROM ticket_counters")
+    if not isinstance(rows, list):
+        return None
+    return {(row['dimension'], row['value']): int(row['count']) for row in rows}
+
+def find_drift(expected, stored):
+    """Counters whose stored count differs from the recount, as (dimension, value, stored, expected)"""
+    drift = []
+    for key in sorted(set(expected) | set(stored)):
+        expected_count = expected.get(key, 0)
+        stored_count = stored.get(key, 0)
+        if expected_count != stored_count:
+            drift.append((key[0], key[1], stored_count, expected_count))
+    return drift
+
+def rebuild_counters():
+    """Recount every counter in one transaction"""
+    statements = '; '.join(REBUILD_COUNTERS)
+    return execute_query(f"USE DATABASE 'my-database'; BEGIN; {statements}; COMMIT;") is not None
+
+def main():
+    parser = argparse.ArgumentParser(description='Reconcile ticket_counters with the tickets table')
+    parser.add_argument('--check', action='store_true',
+                        help='Only report drifted counters, do not rebuild them')
+    args = parser.parse_args()
+
+    if not API_KEY or not API_URL:
+        print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+        exit(1)
+
+    print("🔢 Ticket Counter Reconciliation")
+    print("================================")
+
+    expected = get_expected_counts()
+    stored = get_stored_counts()
+    if expected is None or stored is None:
+        print("❌ Could not read ticket counts (run add_ticket_counters.py first)")
+        exit(1)
+
+    drift = find_drift(expected, stored)
+    if not drift:
+        print(f"✅ All {len(expected)} counters match the tickets table")
+        return
+
+    print(f"⚠️ {len(drift)} counters drifted:")
+    for dimension, value, stored_count, expected_count in drift:
+        print(f"   {dimension} = {value}: stored {stored_count}, actual {expected_count}")
+
+    if args.check:
+        exit(1)
+
+    if rebuild_counters():
+        print("✅ Counters rebuilt from the tickets table")
+    else:
+        print("❌ Failed to rebuild counters")
+        exit(1)
+
+if __name__ == "__main__":
+    main()
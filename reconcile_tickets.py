@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Reconcile imported tickets with the database using row hashes
+Instead of fetching every row and comparing field by field, both sides hash
+each ticket (id plus the compared columns) and then hash ranges of ids. Only
+the range hashes are transferred at first; ranges that differ are split into
+smaller ranges (Merkle-style) until they are small enough to compare the
+per-row hashes, so a 100k-row import is verified by moving a few thousand
+hashes instead of the rows.
+
+The database side computes the hashes in SQL with HASH_FUNCTION (default
+sha3, from SQLite's shathree extension; md5 and sha1 are also supported for
+servers with a crypto extension). Local snapshots (--snapshot) get the
+function registered from hashlib.
+
+Source files: CSV, JSON/JSONL or XLSX with one ticket per row and an "id"
+column named like the tickets table columns.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import time
+
+import requests
+from dotenv import load_dotenv
+from ticket_snapshot import TicketSnapshot, add_snapshot_argument
+
+# Load environment variables
+load_dotenv()
+
+# SQLiteCloud configuration
+API_KEY = os.getenv('SQLITECLOUD_API_KEY')
+API_URL = os.getenv('SQLITECLOUD_URL')
+
+headers = {
+    'Authorization': f'Bearer {API_KEY}',
+    'Content-Type': 'application/json'
+}
+
+# Columns compared by default (those present in the source file)
+DEFAULT_COLUMNS = ['timestamp', 'name', 'email', 'issue', 'notes', 'status', 'priority', 'assigned_agent', 'category']
+
+# SQL expression (hex digest of a text) and the matching Python digest
+HASH_FUNCTIONS = {
+    'sha3': ("hex(sha3({}, 256))", lambda data: hashlib.sha3_256(data).hexdigest().upper()),
+    'sha1': ("hex(sha1({}))", lambda data: hashlib.sha1(data).hexdigest().upper()),
+    'md5': ("hex(md5({}))", lambda data: hashlib.md5(data).hexdigest().upper())
+}
+HASH_FUNCTION = os.getenv('RECONCILE_HASH_FUNCTION', 'sha3')
+
+SEPARATOR = '\x1f'
+
+# Ranges split into this many parts per level; ranges this small compare row hashes
+FANOUT = 16
+LEAF_SIZE = 64
+
+def execute_query(query):
+    """Execute a SQL query on SQLiteCloud"""
+    try:
+        payload = {"sql": query}
+        response = requests.post(API_URL, json=payload, headers=headers, timeout=60)
+
+        if response.status_code == 200:
+            result = response.json()
+            if 'data' in result:
+                return result['data']
+            return result
+        else:
+            print(f"❌ Query failed: {response.text}")
+            return None
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return None
+
+def load_source(path):
+    """Read the source tickets as a list of dicts"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        with open(path, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+    if extension == '.jsonl':
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    if extension == '.json':
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    if extension == '.xlsx':
+        from openpyxl import load_workbook
+        workbook = load_workbook(path, read_only=True)
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(name) for name in next(rows)]
+        tickets = [dict(zip(header, row)) for row in rows if any(value is not None for value in row)]
+        workbook.close()
+        return tickets
+    raise ValueError(f"Unsupported source file: {path} (use .csv, .json, .jsonl or .xlsx)")
+
+def _text(value):
+    """Value as SQLite's CAST(... AS TEXT) renders it (NULL as empty)"""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def row_hash_sql(columns, hash_function=HASH_FUNCTION):
+    """SQL expression hashing one tickets row"""
+    parts = ' || char(31) || '.join(["CAST(id AS TEXT)"] + [f"COALESCE(CAST({column} AS TEXT), '')" for column in columns])
+    return HASH_FUNCTIONS[hash_function][0].format(parts)
+
+def row_hash(ticket_id, row, columns, hash_function=HASH_FUNCTION):
+    """Python equivalent of row_hash_sql for a source row"""
+    text = SEPARATOR.join([str(ticket_id)] + [_text(row.get(column)) for column in columns])
+    return HASH_FUNCTIONS[hash_function][1](text.encode('utf-8'))
+
+def range_hash(row_hashes, hash_function=HASH_FUNCTION):
+    """Hash of a range: the hash of its row hashes concatenated in id order"""
+    return HASH_FUNCTIONS[hash_function][1](''.join(row_hashes).encode('utf-8'))
+
+def _ranges_sql(ranges):
+    return ' OR '.join(f"id BETWEEN {low} AND {high}" for low, high in ranges)
+
+class Reconciler:
+    """Compare source row hashes with the database, narrowing down differing id ranges"""
+
+    def __init__(self, execute, source_hashes, columns, where='', hash_function=HASH_FUNCTION,
+                 fanout=FANOUT, leaf_size=LEAF_SIZE):
+        self.execute = execute
+        self.source = source_hashes  # {id: row hash}
+        self.columns = columns
+        self.where = f"AND ({where})" if where else ''
+        self.hash_function = hash_function
+        self.fanout = fanout
+        self.leaf_size = leaf_size
+        self.queries = 0
+        self.hashes_transferred = 0
+
+    def _query(self, sql):
+        self.queries += 1
+        rows = self.execute(f"USE DATABASE 'my-database'; {sql}")
+        if not isinstance(rows, list):
+            raise RuntimeError("hash query failed")
+        self.hashes_transferred += len(rows)
+        return rows
+
+    def _database_buckets(self, low, width, ranges):
+        """{bucket: (count, range hash)} computed by the database for the given id ranges"""
+        rows = self._query(f'''
+            SELECT (id - {low}) / {width} AS bucket, COUNT(*) AS count,
+                   {HASH_FUNCTIONS[self.hash_function][0].format("group_concat(row_hash, '')")} AS hash
+            FROM (
+                SELECT id, {row_hash_sql(self.columns, self.hash_function)} AS row_hash
+                FROM tickets
+                WHERE ({_ranges_sql(ranges)}) {self.where}
+                ORDER BY id
+            )
+            GROUP BY bucket
+        ''')
+        return {int(row['bucket']): (int(row['count']), row['hash']) for row in rows}
+
+    def _source_buckets(self, low, width, ranges):
+        buckets = {}
+        for ticket_id in sorted(self.source):
+            if any(start <= ticket_id <= end for start, end in ranges):
+                buckets.setdefault((ticket_id - low) // width, []).append(self.source[ticket_id])
+        return {bucket: (len(hashes), range_hash(hashes, self.hash_function)) for bucket, hashes in buckets.items()}
+
+    def _database_rows(self, ranges):
+        rows = self._query(f'''
+            SELECT id, {row_hash_sql(self.columns, self.hash_function)} AS row_hash
+            FROM tickets
+            WHERE ({_ranges_sql(ranges)}) {self.where}
+        ''')
+        return {int(row['id']): row['row_hash'] for row in rows}
+
+    def run(self):
+        """Returns (missing ids, extra ids, changed ids) relative to the source"""
+        if not self.source:
+            return [], [], []
+        low, high = min(self.source), max(self.source)
+        ranges = [(low, high)]
+        width = max(self.leaf_size, -(-(high - low + 1) // self.fanout))
+
+        # Compare range hashes level by level until the differing ranges are leaf sized
+        while ranges and width > self.leaf_size:
+            ours = self._source_buckets(low, width, ranges)
+            theirs = self._database_buckets(low, width, ranges)
+            differing = sorted(bucket for bucket in set(ours) | set(theirs) if ours.get(bucket) != theirs.get(bucket))
+            ranges = [(low + bucket * width, min(high, low + (bucket + 1) * width - 1)) for bucket in differing]
+            width = max(self.leaf_size, -(-width // self.fanout))
+
+        if not ranges:
+            return [], [], []
+
+        # Compare the row hashes of the remaining ranges
+        database = self._database_rows(ranges)
+        source = {ticket_id: value for ticket_id, value in self.source.items()
+                  if any(start <= ticket_id <= end for start, end in ranges)}
+        missing = sorted(set(source) - set(database))
+        extra = sorted(set(database) - set(source))
+        changed = sorted(ticket_id for ticket_id in set(source) & set(database) if source[ticket_id] != database[ticket_id])
+        return missing, extra, changed
+
+def snapshot_hash_executor(path):
+    """Snapshot query function with the hash functions registered from hashlib"""
+    snapshot = TicketSnapshot(path)
+    snapshot.connection.create_function(
+        'sha3', 2, lambda text, bits: None if text is None else hashlib.new(f'sha3_{bits}', str(text).encode('utf-8')).digest())
+    snapshot.connection.create_function(
+        'sha1', 1, lambda text: None if text is None else hashlib.sha1(str(text).encode('utf-8')).digest())
+    snapshot.connection.create_function(
+        'md5', 1, lambda text: None if text is None else hashlib.md5(str(text).encode('utf-8')).digest())
+    return snapshot.rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Reconcile a ticket source file with the database using row hashes')
+    parser.add_argument('source', help='Source tickets (.csv, .json, .jsonl or .xlsx) with an id column')
+    parser.add_argument('--columns', nargs='+', default=None,
+                        help=f"Columns to compare (default: those of {', '.join(DEFAULT_COLUMNS)} in the source)")
+    parser.add_argument('--where', default='', help='Extra SQL condition restricting the database rows')
+    parser.add_argument('--hash', choices=sorted(HASH_FUNCTIONS), default=HASH_FUNCTION,
+                        help=f'SQL hash function of the database (default {HASH_FUNCTION})')
+    add_snapshot_argument(parser)
+    args = parser.parse_args()
+
+    if not args.snapshot and (not API_KEY or not API_URL):
+        print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+        exit(1)
+
+    print("🔐 Ticket Reconciliation")
+    print("========================")
+
+    rows = load_source(args.source)
+    if not rows or 'id' not in rows[0]:
+        print(f"❌ No tickets with an id column in {args.source}")
+        exit(1)
+
+    columns = args.columns or [column for column in DEFAULT_COLUMNS if column in rows[0]]
+    source = {int(float(row['id'])): row_hash(int(float(row['id'])), row, columns, args.hash) for row in rows}
+    print(f"📄 {len(source)} source tickets, comparing: {', '.join(columns)}")
+
+    execute = snapshot_hash_executor(args.snapshot) if args.snapshot else execute_query
+    reconciler = Reconciler(execute, source, columns, args.where, args.hash)
+
+    started = time.perf_counter()
+    try:
+        missing, extra, changed = reconciler.run()
+    except RuntimeError as e:
+        print(f"❌ Reconciliation failed: {e} (does the database provide {args.hash}()?)")
+        exit(1)
+
+    print(f"📡 {reconciler.queries} queries, {reconciler.hashes_transferred} hashes transferred in {time.perf_counter() - started:.1f}s")
+    if not (missing or extra or changed):
+        print(f"✅ All {len(source)} tickets match the database")
+        return
+
+    if missing:
+        print(f"❌ {len(missing)} tickets missing from the database: {missing[:20]}{' ...' if len(missing) > 20 else ''}")
+    if extra:
+        print(f"⚠️ {len(extra)} database tickets not in the source: {extra[:20]}{' ...' if len(extra) > 20 else ''}")
+    if changed:
+        print(f"❌ {len(changed)} tickets differ: {changed[:20]}{' ...' if len(changed) > 20 else ''}")
+    exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -94,9 +94,10 @@ def main():
     print("\n4. Creating a sample Week 2 ticket for demonstration...")
     sample_ticket_query = '''
         USE DATABASE 'my-database';
-        INSERT INTO tickets (timestamp, name, email, issue, notes, status, priority, assigned_agent, category)
+        INSERT INTO tickets (timestamp, created_at, name, email, issue, notes, status, priority, assigned_agent, category, incident_category, kb_article, response_template)
         VALUES (
             '2025-09-19 16:00:00',
+            1758297600,
             'Demo User',
             'demo@company.com',
             'Sample Week 2 ticket - Software installation issue',
@@ -104,7 +105,10 @@ def main():
             'Open',
             'Medium',
             '',
-            'Week 2: Software & Hardware Support'
+            'Week 2: Software & Hardware Support',
+            'Software Support',
+            'KB_General_Support',
+            'general'
         )
     '''
     result = execute_query(sample_ticket_query)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Local SMTP sink for offline testing of the IT Helpdesk email service
+Accepts every message (no TLS, any AUTH credentials), counts it and optionally saves it as .eml
+"""
+
+import argparse
+import os
+import socketserver
+import threading
+import time
+
+class SinkStats:
+    """Thread-safe counters for messages received by the sink"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.messages = 0
+        self.recipients = 0
+        self.bytes = 0
+        self.first_received = None
+        self.last_received = None
+
+    def record(self, recipients, size):
+        now = time.time()
+        with self.lock:
+            self.messages += 1
+            self.recipients += recipients
+            self.bytes += size
+            if self.first_received is None:
+                self.first_received = now
+            self.last_received = now
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'messages': self.messages,
+                'recipients': self.recipients,
+                'bytes': self.bytes,
+                'first_received': self.first_received,
+                'last_received': self.last_received
+            }
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP dialogue: EHLO/HELO, AUTH, MAIL, RCPT, DATA, RSET, NOOP, QUIT"""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode('ascii'))
+        self.wfile.flush()
+
+    def readline(self):
+        line = self.rfile.readline(65536)
+        if not line:
+            return None
+        return line.decode('utf-8', errors='replace').rstrip('\r\n')
+
+    def handle(self):
+        sender = None
+        recipients = []
+        self.reply('220 localhost IT Helpdesk SMTP sink ready')
+
+        while True:
+            line = self.readline()
+            if line is None:
+                return
+
+            command = line[:4].upper()
+
+            if command == 'EHLO':
+                self.wfile.write(b'250-localhost\r\n250-AUTH PLAIN LOGIN\r\n250-8BITMIME\r\n250 SIZE 52428800\r\n')
+                self.wfile.flush()
+            elif command == 'HELO':
+                self.reply('250 localhost')
+            elif command == 'AUTH':
+                parts = line.split()
+                if len(parts) >= 2 and parts[1].upper() == 'LOGIN':
+                    # Username and password challenges; any credentials are accepted
+                    if len(parts) < 3:
+                        self.reply('334 VXNlcm5hbWU6')
+                        self.readline()
+                    self.reply('334 UGFzc3dvcmQ6')
+                    self.readline()
+                elif len(parts) == 2:
+                    # AUTH PLAIN without an initial response
+                    self.reply('334 ')
+                    self.readline()
+                self.reply('235 2.7.0 Authentication successful')
+            elif command == 'MAIL':
+                sender = line[line.find(':') + 1:].strip()
+                recipients = []
+                self.reply('250 OK')
+            elif command == 'RCPT':
+                recipients.append(line[line.find(':') + 1:].strip())
+                self.reply('250 OK')
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                while True:
+                    data_line = self.rfile.readline(1048576)
+                    if not data_line or data_line in (b'.\r\n', b'.\n'):
+                        break
+                    if data_line.startswith(b'..'):
+                        data_line = data_line[1:]
+                    data.append(data_line)
+                self.server.deliver(sender, recipients, b''.join(data))
+                sender = None
+                recipients = []
+                self.reply('250 OK: queued')
+            elif command == 'RSET':
+                sender = None
+                recipients = []
+                self.reply('250 OK')
+            elif command == 'NOOP':
+                self.reply('250 OK')
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('502 Command not implemented')
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """Threaded SMTP server that swallows every message it receives"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host='127.0.0.1', port=8025, save_dir=None, verbose=False):
+        super().__init__((host, port), SMTPSinkHandler)
+        self.stats = SinkStats()
+        self.save_dir = save_dir
+        self.verbose = verbose
+        self._thread = None
+        if save_dir:
+            os.makedirs(save_dir, exist_ok=True)
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def deliver(self, sender, recipients, data):
+        """Record a received message and optionally write it to save_dir"""
+        self.stats.record(len(recipients), len(data))
+
+        if self.save_dir:
+            count = self.stats.snapshot()['messages']
+            filename = os.path.join(self.save_dir, f"message_{count:06d}.eml")
+            with open(filename, 'wb') as f:
+                f.write(data)
+
+        if self.verbose:
+            print(f"📨 {sender} -> {', '.join(recipients)} ({len(data)} bytes)")
+
+    def start(self):
+        """Serve in a background daemon thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name='smtp-sink', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self.shutdown()
+        self.server_close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Local SMTP sink for the IT Helpdesk email service')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8025, help='Port to listen on (default: 8025)')
+    parser.add_argument('--save-dir', help='Write every received message to this directory as .eml')
+    parser.add_argument('--quiet', action='store_true', help='Do not print a line per message')
+    args = parser.parse_args()
+
+    sink = SMTPSink(args.host, args.port, save_dir=args.save_dir, verbose=not args.quiet)
+
+    print("📭 IT Helpdesk SMTP Sink")
+    print("=======================")
+    print(f"🔌 Listening on {args.host}:{sink.port}")
+    print("⚙️ Point the email service at it with:")
+    print(f"   MAIL_SERVER={args.host} MAIL_PORT={sink.port} MAIL_USE_TLS=False")
+    print()
+
+    try:
+        sink.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stats = sink.stats.snapshot()
+        sink.server_close()
+        print()
+        print(f"📊 Received {stats['messages']} messages for {stats['recipients']} recipients ({stats['bytes']} bytes)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test that the app's SQL statements keep using indexes
+Builds a local SQLite database from database_schema.sql, database_schema_updated.sql
+and the migration scripts, seeds it with tickets and runs EXPLAIN QUERY PLAN for
+every statement in app_queries.py. A statement that scans the tickets table,
+even through an index, or sorts without one fails the test, unless it reads
+the table in full on purpose (WHOLE_TABLE_READS). Runs with pytest or as a
+script.
+"""
+
+import os
+import random
+import re
+import sqlite3
+import sys
+
+from add_classification_columns import CLASSIFICATION_MIGRATION
+from add_created_at_column import CREATED_AT_MIGRATION
+from add_import_key_column import IMPORT_KEY_MIGRATION
+from add_ticket_counters import TICKET_COUNTERS_MIGRATION
+from add_updated_at_column import UPDATED_AT_MIGRATION
+from app_queries import APP_QUERIES, TICKETS_QUERY, WHOLE_TABLE_READS, plan_problems
+
+SCHEMA_DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_FILES = ['database_schema.sql', 'database_schema_updated.sql']
+
+# add_category_column.py applies this inline
+CATEGORY_MIGRATION = ["ALTER TABLE tickets ADD COLUMN category TEXT DEFAULT 'General'"]
+
+SEED_TICKETS = 2000
+
+def build_database(tickets=SEED_TICKETS):
+    """In-memory database with the production schema and migrations, seeded and analyzed"""
+    connection = sqlite3.connect(':memory:', check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+
+    for path in SCHEMA_FILES:
+        with open(os.path.join(SCHEMA_DIR, path), encoding='utf-8') as f:
+            connection.executescript(re.sub(r"USE DATABASE '[^']*';", '', f.read()))
+
+    for migration in (CREATED_AT_MIGRATION, CLASSIFICATION_MIGRATION, UPDATED_AT_MIGRATION,
+                      CATEGORY_MIGRATION, IMPORT_KEY_MIGRATION, TICKET_COUNTERS_MIGRATION):
+        for statement in migration:
+            run(connection, statement)
+
+    rng = random.Random(0)
+    connection.executemany(
+        '''INSERT INTO tickets (timestamp, created_at, name, email, issue, notes, status, priority, assigned_agent, category)
+           VALUES (?, ?, ?, ?, ?, '', ?, ?, ?, ?)''',
+        [('2025-09-01 09:00:00', 1756717200 + i * 60, f'User {i}', f'user{i}@company.com', f'Issue {i}',
+          rng.choice(['Open', 'In Progress', 'Resolved']), rng.choice(['Low', 'Medium', 'High']),
+          rng.choice(['', 'Azola Xabadiya', 'Keawin Koesnel']), rng.choice(['General', 'Week 2: Software & Hardware Support']))
+         for i in range(tickets)]
+    )
+    connection.execute('ANALYZE')
+    return connection
+
+def run(connection, statement):
+    """Apply one schema statement; ALTER TABLE on an existing column is skipped like in the migrations"""
+    try:
+        connection.execute(statement)
+    except sqlite3.OperationalError as e:
+        if 'duplicate column' not in str(e):
+            raise
+
+def query_plan(connection, query):
+    return [dict(row) for row in connection.execute(f'EXPLAIN QUERY PLAN {query}')]
+
+def test_app_queries_use_indexes():
+    """Every app statement reads tickets through an index"""
+    connection = build_database()
+    failures = {name: plan_problems(query_plan(connection, query), WHOLE_TABLE_READS.get(name, ()))
+                for name, query in APP_QUERIES.items()}
+    failures = {name: problems for name, problems in failures.items() if problems}
+    assert not failures, f"Statements scanning tickets: {failures}"
+
+def test_full_scan_is_detected():
+    """Without idx_tickets_created_at the agent page query is reported"""
+    connection = build_database(tickets=100)
+    connection.execute('DROP INDEX idx_tickets_created_at')
+    assert plan_problems(query_plan(connection, TICKETS_QUERY), {'tickets'})
+
+def test_index_scan_is_detected():
+    """Reading every ticket through an index counts as a scan unless it is deliberate"""
+    connection = build_database(tickets=100)
+    query = "SELECT assigned_agent, COUNT(*) FROM tickets WHERE assigned_agent != '' GROUP BY assigned_agent"
+    problems = plan_problems(query_plan(connection, query))
+    assert problems and problems[0].startswith('SCAN tickets USING')
+
+def test_view_coroutine_is_not_a_scan():
+    """Scanning the rows of a view is judged by the view's own steps"""
+    connection = build_database(tickets=100)
+    connection.execute('CREATE VIEW priorities AS SELECT priority, COUNT(*) FROM tickets GROUP BY priority ORDER BY 2')
+    problems = plan_problems(query_plan(connection, 'SELECT * FROM priorities'))
+    assert problems and not any(problem.startswith('SCAN priorities') for problem in problems)
+
+def main():
+    """Print the plan of every app statement and exit 1 if one scans tickets"""
+    print("🔎 App Query Plans")
+    print("==================")
+
+    connection = build_database()
+    failed = 0
+    for name, query in APP_QUERIES.items():
+        plan = query_plan(connection, query)
+        problems = plan_problems(plan, WHOLE_TABLE_READS.get(name, ()))
+        failed += bool(problems)
+        print(f"{'❌' if problems else '✅'} {name}")
+        for row in plan:
+            print(f"   - {row['detail']}")
+
+    print()
+    if failed:
+        print(f"❌ {failed} statements scan the tickets table or sort without an index")
+        return False
+    print(f"✅ All {len(APP_QUERIES)} app statements use indexes")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
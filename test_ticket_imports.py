@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test that re-running the ticket imports does not duplicate tickets
+The import scripts run against the seeded local SQLite database of
+test_query_plans.py instead of SQLiteCloud (their execute_query is replaced),
+so ticket ids are already taken and the tickets get their import_key from the
+add_import_key_column.py backfill. Runs with pytest or as a script.
+"""
+
+import contextlib
+import io
+import os
+import re
+import sqlite3
+import sys
+import threading
+
+# The import scripts exit without credentials; no request is sent
+os.environ.setdefault('SQLITECLOUD_API_KEY', 'test')
+os.environ.setdefault('SQLITECLOUD_URL', 'http://localhost/test')
+
+import pandas as pd
+
+import add_import_key_column
+import import_excel_tickets
+import import_week3_tickets
+from test_query_plans import SCHEMA_DIR, build_database
+
+BOOK = os.path.join(SCHEMA_DIR, 'assests', 'Book.xlsx')
+
+def executor(connection):
+    """execute_query for the scripts, answering {'data': rows} from the local database
+
+    Requests from the import's worker threads are served one at a time, like
+    the server does.
+    """
+    lock = threading.Lock()
+
+    def execute(query):
+        statement, _, changes = re.sub(r"USE DATABASE '[^']*';", '', query).partition('; SELECT changes() AS changes')
+        with lock:
+            try:
+                rows = [dict(row) for row in connection.execute(statement)]
+                if changes:
+                    rows = [dict(row) for row in connection.execute('SELECT changes() AS changes')]
+                return {'data': rows}
+            except sqlite3.Error:
+                return None
+    return execute
+
+def ticket_count(connection):
+    return connection.execute('SELECT COUNT(*) FROM tickets').fetchone()[0]
+
+def backfill(connection):
+    """Key the seeded tickets like add_import_key_column.py does"""
+    add_import_key_column.execute_query = executor(connection)
+    assert add_import_key_column.backfill_keys() is not None
+
+def test_week3_import_ignores_source_ids():
+    """The Week 3 tickets are numbered by the database, not as 44 and 45, and a re-run adds nothing"""
+    connection = build_database(tickets=100)
+    backfill(connection)
+    import_week3_tickets.execute_query = executor(connection)
+    before = ticket_count(connection)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        import_week3_tickets.import_week3_tickets()
+    assert ticket_count(connection) == before + 2
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        import_week3_tickets.import_week3_tickets()
+    assert ticket_count(connection) == before + 2
+
+def test_excel_import_rerun_keeps_row_count():
+    """Book.xlsx tickets filed under Week 1 and backfilled match a re-import"""
+    connection = build_database(tickets=100)
+    import_excel_tickets.execute_query = executor(connection)
+    df = pd.read_excel(BOOK, sheet_name='Ticket Tracker')
+    seeded = ticket_count(connection)
+    with contextlib.redirect_stdout(io.StringIO()):
+        import_excel_tickets.import_tickets_to_database(df, workers=4, batch_size=5)
+    assert ticket_count(connection) > seeded
+
+    # As imported before import_key existed, then organized by add_category_column.py
+    connection.execute('UPDATE tickets SET import_key = NULL')
+    connection.execute("UPDATE tickets SET category = 'Week 1: Account and Communications Support' WHERE status = 'Resolved'")
+    backfill(connection)
+    before = ticket_count(connection)
+
+    for _ in range(2):
+        with contextlib.redirect_stdout(io.StringIO()):
+            import_excel_tickets.import_tickets_to_database(df, workers=4, batch_size=5)
+        assert ticket_count(connection) == before
+
+def main():
+    """Run the import tests and exit 1 if one fails"""
+    print("🎫 Import Re-run Tests")
+    print("======================")
+
+    tests = [test_week3_import_ignores_source_ids, test_excel_import_rerun_keeps_row_count]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print()
+    if failed:
+        print(f"❌ {failed} of {len(tests)} import tests failed")
+        return False
+    print(f"✅ All {len(tests)} import tests passed")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
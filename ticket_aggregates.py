@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Single-pass ticket aggregation for the summary sheets
+One groupby over status x priority x agent x category counts every ticket
+once; the Summary, Agent Workload and Category Breakdown tables are all read
+off that small cube instead of re-filtering the full ticket DataFrame per
+metric. Agents and categories are discovered from the data.
+
+The cube can also be computed by the database (CUBE_QUERY), so reports that
+only need statistics transfer a few summary rows instead of the whole table.
+"""
+
+import pandas as pd
+
+UNASSIGNED = 'Unassigned'
+STATUSES = ['Resolved', 'Open', 'In Progress']
+PRIORITIES = ['High', 'Medium', 'Low']
+
+# Columns of the Agent Workload and Category Breakdown tables
+WORKLOAD_COLUMNS = ['Total_Tickets', 'High_Priority', 'Resolved_Tickets']
+
+# Same cube as build_cube(), grouped by the database
+CUBE_QUERY = '''
+    SELECT
+        COALESCE(NULLIF(TRIM(status), ''), 'Open') AS status,
+        COALESCE(NULLIF(TRIM(priority), ''), 'Medium') AS priority,
+        COALESCE(NULLIF(TRIM(assigned_agent), ''), 'Unassigned') AS agent,
+        COALESCE(NULLIF(TRIM(category), ''), 'General') AS category,
+        COUNT(*) AS count
+    FROM tickets
+    {where}
+    GROUP BY 1, 2, 3, 4
+'''
+
+def _dimension(df, column, default):
+    """A grouping column with blanks replaced, or a constant if the frame lacks it"""
+    if column not in df:
+        return pd.Series(default, index=df.index)
+    values = df[column].where(df[column].notna(), default).astype(str).str.strip()
+    return values.where(values != '', default)
+
+def build_cube(df, status_column='Status', priority_column='Priority',
+               agent_column='AssignedAgent', category_column='Category'):
+    """Count tickets per (status, priority, agent, category) in one pass"""
+    keys = pd.DataFrame({
+        'status': _dimension(df, status_column, 'Open'),
+        'priority': _dimension(df, priority_column, 'Medium'),
+        'agent': _dimension(df, agent_column, UNASSIGNED),
+        'category': _dimension(df, category_column, 'General')
+    })
+    return keys.groupby(['status', 'priority', 'agent', 'category'], sort=False).size().rename('count').reset_index()
+
+def _workload(cube, dimension):
+    """Total / High priority / Resolved counts per value of one dimension"""
+    table = pd.DataFrame({
+        'Total_Tickets': cube.groupby(dimension)['count'].sum(),
+        'High_Priority': cube[cube['priority'] == 'High'].groupby(dimension)['count'].sum(),
+        'Resolved_Tickets': cube[cube['status'] == 'Resolved'].groupby(dimension)['count'].sum()
+    }).fillna(0).astype(int)
+    table.index.name = None
+    return table[WORKLOAD_COLUMNS]
+
+def aggregate_tickets(df, **columns):
+    """Aggregate a ticket DataFrame into every summary table at once
+
+    Returns a dict with total, status and priority counts, the agents and
+    categories found (busiest first), and agent_workload/category_breakdown
+    DataFrames indexed by agent/category.
+    """
+    return aggregate_cube(build_cube(df, **columns))
+
+def fetch_aggregates(execute_query, where=''):
+    """Aggregate in the database and return the same dict as aggregate_tickets()
+
+    execute_query is the calling script's SQLiteCloud helper; it may return the
+    rows or the raw response with a 'data' key. Returns None if the query fails.
+    """
+    result = execute_query(f"USE DATABASE 'my-database'; {CUBE_QUERY.format(where=where)}")
+    if isinstance(result, dict):
+        result = result.get('data')
+    if not isinstance(result, list):
+        return None
+    cube = pd.DataFrame(result, columns=['status', 'priority', 'agent', 'category', 'count'])
+    cube['count'] = cube['count'].astype(int)
+    return aggregate_cube(cube)
+
+def aggregate_cube(cube):
+    """Derive every summary table from a status x priority x agent x category count cube"""
+    agent_workload = _workload(cube, 'agent')
+    category_breakdown = _workload(cube, 'category')
+    status = cube.groupby('status')['count'].sum()
+    priority = cube.groupby('priority')['count'].sum()
+
+    agent_workload = agent_workload.sort_values('Total_Tickets', ascending=False, kind='stable')
+    category_breakdown = category_breakdown.sort_index()
+
+    return {
+        'total': int(cube['count'].sum()),
+        'status': {key: int(value) for key, value in status.items()},
+        'priority': {key: int(value) for key, value in priority.items()},
+        'agents': list(agent_workload.index),
+        'categories': list(category_breakdown.index),
+        'agent_workload': agent_workload,
+        'category_breakdown': category_breakdown
+    }
+
+def summary_frame(aggregates, include_categories=False):
+    """Metric/Count table for the Summary sheet"""
+    rows = [('Total Tickets', aggregates['total'])]
+    rows += [(f'{status} Tickets', aggregates['status'].get(status, 0)) for status in STATUSES]
+    rows += [(f'{priority} Priority Tickets', aggregates['priority'].get(priority, 0)) for priority in PRIORITIES]
+
+    if include_categories:
+        rows.append(('', ''))
+    workload = aggregates['agent_workload']['Total_Tickets']
+    for agent in aggregates['agents']:
+        label = 'Unassigned Tickets' if agent == UNASSIGNED else f'Tickets by {agent}'
+        rows.append((label, int(workload[agent])))
+
+    if include_categories:
+        rows.append(('', ''))
+        breakdown = aggregates['category_breakdown']['Total_Tickets']
+        for category in aggregates['categories']:
+            rows.append((category, int(breakdown[category])))
+
+    return pd.DataFrame(rows, columns=['Metric', 'Count'])
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Rules-driven issue classifier for incident categories, KB articles, agent responses and resolution notes
+All rule keywords are compiled once into a single trie-shaped regex, so each issue
+is scanned in one pass and every rule set is then evaluated against the set of
+keywords found, instead of re-scanning the text once per `'x' in issue` check.
+"""
+
+import re
+
+# A rule is (label, clauses): every clause must match, and a clause matches when
+# any of its keywords occurs in the lower-cased issue text (substring semantics).
+# Rules are tried in order and the first match wins, like the if/elif chains they replace.
+
+# KB article for the daily log exports (export_daily_log*.py)
+KB_ARTICLE_RULES = [
+    ('KB_Password_Reset', [('password',), ('forgotten',)]),
+    ('KB_Password_Reset', [('lockout', 'locked')]),
+    ('KB_Account_Enable', [('disabled',)]),
+    ('KB_MFA_Reset', [('outlook', 'authentication')]),
+    ('KB_MFA_Reset', [('mfa',), ('lost',)]),
+    ('KB_Temp_Account', [('temporary',), ('contractor',)]),
+    ('KB_Security_Check', [('suspicious', 'unknown')]),
+    ('KB_Password_Reset', [('expired',)]),
+]
+DEFAULT_KB_ARTICLE = 'KB_General_Support'
+
+# Incident category for the comprehensive log
+INCIDENT_CATEGORY_RULES = [
+    ('Account / Authentication', [('password', 'account', 'login', 'authentication', 'mfa', 'lockout')]),
+    ('Hardware Support', [('laptop', 'hardware', 'bsod', 'fan', 'usb', 'monitor')]),
+    ('Network Support', [('network', 'wifi', 'ethernet', 'internet', 'connection')]),
+    ('Software Support', [('software', 'windows', 'browser', 'outlook', 'application')]),
+    ('Security Incident', [('stolen', 'security', 'burglary', 'remote wipe')]),
+]
+DEFAULT_INCIDENT_CATEGORY = 'General Support'
+
+# KB article linked to each incident category
+CATEGORY_KB_ARTICLES = {
+    'Account / Authentication': 'KB_Account_Management',
+    'Hardware Support': 'KB_Hardware_Troubleshooting',
+    'Network Support': 'KB_Network_Connectivity',
+    'Software Support': 'KB_Software_Support',
+    'Security Incident': 'KB_Security_Procedures',
+    'General Support': 'KB_General_Support'
+}
+
+# Agent response template for the comprehensive log
+AGENT_RESPONSE_RULES = [
+    ('password', [('password', 'lockout')]),
+    ('stolen', [('stolen', 'burglary')]),
+    ('crash', [('bsod', 'crash')]),
+    ('network', [('network', 'wifi', 'internet')]),
+    ('hardware', [('hardware', 'laptop', 'fan')]),
+]
+DEFAULT_AGENT_RESPONSE = 'general'
+
+AGENT_RESPONSES = {
+    'password': "Hello, I can help with that. For security, I need to verify your identity first.\n\nPlease provide your full name and username, and I will call you back on the number we have on file to confirm and then reset your password.\n\nA temporary password will be set, and you'll be required to change it on first login.",
+    'stolen': "I understand this is urgent. I'm immediately initiating our security protocol.\n\nI'll start the remote wipe procedure and coordinate with security to ensure all data is protected. A replacement device will be arranged as quickly as possible.\n\nPlease stay on the line while I handle this security incident.",
+    'crash': "I can help diagnose this system crash. Let me gather some information first.\n\nCan you tell me what you were doing when the crash occurred? Also, please note any error messages you saw.\n\nI'll run some diagnostic checks and get this resolved for you.",
+    'network': "I'll help you get your network connection working. Let me check a few things.\n\nFirst, let's verify your network settings and test connectivity. I'll also check if this is affecting other users.\n\nThis should be a quick fix once I identify the issue.",
+    'hardware': "I can help with this hardware issue. Let me assess the situation.\n\nI'll check system diagnostics and determine if this requires immediate replacement or if we can resolve it with troubleshooting.\n\nI'll keep you updated on the progress and timeline.",
+    'general': "Thank you for contacting IT support. I'm here to help resolve this issue.\n\nLet me gather some additional information and then I'll work on getting this sorted out for you.\n\nI'll keep you informed of my progress and any next steps."
+}
+
+# Resolution notes template for account tickets (update_ticket_notes.py)
+ACCOUNT_RESOLUTION_RULES = [
+    ('password_reset', [('password',), ('forgotten',)]),
+    ('recurring_lockout', [('lockout', 'locked'), ('recurring',)]),
+    ('account_lockout', [('lockout', 'locked')]),
+    ('account_disabled', [('disabled',)]),
+    ('outlook_authentication', [('outlook', 'authentication')]),
+    ('mfa_lost_device', [('mfa',), ('lost',)]),
+    ('temporary_account', [('temporary',), ('contractor',)]),
+    ('suspicious_activity', [('suspicious', 'unknown')]),
+    ('password_expired', [('expired',)]),
+]
+DEFAULT_ACCOUNT_RESOLUTION = 'general'
+
+# Resolution notes template for Week 2 software & hardware tickets (import_week2_tickets.py)
+HARDWARE_RESOLUTION_RULES = [
+    ('slow_boot', [('laptop takes 15 minutes to boot',)]),
+    ('bsod_external_monitor', [('bsod',), ('external monitor',)]),
+    ('unidentified_network', [('unidentified network',)]),
+    ('burglary_replacement', [('replacement laptop',), ('burglary',)]),
+    ('loud_fan', [('fan is always loud',)]),
+    ('usb_crash', [('usb device',), ('crashes',)]),
+    ('wifi_no_internet', [('wi-fi connects but no internet',)]),
+    ('stolen_coffee_shop', [('laptop was stolen',), ('coffee shop',)]),
+    ('browser_tabs', [('unresponsive',), ('browser tabs',)]),
+    ('bsod_windows_updates', [('bsod',), ('windows updates',)]),
+    ('network_works_on_phone', [('network works on phone',)]),
+    ('stolen_business_trip', [('laptop was stolen',), ('business trip',)]),
+]
+DEFAULT_HARDWARE_RESOLUTION = 'general'
+
+# Rule sets evaluated by classify_issue(), as field -> (rules, default)
+RULE_SETS = {
+    'incident_category': (INCIDENT_CATEGORY_RULES, DEFAULT_INCIDENT_CATEGORY),
+    'kb_article': (KB_ARTICLE_RULES, DEFAULT_KB_ARTICLE),
+    'agent_response': (AGENT_RESPONSE_RULES, DEFAULT_AGENT_RESPONSE),
+    'account_resolution': (ACCOUNT_RESOLUTION_RULES, DEFAULT_ACCOUNT_RESOLUTION),
+    'hardware_resolution': (HARDWARE_RESOLUTION_RULES, DEFAULT_HARDWARE_RESOLUTION),
+}
+
+def _trie_pattern(keywords):
+    """Build a regex equivalent to a trie of the keywords (longest match wins at each position)"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def emit(node):
+        end = '' in node
+        children = sorted(char for char in node if char)
+        if not children:
+            return ''
+        branches = [re.escape(char) + emit(node[char]) for char in children]
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if end:
+            body = '(?:' + body + ')?'
+        return body
+
+    return emit(trie)
+
+def _compile_keywords(rule_sets):
+    """Compile every keyword of every rule set into one scanning regex"""
+    keywords = set()
+    for rules, _ in rule_sets.values():
+        for _, clauses in rules:
+            for clause in clauses:
+                keywords.update(clause)
+
+    # The regex records only the longest keyword starting at each position, so
+    # also credit every keyword contained in it ('lock' inside 'lockout')
+    contained = {
+        keyword: frozenset(other for other in keywords if other in keyword)
+        for keyword in keywords
+    }
+    pattern = re.compile('(?=(' + _trie_pattern(keywords) + '))')
+    return pattern, contained
+
+_KEYWORD_PATTERN, _CONTAINED_KEYWORDS = _compile_keywords(RULE_SETS)
+
+def find_keywords(issue):
+    """Return the set of rule keywords occurring in the issue text (one pass)"""
+    text = str(issue).lower() if issue is not None else ''
+    found = set()
+    for match in _KEYWORD_PATTERN.finditer(text):
+        keyword = match.group(1)
+        if keyword:
+            found |= _CONTAINED_KEYWORDS[keyword]
+    return found
+
+def match_rules(keywords, rules, default):
+    """Return the label of the first rule whose clauses all match the found keywords"""
+    for label, clauses in rules:
+        if all(not keywords.isdisjoint(clause) for clause in clauses):
+            return label
+    return default
+
+def classify_issue(issue):
+    """Classify one issue against every rule set"""
+    keywords = find_keywords(issue)
+    result = {
+        field: match_rules(keywords, rules, default)
+        for field, (rules, default) in RULE_SETS.items()
+    }
+    result['category_kb_article'] = CATEGORY_KB_ARTICLES.get(result['incident_category'], DEFAULT_KB_ARTICLE)
+    return result
+
+def classify_issues(issues):
+    """Classify a column of issues; identical texts are only scanned once"""
+    cache = {}
+    results = []
+    for issue in issues:
+        key = '' if issue is None else str(issue)
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = classify_issue(key)
+        results.append(result)
+    return results
+
+def classify_field(issues, field):
+    """Classify a column of issues and return a single field, e.g. 'kb_article'"""
+    return [result[field] for result in classify_issues(issues)]
+
+def get_kb_article(issue):
+    """KB article for a daily log row"""
+    return match_rules(find_keywords(issue), KB_ARTICLE_RULES, DEFAULT_KB_ARTICLE)
+
+def get_incident_category(issue):
+    """Incident category for a comprehensive log row"""
+    return match_rules(find_keywords(issue), INCIDENT_CATEGORY_RULES, DEFAULT_INCIDENT_CATEGORY)
+
+def get_category_kb_article(category):
+    """KB article linked to an incident category"""
+    return CATEGORY_KB_ARTICLES.get(category, DEFAULT_KB_ARTICLE)
+
+def get_agent_response(issue):
+    """Agent response text for an issue"""
+    return AGENT_RESPONSES[match_rules(find_keywords(issue), AGENT_RESPONSE_RULES, DEFAULT_AGENT_RESPONSE)]
+
+def get_account_resolution(issue):
+    """Resolution notes template key for an account ticket"""
+    return match_rules(find_keywords(issue), ACCOUNT_RESOLUTION_RULES, DEFAULT_ACCOUNT_RESOLUTION)
+
+def get_hardware_resolution(issue):
+    """Resolution notes template key for a Week 2 software & hardware ticket"""
+    return match_rules(find_keywords(issue), HARDWARE_RESOLUTION_RULES, DEFAULT_HARDWARE_RESOLUTION)
+
+# Classification persisted on the tickets table at write time (see add_classification_columns.py)
+CLASSIFICATION_COLUMNS = ('incident_category', 'kb_article', 'response_template')
+
+def classification_columns(issue):
+    """Stored classification for an issue, as {column: value}"""
+    result = classify_issue(issue)
+    return {
+        'incident_category': result['incident_category'],
+        'kb_article': result['kb_article'],
+        'response_template': result['agent_response']
+    }
+
+def classification_literals(issue):
+    """SQL literals for CLASSIFICATION_COLUMNS, for use in an INSERT ... VALUES list"""
+    values = classification_columns(issue)
+    return ', '.join("'" + values[column].replace("'", "''") + "'" for column in CLASSIFICATION_COLUMNS)
+
+_COLUMN_FIELDS = {
+    'incident_category': 'incident_category',
+    'kb_article': 'kb_article',
+    'response_template': 'agent_response'
+}
+
+def _is_missing(value):
+    # None, '' and pandas NaN (NaN != NaN)
+    return value is None or value == '' or value != value
+
+def stored_classification(stored, issues, column):
+    """Read a stored classification column, classifying only rows written before it existed"""
+    stored = list(stored)
+    issues = list(issues)
+    missing = [index for index, value in enumerate(stored) if _is_missing(value)]
+    if missing:
+        classified = classify_field((issues[index] for index in missing), _COLUMN_FIELDS[column])
+        for index, value in zip(missing, classified):
+            stored[index] = value
+    return stored
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+PDF rendering of the ticket export (/export_pdf)
+The tickets are laid out as a sequence of page-sized tables, each with its
+own header row, so reportlab never has to measure and split one table
+holding every ticket.
+"""
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table
+
+from pdf_styles import REPORT_TITLE, TICKET_TABLE_STYLE
+
+TABLE_HEADER = ['ID', 'Timestamp', 'Name', 'Email', 'Issue', 'Notes', 'Status', 'Priority', 'Agent']
+COLUMN_WIDTHS = [0.4*inch, 1*inch, 0.8*inch, 1.2*inch, 1.5*inch, 1.2*inch, 0.6*inch, 0.6*inch, 0.8*inch]
+
+# Top + bottom padding of the page frame of SimpleDocTemplate
+FRAME_PADDING = 12
+
+def _truncate(text, length):
+    return text[:length] + '...' if len(text) > length else text
+
+def build_ticket_row(ticket):
+    """Table cells for one ticket (long issue and notes text truncated)"""
+    return [
+        str(ticket.get('id', '')),
+        ticket.get('timestamp') or '',
+        ticket.get('name') or '',
+        ticket.get('email') or '',
+        _truncate(ticket.get('issue') or '', 40),
+        _truncate(ticket.get('notes') or '', 25),
+        ticket.get('status') or 'Open',
+        ticket.get('priority') or 'Medium',
+        ticket.get('assigned_agent') or 'Unassigned'
+    ]
+
+def rows_per_page(available_height):
+    """How many single-line ticket rows fit under a header row in the given height"""
+    sample = Table([TABLE_HEADER, TABLE_HEADER], colWidths=COLUMN_WIDTHS, style=TICKET_TABLE_STYLE)
+    sample.wrap(sum(COLUMN_WIDTHS), available_height)
+    header_height, row_height = sample._rowHeights
+    return max(1, int((available_height - header_height) // row_height))
+
+def table_chunks(tickets, first_page_rows, page_rows):
+    """Page-sized tables of the tickets, each starting with the header row
+
+    repeatRows keeps the header on the continuation if a chunk still has to
+    be split (e.g. rows with multi-line values).
+    """
+    start, size = 0, first_page_rows
+    while start < len(tickets):
+        rows = [build_ticket_row(ticket) for ticket in tickets[start:start + size]]
+        yield Table([TABLE_HEADER] + rows, colWidths=COLUMN_WIDTHS, style=TICKET_TABLE_STYLE, repeatRows=1)
+        start, size = start + size, page_rows
+
+def build_tickets_pdf(tickets, output):
+    """Write the tickets report to output (a path or a binary file object)"""
+    doc = SimpleDocTemplate(output, pagesize=letter)
+    page_height = doc.height - FRAME_PADDING
+
+    title = Paragraph("IT Helpdesk Tickets Report", REPORT_TITLE)
+    spacer = Spacer(1, 20)
+    title_height = title.wrap(doc.width, page_height)[1] + REPORT_TITLE.spaceAfter + spacer.height
+
+    story = [title, spacer]
+    story.extend(table_chunks(tickets, rows_per_page(page_height - title_height), rows_per_page(page_height)))
+    if not tickets:
+        story.append(Table([TABLE_HEADER], colWidths=COLUMN_WIDTHS, style=TICKET_TABLE_STYLE))
+
+    doc.build(story)
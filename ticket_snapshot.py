@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Local snapshot of the tickets table for offline reporting
+`python ticket_snapshot.py` copies the tickets table from SQLiteCloud into a
+local SQLite file (tickets_snapshot.db). Later runs only fetch tickets added or
+changed since the last refresh (by id / updated_at) and drop tickets deleted
+remotely. Reporting and verify scripts accept --snapshot to run their queries
+against that file instead of the production database.
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import time
+
+import requests
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# SQLiteCloud configuration
+API_KEY = os.getenv('SQLITECLOUD_API_KEY')
+API_URL = os.getenv('SQLITECLOUD_URL')
+
+headers = {
+    'Authorization': f'Bearer {API_KEY}',
+    'Content-Type': 'application/json'
+}
+
+DEFAULT_SNAPSHOT = os.getenv('TICKET_SNAPSHOT_PATH', 'tickets_snapshot.db')
+
+# Tickets fetched per request while refreshing
+PAGE_SIZE = 1000
+
+# Columns reports filter on, indexed locally when present
+INDEXED_COLUMNS = ['created_at', 'updated_at', 'status', 'category', 'assigned_agent']
+
+USE_DATABASE = re.compile(r"^\s*USE\s+DATABASE\s+'[^']*'\s*;", re.IGNORECASE)
+
+def execute_query(query):
+    """Execute a SQL query on SQLiteCloud"""
+    try:
+        payload = {"sql": query}
+        response = requests.post(API_URL, json=payload, headers=headers, timeout=60)
+
+        if response.status_code == 200:
+            result = response.json()
+            if 'data' in result:
+                return result['data']
+            return result
+        else:
+            print(f"❌ Query failed: {response.text}")
+            return None
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return None
+
+def _connect(path):
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE IF NOT EXISTS snapshot_meta (key TEXT PRIMARY KEY, value TEXT)")
+    return connection
+
+def _meta(connection):
+    return dict(connection.execute("SELECT key, value FROM snapshot_meta"))
+
+def _local_columns(connection):
+    return [row[1] for row in connection.execute("PRAGMA table_info(tickets)")]
+
+def _ensure_columns(connection, columns):
+    """Create the local tickets table, or add columns that appeared remotely"""
+    existing = _local_columns(connection)
+    if not existing:
+        definitions = ', '.join('id INTEGER PRIMARY KEY' if c == 'id' else f'"{c}"' for c in columns)
+        connection.execute(f"CREATE TABLE tickets ({definitions})")
+        existing = list(columns)
+    for column in columns:
+        if column not in existing:
+            connection.execute(f'ALTER TABLE tickets ADD COLUMN "{column}"')
+    for column in INDEXED_COLUMNS:
+        if column in columns:
+            connection.execute(f'CREATE INDEX IF NOT EXISTS idx_tickets_{column} ON tickets("{column}")')
+
+def _store(connection, rows):
+    columns = list(rows[0])
+    _ensure_columns(connection, columns)
+    names = ', '.join(f'"{c}"' for c in columns)
+    placeholders = ', '.join('?' for _ in columns)
+    connection.executemany(
+        f"INSERT OR REPLACE INTO tickets ({names}) VALUES ({placeholders})",
+        [[row.get(c) for c in columns] for row in rows]
+    )
+
+def _drop_deleted(connection):
+    """Remove local tickets that no longer exist remotely (only checked when the counts differ)"""
+    result = execute_query("USE DATABASE 'my-database'; SELECT COUNT(*) AS total FROM tickets")
+    if not result:
+        return 0
+    local_total = connection.execute("SELECT COUNT(*) FROM tickets").fetchone()[0]
+    if int(result[0]['total']) == local_total:
+        return 0
+
+    remote_ids = execute_query("USE DATABASE 'my-database'; SELECT id FROM tickets ORDER BY id")
+    if remote_ids is None:
+        return 0
+    remote = {int(row['id']) for row in remote_ids}
+    deleted = [(i,) for (i,) in connection.execute("SELECT id FROM tickets") if i not in remote]
+    connection.executemany("DELETE FROM tickets WHERE id = ?", deleted)
+    return len(deleted)
+
+def refresh_snapshot(path=DEFAULT_SNAPSHOT, full=False):
+    """Bring the local snapshot up to date; returns (fetched, deleted) or None on failure"""
+    connection = _connect(path)
+    try:
+        # One transaction, so a failed refresh leaves the previous snapshot intact
+        connection.execute("BEGIN")
+        meta = {} if full else _meta(connection)
+        if full:
+            connection.execute("DROP TABLE IF EXISTS tickets")
+
+        changed = ''
+        if meta.get('last_id') is not None:
+            changed = f"AND (id > {int(meta['last_id'])} OR updated_at >= {int(meta['last_updated_at'])})"
+
+        last_id = int(meta.get('last_id', 0))
+        last_updated_at = int(meta.get('last_updated_at', 0))
+        cursor = 0
+        fetched = 0
+        while True:
+            rows = execute_query(f'''
+                USE DATABASE 'my-database';
+                SELECT * FROM tickets
+                WHERE id > {cursor} {changed}
+                ORDER BY id
+                LIMIT {PAGE_SIZE}
+            ''')
+            if rows is None:
+                connection.rollback()
+                return None
+            if not rows:
+                break
+            _store(connection, rows)
+            fetched += len(rows)
+            cursor = int(rows[-1]['id'])
+            last_id = max(last_id, cursor)
+            last_updated_at = max([last_updated_at] + [int(r['updated_at']) for r in rows if r.get('updated_at') is not None])
+            if len(rows) < PAGE_SIZE:
+                break
+
+        deleted = _drop_deleted(connection) if _local_columns(connection) else 0
+        connection.executemany(
+            "INSERT OR REPLACE INTO snapshot_meta (key, value) VALUES (?, ?)",
+            [('last_id', last_id), ('last_updated_at', last_updated_at), ('refreshed_at', int(time.time()))]
+        )
+        connection.commit()
+        return fetched, deleted
+    finally:
+        connection.close()
+
+class TicketSnapshot:
+    """Read-only query access to a local snapshot, shaped like the SQLiteCloud API"""
+
+    def __init__(self, path=DEFAULT_SNAPSHOT):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No ticket snapshot at {path} (run python ticket_snapshot.py first)")
+        self.path = path
+        self.connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        self.connection.row_factory = sqlite3.Row
+
+    def rows(self, query):
+        """Run a query and return its rows as dicts, or None if it fails (like execute_query)"""
+        try:
+            cursor = self.connection.execute(USE_DATABASE.sub('', query, count=1))
+            return [dict(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"❌ Snapshot query failed: {e}")
+            return None
+
+    def response(self, query):
+        """Run a query and return the API response shape ({'data': rows})"""
+        rows = self.rows(query)
+        return None if rows is None else {'data': rows}
+
+def add_snapshot_argument(parser):
+    """Add the --snapshot [PATH] option shared by the reporting scripts"""
+    parser.add_argument('--snapshot', nargs='?', const=DEFAULT_SNAPSHOT, default=None, metavar='PATH',
+                        help=f'Read tickets from the local snapshot (default {DEFAULT_SNAPSHOT}) instead of SQLiteCloud')
+
+def snapshot_executor(path, raw=False):
+    """execute_query replacement reading from the snapshot
+
+    raw=True returns the API response shape, for scripts whose execute_query
+    returns response.json(); otherwise the rows.
+    """
+    snapshot = TicketSnapshot(path)
+    return snapshot.response if raw else snapshot.rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Copy the tickets table into a local SQLite snapshot')
+    parser.add_argument('--path', default=DEFAULT_SNAPSHOT, help=f'Snapshot file (default {DEFAULT_SNAPSHOT})')
+    parser.add_argument('--full', action='store_true', help='Rebuild the snapshot from scratch')
+    args = parser.parse_args()
+
+    if not API_KEY or not API_URL:
+        print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+        exit(1)
+
+    print("📸 Ticket Snapshot")
+    print("==================")
+
+    started = time.perf_counter()
+    result = refresh_snapshot(args.path, full=args.full)
+    if result is None:
+        print("❌ Snapshot refresh failed, previous snapshot kept")
+        exit(1)
+
+    fetched, deleted = result
+    print(f"✅ {fetched} tickets fetched, {deleted} removed in {time.perf_counter() - started:.1f}s")
+    print(f"📁 Snapshot: {os.path.abspath(args.path)}")
+
+if __name__ == "__main__":
+    main()
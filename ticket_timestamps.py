@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Normalized ticket timestamps
+Tickets keep their original free-form `timestamp` TEXT for display and gain a
+`created_at` INTEGER column (epoch seconds) used for ordering and time ranges.
+Wall-clock times are stored as if they were UTC, so the integer orders exactly
+like the text it was parsed from regardless of the server's timezone.
+"""
+
+import calendar
+from datetime import datetime, timedelta
+
+# Formats found in the tickets table, most common first
+TIMESTAMP_FORMATS = [
+    '%Y-%m-%d %H:%M:%S',    # ticket_form(), Week 2 import
+    '%m/%d/%Y %H:%M',       # Week 2/3 spreadsheets, e.g. 9/30/2025 11:42
+    '%Y-%m-%d %H:%M',
+    '%m/%d/%Y %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%m/%d/%Y %I:%M %p',
+    '%Y-%m-%d',
+    '%m/%d/%Y'
+]
+
+EPOCH = datetime(1970, 1, 1)
+
+def to_epoch(dt):
+    """Convert a naive wall-clock datetime to created_at epoch seconds"""
+    return calendar.timegm(dt.timetuple())
+
+def from_epoch(epoch):
+    """Convert created_at epoch seconds back to a naive wall-clock datetime"""
+    return EPOCH + timedelta(seconds=int(epoch))
+
+def parse_timestamp(value):
+    """Parse a ticket timestamp in any known format to epoch seconds, or None"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return to_epoch(value)
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    text = str(value).strip()
+    if not text:
+        return None
+
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            return to_epoch(datetime.strptime(text, fmt))
+        except ValueError:
+            continue
+    return None
+
+def created_at_literal(value):
+    """SQL literal for the created_at of a timestamp (NULL if it cannot be parsed)"""
+    epoch = parse_timestamp(value)
+    return 'NULL' if epoch is None else str(epoch)
+
+def format_timestamp(epoch, fmt='%Y-%m-%d %H:%M:%S'):
+    """Format created_at epoch seconds for display"""
+    if epoch is None or epoch == '':
+        return ''
+    return from_epoch(epoch).strftime(fmt)
+
+def now_timestamp():
+    """Return (timestamp text, created_at epoch) for a ticket created now"""
+    now = datetime.now().replace(microsecond=0)
+    return now.strftime('%Y-%m-%d %H:%M:%S'), to_epoch(now)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Idempotent ticket imports
+Imported tickets carry an import_key, a hash of their natural identity
+(category, email and issue text, or the source name and the source's own
+ticket id when it has one) with a unique index on it. Imports write batches
+of tickets per request with INSERT ... ON CONFLICT(import_key) DO UPDATE, so
+re-running an import updates the rows it created instead of duplicating
+them, and rows whose values did not change are not written at all. Existing
+tickets are written with their own id, so re-runs do not use up
+AUTOINCREMENT values. Batches can be sent over a pool of threads; new
+tickets then get a block of ids reserved in the sequence (reserve_ids), so
+they keep the order of the source whichever batch finishes first. Install
+the column with add_import_key_column.py.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from ticket_classifier import CLASSIFICATION_COLUMNS, classify_issues
+from ticket_timestamps import parse_timestamp
+
+# Natural identity of an imported ticket
+IMPORT_KEY_COLUMNS = ('category', 'email', 'issue')
+
+# Columns written by an import (created_at and the classification are derived)
+TICKET_COLUMNS = ('timestamp', 'created_at', 'name', 'email', 'issue', 'notes', 'status', 'priority',
+                  'assigned_agent', 'category') + CLASSIFICATION_COLUMNS + ('import_key',)
+
+# Tickets per INSERT statement
+BATCH_SIZE = int(os.getenv('IMPORT_BATCH_SIZE', '50'))
+
+# Batches sent concurrently
+WORKERS = int(os.getenv('IMPORT_WORKERS', '4'))
+
+# Import keys looked up per request
+LOOKUP_BATCH = 500
+
+# Moves the AUTOINCREMENT sequence past {count} ids in one statement, so
+# tickets submitted meanwhile are numbered after the reserved block
+RESERVE_IDS_QUERY = '''
+    USE DATABASE 'my-database';
+    UPDATE sqlite_sequence SET seq = MAX(seq, (SELECT COALESCE(MAX(id), 0) FROM tickets)) + {count}
+    WHERE name = 'tickets'
+    RETURNING seq - {count} AS last_id
+'''
+
+def import_key(ticket):
+    """Hash of the ticket's natural identity (whitespace and case of the email ignored)
+
+    A blank or NULL category counts as 'General', the column default, so
+    tickets keyed before and after the default was applied match.
+
+    Tickets with an external_id (the id in the source file) are keyed on it
+    within their source (e.g. the file name), so ids that repeat across files
+    stay distinct. Those keys never equal the content key that other imports
+    and the add_import_key_column.py backfill use: a file imported once with
+    and once without source ids gets a second copy of its tickets.
+    """
+    if ticket.get('external_id') not in (None, ''):
+        external = f"external\x1f{ticket.get('source') or ''}\x1f{ticket['external_id']}"
+        return hashlib.sha1(external.encode('utf-8')).hexdigest()
+    parts = [str(ticket.get(column) or '').strip() for column in IMPORT_KEY_COLUMNS]
+    parts[0] = parts[0] or 'General'
+    parts[1] = parts[1].lower()
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+def sql_literal(value):
+    """SQL literal of a Python value"""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+def ticket_values(tickets):
+    """Complete column values for each ticket: created_at, classification and import_key added"""
+    classifications = classify_issues([ticket['issue'] for ticket in tickets])
+    rows = []
+    for ticket, classification in zip(tickets, classifications):
+        row = {column: ticket.get(column) for column in TICKET_COLUMNS}
+        if row['created_at'] is None:
+            row['created_at'] = parse_timestamp(ticket.get('timestamp'))
+        if ticket.get('_id') is not None:
+            row['id'] = ticket['_id']
+        row['notes'] = row['notes'] or ''
+        row['status'] = row['status'] or 'Open'
+        row['priority'] = row['priority'] or 'Medium'
+        row['assigned_agent'] = row['assigned_agent'] or ''
+        row['category'] = row['category'] or 'General'
+        row['incident_category'] = classification['incident_category']
+        row['kb_article'] = classification['kb_article']
+        row['response_template'] = classification['agent_response']
+        row['import_key'] = import_key(ticket)
+        rows.append(row)
+    return rows
+
+def upsert_sql(rows, keep=()):
+    """One INSERT ... ON CONFLICT DO UPDATE statement for the rows (from ticket_values)
+
+    Columns in keep are only set when the ticket is first inserted (e.g. the
+    timestamp of an import that generates them). The update only runs when
+    one of the other columns differs, so unchanged tickets cost no write.
+    Rows without an id are numbered by the database.
+    """
+    columns = (('id',) if any('id' in row for row in rows) else ()) + TICKET_COLUMNS
+    updated = [column for column in TICKET_COLUMNS if column != 'import_key' and column not in keep]
+    values = ',\n'.join('(' + ', '.join(sql_literal(row.get(column)) for column in columns) + ')' for row in rows)
+    return f'''
+        INSERT INTO tickets ({', '.join(columns)})
+        VALUES {values}
+        ON CONFLICT(import_key) DO UPDATE SET
+            {', '.join(f'{column} = excluded.{column}' for column in updated)}
+        WHERE {' OR '.join(f'tickets.{column} IS NOT excluded.{column}' for column in updated)}
+    '''
+
+def _rows(result):
+    """Rows of a query result, or None if the query failed"""
+    rows = result.get('data') if isinstance(result, dict) else result
+    return rows if isinstance(rows, list) else None
+
+def _changes(result):
+    """Rows written according to the trailing SELECT changes(), or None if not reported"""
+    rows = _rows(result)
+    if rows and isinstance(rows[0], dict) and 'changes' in rows[0]:
+        return int(rows[0]['changes'])
+    return None
+
+def _map(function, items, workers):
+    """[function(item) for item in items], over a thread pool when workers > 1"""
+    if workers > 1 and len(items) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(function, items))
+    return [function(item) for item in items]
+
+def existing_ids(execute, keys, workers=1):
+    """{import_key: id} for the keys already in the tickets table, or None if a lookup failed"""
+    keys = list(keys)
+
+    def lookup(start):
+        batch = ', '.join(sql_literal(key) for key in keys[start:start + LOOKUP_BATCH])
+        return _rows(execute(f"USE DATABASE 'my-database'; SELECT id, import_key FROM tickets WHERE import_key IN ({batch})"))
+
+    results = _map(lookup, range(0, len(keys), LOOKUP_BATCH), workers)
+    if any(rows is None for rows in results):
+        return None
+    return {row['import_key']: row['id'] for rows in results for row in rows}
+
+def reserve_ids(execute, count):
+    """Reserve count consecutive ticket ids; returns the first, or None if they could not be reserved"""
+    rows = _rows(execute(RESERVE_IDS_QUERY.format(count=int(count))))
+    if not rows or rows[0].get('last_id') is None:
+        return None
+    return int(rows[0]['last_id']) + 1
+
+def upsert_tickets(execute, tickets, keep=(), batch_size=BATCH_SIZE, workers=1):
+    """Upsert tickets in batches of batch_size, one request per batch
+
+    execute is the script's execute_query. Tickets that already exist are
+    matched to their id first. With workers > 1 the new tickets get reserved
+    ids and that many batches are in flight at once; if ids cannot be
+    reserved the batches are sent one after the other, so new tickets are
+    still numbered in order. An 'id' in the tickets (e.g. the source's own
+    numbering) is never written; the database id of each ticket is set on
+    it as '_id' where known.
+
+    Returns (written, failed) where written is the number of inserted or
+    changed tickets (None if the server does not report it) and failed
+    lists the (first, last) ticket positions of batches that failed, for a
+    retry.
+    """
+    keys = [import_key(ticket) for ticket in tickets]
+    for ticket in tickets:
+        ticket.pop('_id', None)
+    ids = existing_ids(execute, set(keys), workers)
+    if ids is not None:
+        new_keys = [key for key in dict.fromkeys(keys) if key not in ids]
+        first = reserve_ids(execute, len(new_keys)) if workers > 1 and new_keys else None
+        if first is not None:
+            ids.update((key, first + position) for position, key in enumerate(new_keys))
+        for ticket, key in zip(tickets, keys):
+            if key in ids:
+                ticket['_id'] = ids[key]
+
+    def send(start):
+        batch = tickets[start:start + batch_size]
+        return execute(f"USE DATABASE 'my-database'; {upsert_sql(ticket_values(batch), keep)}; SELECT changes() AS changes")
+
+    starts = range(0, len(tickets), batch_size)
+    numbered = all(ticket.get('_id') is not None for ticket in tickets)
+    results = _map(send, starts, workers if numbered else 1)
+
+    written, failed = 0, []
+    for start, result in zip(starts, results):
+        if not result:
+            failed.append((start, min(start + batch_size, len(tickets)) - 1))
+            continue
+        changes = _changes(result)
+        written = None if written is None or changes is None else written + changes
+    return written, failed
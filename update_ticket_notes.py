@@ -6,6 +6,7 @@ Update ticket notes with detailed, accurate resolution steps
 import requests
 import os
 from dotenv import load_dotenv
+from ticket_classifier import get_account_resolution
 
 # Load environment variables
 load_dotenv()
@@ -37,14 +38,10 @@ def execute_query(query):
         print(f"❌ Error: {e}")
         return None
 
-def get_detailed_notes(issue, priority, assigned_agent):
-    """Generate detailed resolution notes based on issue type"""
-    
-    issue_lower = issue.lower()
-    
+# Resolution notes keyed by ticket_classifier.ACCOUNT_RESOLUTION_RULES label
+RESOLUTION_NOTES = {
     # Password reset issues
-    if 'password' in issue_lower and 'forgotten' in issue_lower:
-        return f"""RESOLUTION STEPS TAKEN:
+    'password_reset': """RESOLUTION STEPS TAKEN:
 1. Verified user identity through company app/phone system
 2. Accessed Active Directory Users and Computers (ADUC)
 3. Located user account: @lindokuhle
@@ -55,12 +52,10 @@ def get_detailed_notes(issue, priority, assigned_agent):
 8. Verified password reset successful
 9. Updated KB_Password_Reset documentation
 
-RESOLUTION: Password successfully reset. User can now log in with temporary password."""
+RESOLUTION: Password successfully reset. User can now log in with temporary password.""",
 
-    # Account lockout issues
-    elif 'lockout' in issue_lower or 'locked' in issue_lower:
-        if 'recurring' in issue_lower:
-            return f"""RESOLUTION STEPS TAKEN:
+    # Recurring account lockout
+    'recurring_lockout': """RESOLUTION STEPS TAKEN:
 1. Analyzed lockout source using LockoutStatus.exe tool
 2. Identified multiple lockout sources across domain controllers
 3. Checked for cached credentials on user's devices
@@ -73,9 +68,10 @@ RESOLUTION: Password successfully reset. User can now log in with temporary pass
 7. Monitored account for 24 hours - no further lockouts
 8. Updated KB_Password_Reset documentation
 
-RESOLUTION: Recurring lockout issue resolved. All cached credentials cleared."""
-        else:
-            return f"""RESOLUTION STEPS TAKEN:
+RESOLUTION: Recurring lockout issue resolved. All cached credentials cleared.""",
+
+    # Account lockout issues
+    'account_lockout': """RESOLUTION STEPS TAKEN:
 1. Checked Active Directory for account lockout status
 2. Verified lockout was due to failed login attempts
 3. Used ADUC to unlock user account: @lindokuhle
@@ -85,11 +81,10 @@ RESOLUTION: Recurring lockout issue resolved. All cached credentials cleared."""
 7. Advised user to use correct password
 8. Updated KB_Password_Reset documentation
 
-RESOLUTION: Account successfully unlocked. User can now log in."""
+RESOLUTION: Account successfully unlocked. User can now log in.""",
 
     # Account disabled issues
-    elif 'disabled' in issue_lower:
-        return f"""RESOLUTION STEPS TAKEN:
+    'account_disabled': """RESOLUTION STEPS TAKEN:
 1. Checked Active Directory for account status
 2. Confirmed account was disabled (likely by mistake)
 3. Verified user identity and authorization
@@ -100,11 +95,10 @@ RESOLUTION: Account successfully unlocked. User can now log in."""
 8. Documented incident for audit trail
 9. Updated KB_Account_Enable documentation
 
-RESOLUTION: Account successfully re-enabled. User access restored."""
+RESOLUTION: Account successfully re-enabled. User access restored.""",
 
     # Outlook authentication issues
-    elif 'outlook' in issue_lower or 'authentication' in issue_lower:
-        return f"""RESOLUTION STEPS TAKEN:
+    'outlook_authentication': """RESOLUTION STEPS TAKEN:
 1. Diagnosed Outlook authentication issue
 2. Identified cached credential problem
 3. Cleared Outlook credential cache:
@@ -117,11 +111,10 @@ RESOLUTION: Account successfully re-enabled. User access restored."""
 7. Verified calendar and contacts sync
 8. Updated KB_MFA_Reset documentation
 
-RESOLUTION: Outlook authentication issue resolved. Email functionality restored."""
+RESOLUTION: Outlook authentication issue resolved. Email functionality restored.""",
 
     # MFA device lost
-    elif 'mfa' in issue_lower and 'lost' in issue_lower:
-        return f"""RESOLUTION STEPS TAKEN:
+    'mfa_lost_device': """RESOLUTION STEPS TAKEN:
 1. Verified user identity through alternative methods
 2. Accessed Azure AD admin center
 3. Disabled current MFA registration for user
@@ -132,11 +125,10 @@ RESOLUTION: Outlook authentication issue resolved. Email functionality restored.
 8. Verified access to all required applications
 9. Updated KB_MFA_Reset documentation
 
-RESOLUTION: MFA successfully reconfigured on new device."""
+RESOLUTION: MFA successfully reconfigured on new device.""",
 
     # Temporary account access
-    elif 'temporary' in issue_lower and 'contractor' in issue_lower:
-        return f"""RESOLUTION STEPS TAKEN:
+    'temporary_account': """RESOLUTION STEPS TAKEN:
 1. Verified contractor authorization and requirements
 2. Created temporary AD account with limited permissions
 3. Assigned to appropriate security groups:
@@ -149,11 +141,10 @@ RESOLUTION: MFA successfully reconfigured on new device."""
 8. Set up automated account disablement
 9. Updated KB_Temp_Account documentation
 
-RESOLUTION: Temporary contractor account created with appropriate permissions."""
+RESOLUTION: Temporary contractor account created with appropriate permissions.""",
 
     # Suspicious login attempts
-    elif 'suspicious' in issue_lower or 'unknown' in issue_lower:
-        return f"""RESOLUTION STEPS TAKEN:
+    'suspicious_activity': """RESOLUTION STEPS TAKEN:
 1. Analyzed failed login attempt logs
 2. Identified source IP addresses and locations
 3. Verified legitimate user access patterns
@@ -167,11 +158,10 @@ RESOLUTION: Temporary contractor account created with appropriate permissions.""
 8. Updated security documentation
 9. Updated KB_Security_Check documentation
 
-RESOLUTION: Security measures implemented. Account secured against unauthorized access."""
+RESOLUTION: Security measures implemented. Account secured against unauthorized access.""",
 
     # Password expired
-    elif 'expired' in issue_lower:
-        return f"""RESOLUTION STEPS TAKEN:
+    'password_expired': """RESOLUTION STEPS TAKEN:
 1. Verified password expiration in Active Directory
 2. Confirmed user cannot change password remotely
 3. Reset password using administrative privileges
@@ -182,11 +172,10 @@ RESOLUTION: Security measures implemented. Account secured against unauthorized
 8. Updated password policy documentation
 9. Updated KB_Password_Reset documentation
 
-RESOLUTION: Password successfully reset. User can now access systems."""
+RESOLUTION: Password successfully reset. User can now access systems.""",
 
     # Default resolution for other issues
-    else:
-        return f"""RESOLUTION STEPS TAKEN:
+    'general': """RESOLUTION STEPS TAKEN:
 1. Analyzed reported issue and gathered details
 2. Performed diagnostic checks on affected systems
 3. Identified root cause of the problem
@@ -198,6 +187,11 @@ RESOLUTION: Password successfully reset. User can now access systems."""
 9. Notified user of successful resolution
 
 RESOLUTION: Issue successfully resolved. All systems functioning normally."""
+}
+
+def get_detailed_notes(issue, priority, assigned_agent):
+    """Generate detailed resolution notes based on issue type"""
+    return RESOLUTION_NOTES[get_account_resolution(issue)]
 
 def main():
     print("📝 IT Helpdesk Ticket Notes Update Tool")
@@ -6,6 +6,7 @@ Update timestamps for Week 2 tickets to match the image format and dates
 import requests
 import os
 from dotenv import load_dotenv
+from ticket_timestamps import created_at_literal
 
 # Load environment variables
 load_dotenv()
@@ -78,7 +79,7 @@ def main():
         update_query = f'''
             USE DATABASE 'my-database';
             UPDATE tickets 
-            SET timestamp = '{timestamp_escaped}'
+            SET timestamp = '{timestamp_escaped}', created_at = {created_at_literal(new_timestamp)}
             WHERE id = {ticket_id}
         '''
         
@@ -116,7 +117,7 @@ def main():
         FROM tickets 
         WHERE category = 'Week 2: Software & Hardware Support'
         AND id BETWEEN 32 AND 43
-        ORDER BY timestamp
+        ORDER BY created_at, id
     '''
     
     result = execute_query(chronological_query)
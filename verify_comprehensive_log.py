@@ -1,125 +1,308 @@
 #!/usr/bin/env python3
 """
 Verify the comprehensive log contents
+Each sheet is streamed once with openpyxl's read-only mode and the breakdowns
+are counted in the same pass. With --check-db (or --snapshot) the Comprehensive
+Log sheet is validated against the tickets table: for each status, priority,
+agent and category value both sides count the tickets and sum their ids. The
+database computes these with GROUP BY, so only the aggregates are fetched, and
+the differing values are listed when the checksums differ.
 """
 
-import pandas as pd
+import argparse
 import os
+import zlib
+from collections import Counter
 from datetime import datetime
 
-def verify_comprehensive_log():
-    """Verify the comprehensive log file contents"""
-    
+import requests
+from dotenv import load_dotenv
+from openpyxl import load_workbook
+from add_ticket_counters import counter_value
+from ticket_snapshot import add_snapshot_argument, snapshot_executor
+
+# Load environment variables
+load_dotenv()
+
+# SQLiteCloud configuration
+API_KEY = os.getenv('SQLITECLOUD_API_KEY')
+API_URL = os.getenv('SQLITECLOUD_URL')
+
+headers = {
+    'Authorization': f'Bearer {API_KEY}',
+    'Content-Type': 'application/json'
+}
+
+# Comprehensive Log columns checked against the tickets table:
+# (sheet column, tickets column, default for blank values)
+CHECKED_COLUMNS = [
+    ('TicketID', 'id', ''),
+    ('Status', 'status', 'Open'),
+    ('Priority', 'priority', 'Medium'),
+    ('AssignedAgent', 'assigned_agent', 'Unassigned'),
+    ('Category', 'category', 'General')
+]
+
+# Breakdowns printed for the Comprehensive Log sheet
+BREAKDOWNS = [
+    ('Category', '📁 Category breakdown'),
+    ('Status', '📊 Status breakdown'),
+    ('Priority', '🎯 Priority breakdown'),
+    ('AssignedAgent', '👤 Agent breakdown')
+]
+
+# Ticket count and id sum per value of each checked column (blanks normalized like normalize())
+CHECKSUM_QUERY = "USE DATABASE 'my-database'; " + ' UNION ALL '.join(
+    f"SELECT '{sheet_column}' AS dimension, {counter_value('tickets', column, default)} AS value, "
+    f"COUNT(*) AS count, SUM(id) AS id_sum FROM tickets GROUP BY 2"
+    for sheet_column, column, default in CHECKED_COLUMNS[1:]
+)
+
+def execute_query(query):
+    """Execute a SQL query on SQLiteCloud"""
+    try:
+        payload = {"sql": query}
+        response = requests.post(API_URL, json=payload, headers=headers, timeout=60)
+
+        if response.status_code == 200:
+            result = response.json()
+            if 'data' in result:
+                return result['data']
+            return result
+        else:
+            print(f"❌ Query failed: {response.text}")
+            return None
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return None
+
+def normalize(value, default):
+    """Cell/column value as compared on both sides (blanks become the default)"""
+    if value is None:
+        return default
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value).strip()
+    return text or default
+
+class TicketChecksum:
+    """Order-independent checksum of ticket rows: per checked value, the ticket count and id sum"""
+
+    def __init__(self):
+        self.rows = 0
+        self.counts = {column: Counter() for column, _, _ in CHECKED_COLUMNS[1:]}
+        self.id_sums = {column: Counter() for column, _, _ in CHECKED_COLUMNS[1:]}
+
+    def add(self, values):
+        """Add one row given as [id, status, priority, agent, category] (already normalized)"""
+        self.rows += 1
+        ticket_id = int(values[0]) if values[0].isdigit() else 0
+        for (column, _, _), value in zip(CHECKED_COLUMNS[1:], values[1:]):
+            self.counts[column][value] += 1
+            self.id_sums[column][value] += ticket_id
+
+    def add_group(self, column, value, count, id_sum):
+        """Add the aggregate of count tickets sharing one value of a column"""
+        if column == CHECKED_COLUMNS[1][0]:
+            self.rows += count
+        self.counts[column][value] += count
+        self.id_sums[column][value] += id_sum
+
+    def digest(self):
+        groups = sorted((column, str(value), self.counts[column][value], self.id_sums[column][value])
+                        for column in self.counts for value in self.counts[column])
+        return f"{self.rows}:{zlib.crc32(repr(groups).encode('utf-8')):08x}"
+
+def read_sheet(worksheet, checksum=None, sample_rows=5):
+    """Stream one sheet: returns (header, row count, sample rows, value counts by column)
+
+    sample_rows=None keeps every row (for the small per-agent/per-category sheets).
+    """
+    rows = worksheet.iter_rows(values_only=True)
+    header = [str(name) if name is not None else '' for name in next(rows, ())]
+    counts = {column: Counter() for column, _ in BREAKDOWNS if column in header}
+    positions = {column: header.index(column) for column in counts}
+    checked = [(header.index(column), default) for column, _, default in CHECKED_COLUMNS] \
+        if checksum is not None and all(column in header for column, _, _ in CHECKED_COLUMNS) else None
+
+    total = 0
+    sample = []
+    for row in rows:
+        if not any(value is not None for value in row):
+            continue
+        total += 1
+        if sample_rows is None or len(sample) < sample_rows:
+            sample.append(dict(zip(header, row)))
+        for column, position in positions.items():
+            if row[position] is not None:
+                counts[column][row[position]] += 1
+        if checked:
+            checksum.add([normalize(row[position], default) for position, default in checked])
+    return header, total, sample, counts
+
+def database_checksum(execute):
+    """Checksum of the tickets table over the checked columns, or None if the query fails"""
+    rows = execute(CHECKSUM_QUERY)
+    if not isinstance(rows, list):
+        return None
+    checksum = TicketChecksum()
+    for row in rows:
+        checksum.add_group(row['dimension'], row['value'], int(row['count']), int(row['id_sum'] or 0))
+    return checksum
+
+def compare_checksums(workbook_checksum, db_checksum):
+    """Print the checksum comparison; returns True if the workbook matches the database"""
+    print("🔐 Database Check:")
+    print("-" * 40)
+    print(f"   📄 Workbook: {workbook_checksum.digest()}")
+    print(f"   🗄️ Database: {db_checksum.digest()}")
+    if workbook_checksum.digest() == db_checksum.digest():
+        print(f"   ✅ All {db_checksum.rows} tickets match the database")
+        return True
+
+    print(f"   ❌ Workbook differs from the database ({workbook_checksum.rows} vs {db_checksum.rows} tickets)")
+    for column, _, _ in CHECKED_COLUMNS[1:]:
+        ours, theirs = workbook_checksum.counts[column], db_checksum.counts[column]
+        for value in sorted(set(ours) | set(theirs)):
+            if ours[value] != theirs[value]:
+                print(f"      - {column} = {value}: {ours[value]} in workbook, {theirs[value]} in database")
+            elif workbook_checksum.id_sums[column][value] != db_checksum.id_sums[column][value]:
+                print(f"      - {column} = {value}: {ours[value]} tickets on both sides, but not the same tickets")
+    return False
+
+def print_sheet(sheet_name, header, total, sample, counts):
+    """Print the analysis of one sheet"""
+    print(f"📊 {sheet_name} Sheet Analysis:")
+    print("-" * 40)
+
+    if sheet_name == 'Comprehensive Log':
+        print(f"   📈 Total rows: {total}")
+        print(f"   📋 Columns: {header}")
+        for column, title in BREAKDOWNS:
+            if column in counts:
+                print(f"   {title}:")
+                for value, count in counts[column].most_common():
+                    print(f"      - {value}: {count} tickets")
+        print(f"   🎫 Sample tickets:")
+        for row in sample[:3]:
+            print(f"      - Ticket #{row.get('TicketID', 'N/A')}: {row.get('ReporterName', 'N/A')} - {str(row.get('BriefSummary', 'N/A'))[:50]}...")
+
+    elif sheet_name == 'Summary':
+        print(f"   📈 Total metrics: {total}")
+        print(f"   📋 Sample metrics:")
+        for row in sample[:5]:
+            print(f"      - {row.get('Metric', 'N/A')}: {row.get('Count', 'N/A')}")
+
+    elif sheet_name == 'Agent Workload':
+        print(f"   📈 Total agents: {total}")
+        print(f"   👤 Agent workload:")
+        for row in sample:
+            print(f"      - {row.get(header[0], 'Unknown')}: {row.get('Total_Tickets', 'N/A')} total tickets")
+
+    elif sheet_name == 'Conversation Log':
+        print(f"   📈 Total conversations: {total}")
+        print(f"   💬 Sample conversation:")
+        if sample:
+            print(f"      - Ticket #{sample[0].get('Ticket ID', 'N/A')}: {str(sample[0].get('User Issue', 'N/A'))[:60]}...")
+
+    elif sheet_name == 'Category Breakdown':
+        print(f"   📈 Total categories: {total}")
+        print(f"   📁 Category breakdown:")
+        for row in sample:
+            print(f"      - {row.get(header[0], 'Unknown')}: {row.get('Total_Tickets', 'N/A')} tickets")
+
+    else:
+        print(f"   📈 Total rows: {total}")
+
+    print()
+
+def verify_comprehensive_log(filename=None, execute=None):
+    """Verify the comprehensive log file contents
+
+    execute is a query function (SQLiteCloud or snapshot) to validate the log
+    against the tickets table; without it only the workbook is read.
+    Returns False if the file is missing or differs from the database.
+    """
+
     # Get the most recent log file
-    current_date = datetime.now().strftime("%Y%m%d")
-    filename = f"IT_Helpdesk_Comprehensive_Log_{current_date}.xlsx"
-    
+    if filename is None:
+        current_date = datetime.now().strftime("%Y%m%d")
+        filename = f"IT_Helpdesk_Comprehensive_Log_{current_date}.xlsx"
+
     if not os.path.exists(filename):
         print(f"❌ File not found: {filename}")
-        return
-    
+        return False
+
     print("📊 IT Helpdesk Comprehensive Log Verification")
     print("=============================================")
     print(f"📄 File: {filename}")
     print()
-    
+
     try:
-        # Read the Excel file
-        excel_file = pd.ExcelFile(filename)
-        
+        # Read-only mode streams rows from the zip instead of loading every sheet
+        workbook = load_workbook(filename, read_only=True)
+        checksum = TicketChecksum() if execute else None
+
         print(f"📋 Sheets in the file:")
-        for sheet_name in excel_file.sheet_names:
+        for sheet_name in workbook.sheetnames:
             print(f"   • {sheet_name}")
         print()
-        
-        # Read and analyze each sheet
-        for sheet_name in excel_file.sheet_names:
-            print(f"📊 {sheet_name} Sheet Analysis:")
-            print("-" * 40)
-            
-            df = pd.read_excel(filename, sheet_name=sheet_name)
-            
-            if sheet_name == 'Comprehensive Log':
-                print(f"   📈 Total rows: {len(df)}")
-                print(f"   📋 Columns: {list(df.columns)}")
-                
-                # Show category breakdown
-                if 'Category' in df.columns:
-                    category_counts = df['Category'].value_counts()
-                    print(f"   📁 Category breakdown:")
-                    for category, count in category_counts.items():
-                        print(f"      - {category}: {count} tickets")
-                
-                # Show status breakdown
-                if 'Status' in df.columns:
-                    status_counts = df['Status'].value_counts()
-                    print(f"   📊 Status breakdown:")
-                    for status, count in status_counts.items():
-                        print(f"      - {status}: {count} tickets")
-                
-                # Show priority breakdown
-                if 'Priority' in df.columns:
-                    priority_counts = df['Priority'].value_counts()
-                    print(f"   🎯 Priority breakdown:")
-                    for priority, count in priority_counts.items():
-                        print(f"      - {priority}: {count} tickets")
-                
-                # Show agent breakdown
-                if 'AssignedAgent' in df.columns:
-                    agent_counts = df['AssignedAgent'].value_counts()
-                    print(f"   👤 Agent breakdown:")
-                    for agent, count in agent_counts.items():
-                        print(f"      - {agent}: {count} tickets")
-                
-                # Show sample tickets
-                print(f"   🎫 Sample tickets:")
-                for i, row in df.head(3).iterrows():
-                    print(f"      - Ticket #{row.get('TicketID', 'N/A')}: {row.get('ReporterName', 'N/A')} - {str(row.get('BriefSummary', 'N/A'))[:50]}...")
-            
-            elif sheet_name == 'Summary':
-                print(f"   📈 Total metrics: {len(df)}")
-                print(f"   📋 Sample metrics:")
-                for i, row in df.head(5).iterrows():
-                    print(f"      - {row.get('Metric', 'N/A')}: {row.get('Count', 'N/A')}")
-            
-            elif sheet_name == 'Agent Workload':
-                print(f"   📈 Total agents: {len(df)}")
-                print(f"   👤 Agent workload:")
-                for i, row in df.iterrows():
-                    agent_name = row.index[0] if len(row.index) > 0 else 'Unknown'
-                    print(f"      - {agent_name}: {row.iloc[0] if len(row) > 0 else 'N/A'} total tickets")
-            
-            elif sheet_name == 'Conversation Log':
-                print(f"   📈 Total conversations: {len(df)}")
-                print(f"   💬 Sample conversation:")
-                if len(df) > 0:
-                    sample = df.iloc[0]
-                    print(f"      - Ticket #{sample.get('Ticket ID', 'N/A')}: {str(sample.get('User Issue', 'N/A'))[:60]}...")
-            
-            elif sheet_name == 'Category Breakdown':
-                print(f"   📈 Total categories: {len(df)}")
-                print(f"   📁 Category breakdown:")
-                for i, row in df.iterrows():
-                    category_name = row.index[0] if len(row.index) > 0 else 'Unknown'
-                    print(f"      - {category_name}: {row.iloc[0] if len(row) > 0 else 'N/A'} tickets")
-            
-            print()
-        
-        # File size information
-        file_size = os.path.getsize(filename)
-        file_size_mb = file_size / (1024 * 1024)
-        print(f"📁 File Information:")
-        print(f"   📏 File size: {file_size_mb:.2f} MB")
-        print(f"   📅 Created: {datetime.fromtimestamp(os.path.getctime(filename)).strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        print()
-        print("✅ Comprehensive log verification completed!")
-        print("   📊 All sheets contain expected data")
-        print("   📋 Formatting and structure verified")
-        print("   🎯 Ready for presentation and analysis")
-        
+
+        for sheet_name in workbook.sheetnames:
+            checked = checksum if sheet_name == 'Comprehensive Log' else None
+            sample_rows = None if sheet_name in ('Agent Workload', 'Category Breakdown') else 5
+            result = read_sheet(workbook[sheet_name], checked, sample_rows)
+            print_sheet(sheet_name, *result)
+        workbook.close()
+
     except Exception as e:
         print(f"❌ Error reading file: {e}")
+        return False
+
+    # File size information
+    file_size = os.path.getsize(filename)
+    file_size_mb = file_size / (1024 * 1024)
+    print(f"📁 File Information:")
+    print(f"   📏 File size: {file_size_mb:.2f} MB")
+    print(f"   📅 Created: {datetime.fromtimestamp(os.path.getctime(filename)).strftime('%Y-%m-%d %H:%M:%S')}")
+    print()
+
+    if execute:
+        db_checksum = database_checksum(execute)
+        if db_checksum is None:
+            print("❌ Could not read tickets from the database")
+            return False
+        if not compare_checksums(checksum, db_checksum):
+            return False
+        print()
+
+    print("✅ Comprehensive log verification completed!")
+    print("   📊 All sheets contain expected data")
+    print("   📋 Formatting and structure verified")
+    print("   🎯 Ready for presentation and analysis")
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description='Verify the comprehensive Excel log')
+    parser.add_argument('filename', nargs='?', default=None,
+                        help="Workbook to verify (default: today's IT_Helpdesk_Comprehensive_Log_YYYYMMDD.xlsx)")
+    parser.add_argument('--check-db', action='store_true',
+                        help='Validate the Comprehensive Log sheet against the tickets table in SQLiteCloud')
+    add_snapshot_argument(parser)
+    args = parser.parse_args()
+
+    execute = None
+    if args.snapshot:
+        # Validate against the local snapshot instead of SQLiteCloud
+        execute = snapshot_executor(args.snapshot)
+    elif args.check_db:
+        if not API_KEY or not API_URL:
+            print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+            exit(1)
+        execute = execute_query
+
+    if not verify_comprehensive_log(args.filename, execute):
+        exit(1)
 
 if __name__ == "__main__":
-    verify_comprehensive_log()
+    main()
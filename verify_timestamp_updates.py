@@ -3,9 +3,11 @@
 Verify that timestamp updates match the image requirements
 """
 
+import argparse
 import requests
 import os
 from dotenv import load_dotenv
+from ticket_snapshot import add_snapshot_argument, snapshot_executor
 
 # Load environment variables
 load_dotenv()
@@ -14,10 +16,6 @@ load_dotenv()
 API_KEY = os.getenv('SQLITECLOUD_API_KEY')
 API_URL = os.getenv('SQLITECLOUD_URL')
 
-if not API_KEY or not API_URL:
-    print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
-    exit(1)
-
 headers = {
     'Authorization': f'Bearer {API_KEY}',
     'Content-Type': 'application/json'
@@ -41,6 +39,19 @@ def execute_query(query, params=None):
 
 def main():
     """Verify timestamp updates match the image"""
+    global execute_query
+    parser = argparse.ArgumentParser(description='Verify Week 2 timestamp updates')
+    add_snapshot_argument(parser)
+    args = parser.parse_args()
+    
+    if not args.snapshot and (not API_KEY or not API_URL):
+        print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+        exit(1)
+    
+    # Read from the local snapshot instead of SQLiteCloud
+    if args.snapshot:
+        execute_query = snapshot_executor(args.snapshot, raw=True)
+    
     print("🕒 Verifying Timestamp Updates for Week 2 Tickets")
     print("================================================")
     
@@ -115,7 +126,7 @@ def main():
         print("   - Please check the timestamps and update as needed")
     
     # Show chronological order
-    print("\n🕒 Chronological Order (by timestamp):")
+    print("\n🕒 Chronological Order (by created_at):")
     print("-" * 45)
     
     chronological_query = '''
@@ -124,7 +135,7 @@ def main():
         FROM tickets 
         WHERE category = 'Week 2: Software & Hardware Support'
         AND id BETWEEN 32 AND 43
-        ORDER BY timestamp
+        ORDER BY created_at, id
     '''
     
     result = execute_query(chronological_query)
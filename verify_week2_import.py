@@ -3,9 +3,11 @@
 Verify the Week 2 tickets import with detailed information
 """
 
+import argparse
 import requests
 import os
 from dotenv import load_dotenv
+from ticket_snapshot import add_snapshot_argument, snapshot_executor
 
 # Load environment variables
 load_dotenv()
@@ -14,10 +16,6 @@ load_dotenv()
 API_KEY = os.getenv('SQLITECLOUD_API_KEY')
 API_URL = os.getenv('SQLITECLOUD_URL')
 
-if not API_KEY or not API_URL:
-    print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
-    exit(1)
-
 headers = {
     'Authorization': f'Bearer {API_KEY}',
     'Content-Type': 'application/json'
@@ -41,6 +39,19 @@ def execute_query(query, params=None):
 
 def main():
     """Verify Week 2 tickets import"""
+    global execute_query
+    parser = argparse.ArgumentParser(description='Verify the Week 2 tickets import')
+    add_snapshot_argument(parser)
+    args = parser.parse_args()
+    
+    if not args.snapshot and (not API_KEY or not API_URL):
+        print("❌ Error: SQLITECLOUD_API_KEY and SQLITECLOUD_URL must be set in environment variables")
+        exit(1)
+    
+    # Read from the local snapshot instead of SQLiteCloud
+    if args.snapshot:
+        execute_query = snapshot_executor(args.snapshot, raw=True)
+    
     print("📁 Verifying Week 2: Software & Hardware Support Tickets Import")
     print("==============================================================")
     